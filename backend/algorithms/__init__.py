@@ -1,6 +1,9 @@
 from typing import Dict, Any, List
 from .base_algorithm import BaseAlgorithm
+from .control import TrainingControl
 from .q_learning import QLearning
+from .batched_q_learning import BatchedQLearning
+from .dynamic_programming import ValueIteration, PolicyIteration
 
 
 class AlgorithmFactory:
@@ -15,6 +18,9 @@ class AlgorithmFactory:
     # Future: Add more algorithms (SARSA, DQN, PPO, etc.)
     ALGORITHMS = {
         'Q-Learning': QLearning,
+        'Batched Q-Learning': BatchedQLearning,
+        'Value Iteration': ValueIteration,
+        'Policy Iteration': PolicyIteration,
     }
 
     @staticmethod
@@ -78,4 +84,4 @@ class AlgorithmFactory:
 
 
 # Export for easier imports
-__all__ = ['AlgorithmFactory', 'BaseAlgorithm', 'QLearning']
+__all__ = ['AlgorithmFactory', 'BaseAlgorithm', 'TrainingControl', 'QLearning', 'BatchedQLearning', 'ValueIteration', 'PolicyIteration']
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Callable, Optional
+import numpy as np
+from typing import Dict, Any, Callable, Iterator, Optional
+from environments.environment_manager import EnvironmentManager
+from .control import TrainingControl
+from .random_stream import RandomStream
 
 
 class BaseAlgorithm(ABC):
@@ -10,6 +14,12 @@ class BaseAlgorithm(ABC):
     must implement to work with the RL Playground system.
     """
 
+    # Names of the array attributes that hold the learned state (saved in checkpoints)
+    CHECKPOINT_ARRAYS = ()
+
+    # Whether train() hands its transitions to a recorder (see self.recorder)
+    RECORDS_TRAJECTORIES = False
+
     def __init__(self, env, parameters: Dict[str, Any]):
         """
         Initialize the algorithm.
@@ -21,19 +31,109 @@ class BaseAlgorithm(ABC):
         self.env = env
         self.parameters = parameters
 
+        # Number of steps in the most recent training episode (set by train())
+        self.last_episode_length: Optional[float] = None
+
+        # Largest absolute Q-value update and number of states whose greedy
+        # (first-maximum) action changed in the most recent training episode
+        # (set by train() of algorithms that track convergence)
+        self.last_max_q_change: Optional[float] = None
+        self.last_policy_changes: Optional[int] = None
+
+        # Session label for hot-path metrics (set by the training coordinator)
+        self.metrics_session: Optional[str] = None
+
+        # Receives every training transition via record_episode() when set by
+        # the training coordinator (see training.trajectories.TrajectoryRecorder;
+        # only algorithms that step an environment record)
+        self.recorder = None
+
+        # Session-owned randomness (exploration, tie-breaks), reproducible per environment seed
+        self.random = RandomStream.from_env(env)
+
     @abstractmethod
-    def train(self, num_episodes: int, callback: Optional[Callable] = None) -> None:
+    def train(
+        self,
+        num_episodes: int,
+        callback: Optional[Callable] = None,
+        lazy: bool = False,
+        control: Optional[TrainingControl] = None
+    ) -> None:
         """
         Train the agent for a specified number of episodes.
 
+        Nothing is rendered when no callback is given. With a control, the
+        run checks control.should_stop() before every episode, so it can be
+        paused there and cancelled early.
+
         Args:
             num_episodes: Number of episodes to train
             callback: Optional callback function called after each episode.
                      Signature: callback(episode, reward, learning_data, frame)
+            lazy: If True, the callback receives None for learning_data and
+                  frame; consumers call get_learning_data() and render_frame()
+                  only for the episodes they actually use
+            control: Optional pause/cancellation token checked between episodes
         """
         pass
 
+    def render_frame(self) -> np.ndarray:
+        """
+        Render the environment as left by the most recent episode or step.
+
+        Returns:
+            RGB numpy array
+        """
+        return EnvironmentManager.render(self.env)
+
     @abstractmethod
+    def greedy_action(self, state: int) -> int:
+        """
+        Return the learned policy's action in a state.
+
+        Args:
+            state: State index
+
+        Returns:
+            Action index
+        """
+        pass
+
+    def iter_policy(self, render: bool = True, max_steps: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the learned policy for one episode, one step at a time.
+
+        The generator pauses after every step with the environment in the
+        state it reports, so consumers can render or encode the frame (or
+        stream it) before the next step is taken.
+
+        Args:
+            render: Render a frame after every step
+            max_steps: Step limit of the episode (prevents infinite loops);
+                       defaults to the environment's episode step limit
+
+        Yields:
+            Dict with step, state, action, reward, terminated, truncated and
+            frame (RGB array, None when render is False)
+        """
+        if max_steps is None:
+            max_steps = EnvironmentManager.max_episode_steps(self.env)
+        state, _ = self.env.reset()
+        for step in range(max_steps):
+            action = self.greedy_action(state)
+            state, reward, terminated, truncated, _ = self.env.step(action)
+            yield {
+                'step': step,
+                'state': int(state),
+                'action': int(action),
+                'reward': float(reward),
+                'terminated': terminated,
+                'truncated': truncated,
+                'frame': self.render_frame() if render else None
+            }
+            if terminated or truncated:
+                break
+
     def play_policy(self, callback: Optional[Callable] = None) -> list:
         """
         Execute the learned policy and return all frames.
@@ -43,9 +143,14 @@ class BaseAlgorithm(ABC):
                      Signature: callback(frame)
 
         Returns:
-            List of frames (base64 encoded strings) from the episode
+            List of frames from the episode
         """
-        pass
+        frames = []
+        for step in self.iter_policy():
+            frames.append(step['frame'])
+            if callback:
+                callback(step['frame'])
+        return frames
 
     @abstractmethod
     def get_learning_data(self) -> Dict[str, Any]:
@@ -60,6 +165,52 @@ class BaseAlgorithm(ABC):
         """
         pass
 
+    def get_learning_delta(self) -> Optional[Dict[str, Any]]:
+        """
+        Return learning data entries that changed since the previous call.
+
+        Used by the training stream to send sparse updates between full
+        snapshots. Calling it resets the change tracking.
+
+        For Q-Learning: returns {'q_updates': [[state, action, value], ...]}
+
+        Returns:
+            Dictionary of changes, or None if the algorithm does not track
+            changes (consumers then fall back to get_learning_data())
+        """
+        return None
+
+    def get_checkpoint(self) -> Dict[str, np.ndarray]:
+        """
+        Return the arrays needed to restore the learned state.
+
+        Returns:
+            Dictionary mapping CHECKPOINT_ARRAYS names to arrays
+        """
+        return {name: getattr(self, name) for name in self.CHECKPOINT_ARRAYS}
+
+    def load_checkpoint(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Restore the learned state from get_checkpoint() arrays.
+
+        Arrays may be memory-mapped; they are used as-is, without copying.
+
+        Args:
+            arrays: Dictionary mapping CHECKPOINT_ARRAYS names to arrays
+
+        Raises:
+            ValueError: If an array is missing or its shape doesn't match
+        """
+        for name in self.CHECKPOINT_ARRAYS:
+            if name not in arrays:
+                raise ValueError(f"Checkpoint is missing array '{name}'")
+            current = getattr(self, name)
+            if arrays[name].shape != current.shape:
+                raise ValueError(
+                    f"Checkpoint array '{name}' has shape {arrays[name].shape}, expected {current.shape}"
+                )
+            setattr(self, name, arrays[name])
+
     @staticmethod
     @abstractmethod
     def get_parameter_schema(environment: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
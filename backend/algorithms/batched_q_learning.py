@@ -0,0 +1,335 @@
+import numpy as np
+from typing import Dict, Any, Callable, Optional
+from environments.environment_manager import EnvironmentManager
+from .base_algorithm import BaseAlgorithm
+from .control import TrainingControl
+from .q_learning import QLearning
+
+
+class BatchedQLearning(BaseAlgorithm):
+    """
+    Vectorized tabular Q-Learning that trains N independent agents at once.
+
+    All agents share the same compiled environment model (see
+    EnvironmentManager.compile_environment) but own their slice of an
+    (N, S, A) Q-tensor. Action selection, transitions and TD updates are done
+    for all agents in a single NumPy operation per step, instead of one
+    Python-level env.step() per agent.
+
+    learning_rate, discount_factor and exploration_rate accept either a scalar
+    (shared by all agents) or a list of length num_agents (one value per agent),
+    so the same run can compare seeds or hyperparameter variants.
+    """
+
+    CHECKPOINT_ARRAYS = ('q_table',)
+
+    # Steps whose exploration, action and tie-break draws are made in one call
+    RANDOM_BLOCK_STEPS = 32
+
+    def __init__(self, env, parameters: Dict[str, Any]):
+        """
+        Initialize batched Q-Learning.
+
+        Args:
+            env: Discrete Gymnasium environment exposing its model via env.unwrapped.P
+            parameters: Dict with num_agents, learning_rate, discount_factor,
+                        exploration_rate and the Q-initialization parameters
+        """
+        super().__init__(env, parameters)
+
+        self.num_agents = int(parameters.get('num_agents', 16))
+        if self.num_agents < 1:
+            raise ValueError(f"num_agents must be at least 1, got {self.num_agents}")
+
+        # Per-agent hyperparameters, shape (N,)
+        self.learning_rate = self._per_agent(parameters.get('learning_rate', 0.1), 'learning_rate')
+        self.discount_factor = self._per_agent(parameters.get('discount_factor', 0.95), 'discount_factor')
+        self.exploration_rate = self._per_agent(parameters.get('exploration_rate', 0.1), 'exploration_rate')
+
+        # Share the environment's seeded generator so the session seed controls the run
+        self.rng = env.unwrapped.np_random
+
+        # Dense environment model, shared with other sessions on the same map
+        self.model = EnvironmentManager.compile_environment(env)
+
+        num_states = env.observation_space.n
+        num_actions = env.action_space.n
+        self.num_actions = num_actions
+
+        # Initialize Q-tensor based on strategy
+        q_init_strategy = parameters.get('q_init_strategy', 'fixed')
+        q_init_value = float(parameters.get('q_init_value', 0.0))
+        q_init_min = float(parameters.get('q_init_min', 0.0))
+        q_init_max = float(parameters.get('q_init_max', 1.0))
+        shape = (self.num_agents, num_states, num_actions)
+
+        if q_init_strategy == 'fixed':
+            self.q_table = np.full(shape, q_init_value)
+        elif q_init_strategy == 'random':
+            if q_init_min >= q_init_max:
+                raise ValueError(
+                    f"Invalid Q-value initialization: min ({q_init_min}) must be less than max ({q_init_max})"
+                )
+            self.q_table = self.rng.uniform(q_init_min, q_init_max, shape)
+        else:
+            raise ValueError(f"Unknown Q-value initialization strategy: {q_init_strategy}")
+
+        # Force terminal state Q-values to 0 (by RL theory, terminal states have value 0)
+        self.q_table[:, self.model.terminal_states, :] = 0.0
+
+        # (state, action) cells updated by any agent since the last get_learning_delta() call
+        self.dirty_cells = np.zeros((num_states, num_actions), dtype=bool)
+
+    def _per_agent(self, value, name: str) -> np.ndarray:
+        """
+        Broadcast a scalar or per-agent list parameter to shape (num_agents,).
+
+        Args:
+            value: Scalar or sequence of length num_agents
+            name: Parameter name (used in error messages)
+
+        Returns:
+            Float array of shape (num_agents,)
+
+        Raises:
+            ValueError: If a sequence has the wrong length
+        """
+        array = np.asarray(value, dtype=float)
+        if array.ndim == 0:
+            return np.full(self.num_agents, float(array))
+        if array.shape != (self.num_agents,):
+            raise ValueError(
+                f"Parameter '{name}' must be a scalar or a list of {self.num_agents} values, "
+                f"got shape {array.shape}"
+            )
+        return array
+
+    def _greedy_actions(
+        self,
+        q_values: np.ndarray,
+        scores: Optional[np.ndarray] = None,
+        first_best: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Select the greedy action for every agent, breaking ties randomly.
+
+        Args:
+            q_values: Array of shape (N, A)
+            scores: Optional uniform draws of shape (N, A) for the tie-break
+                    (drawn from self.rng if omitted)
+            first_best: Optional q_values.argmax(axis=1), if already computed
+
+        Returns:
+            Array of shape (N,) with action indices
+        """
+        if scores is None:
+            scores = self.rng.random(q_values.shape)
+        if first_best is None:
+            first_best = q_values.argmax(axis=1)
+        # Gathering the row maxima through argmax is much cheaper than max(axis=1) on short rows
+        best_values = q_values.ravel()[np.arange(0, q_values.size, q_values.shape[1]) + first_best]
+        is_max = q_values == best_values[:, None]
+        # Random scores only for tied maxima; argmax then picks uniformly among them
+        return np.argmax(scores * is_max, axis=1)
+
+    def train(
+        self,
+        num_episodes: int,
+        callback: Optional[Callable] = None,
+        lazy: bool = False,
+        control: Optional[TrainingControl] = None
+    ) -> None:
+        """
+        Train all agents for num_episodes episodes each.
+
+        Agents run their episodes independently: an agent that terminates or
+        hits the step limit starts its next episode on the following step, so
+        no step is spent waiting for the slowest agent of a round. Episode k
+        is reported once every agent has finished its k-th episode; an agent
+        that is done with all its episodes stops updating its Q-table. Only
+        agent 0's last finished episode is rendered, and only for a non-lazy
+        callback.
+
+        last_episode_length is the mean length of the reported episode,
+        last_max_q_change and last_policy_changes cover every update since
+        the previous report (greedy-action changes of every agent's own
+        Q-table).
+
+        Args:
+            num_episodes: Number of episodes per agent
+            callback: Called each time all agents finished an episode with
+                      (episode, mean_reward, learning_data, frame)
+            lazy: Pass None for learning_data and frame; see BaseAlgorithm.train
+            control: Optional pause/cancellation token checked between reported
+                     episodes (agents ahead of the others may have trained a
+                     few more episodes when the run is cancelled)
+        """
+        if num_episodes <= 0:
+            return
+        max_steps_per_episode = EnvironmentManager.max_episode_steps(self.env)  # Prevent infinite loops
+        num_agents, num_states, num_actions = self.q_table.shape
+        agents = np.arange(num_agents)
+
+        # Flat views: one integer index per Q-row / Q-cell instead of (agent, state[, action]) fancy indexing
+        q_rows = self.q_table.reshape(num_agents * num_states, num_actions)
+        q_cells = self.q_table.reshape(-1)
+        row_offsets = agents * num_states
+        row_starts = agents * num_actions
+        dirty_cells = self.dirty_cells.reshape(-1)
+
+        # Per-agent progress through its own episodes
+        states = self.model.reset_batch(self.rng, num_agents)
+        episodes_done = np.zeros(num_agents, dtype=np.int64)
+        episode_steps = np.zeros(num_agents, dtype=np.int64)
+        episode_rewards = np.zeros(num_agents)
+        active = np.ones(num_agents, dtype=bool)
+        all_active = True
+
+        # Per-episode totals over all agents, reported once every agent has finished the episode
+        reward_sums = np.zeros(num_episodes)
+        length_sums = np.zeros(num_episodes)
+        reported = 0
+        max_q_change = 0.0
+        policy_changes = 0
+        final_state, final_action = int(states[0]), 0
+
+        if control is not None and control.should_stop():
+            return
+
+        while True:
+            # Random draws for a block of steps at once
+            explore = self.rng.random((self.RANDOM_BLOCK_STEPS, num_agents)) < self.exploration_rate
+            random_actions = self.rng.integers(num_actions, size=(self.RANDOM_BLOCK_STEPS, num_agents))
+            tie_scores = self.rng.random((self.RANDOM_BLOCK_STEPS, num_agents, num_actions))
+
+            for step in range(self.RANDOM_BLOCK_STEPS):
+                # Epsilon-greedy action selection for all agents
+                row_index = row_offsets + states
+                rows = q_rows[row_index]
+                previous_best = rows.argmax(axis=1)
+                greedy_actions = self._greedy_actions(rows, tie_scores[step], previous_best)
+                actions = np.where(explore[step], random_actions[step], greedy_actions)
+
+                next_states, rewards, terminated = self.model.step_batch(states, actions, self.rng)
+
+                # Q-learning update, masked so agents done with all episodes stay untouched
+                cell_index = row_index * num_actions + actions
+                next_rows = q_rows[row_offsets + next_states]
+                best_next = next_rows.ravel()[row_starts + next_rows.argmax(axis=1)]
+                best_next[terminated] = 0.0
+                td_error = rewards + self.discount_factor * best_next - q_cells[cell_index]
+                q_changes = self.learning_rate * td_error
+                if not all_active:
+                    q_changes[~active] = 0.0
+                q_cells[cell_index] += q_changes
+                # Agents done with all episodes may mark cells they did not change; that only resends a value
+                dirty_cells[states * num_actions + actions] = True
+
+                # Convergence tracking: only the updated cell of each row changed
+                rows.ravel()[row_starts + actions] = q_cells[cell_index]
+                policy_changes += int(np.count_nonzero(rows.argmax(axis=1) != previous_best))
+                max_q_change = max(max_q_change, float(np.abs(q_changes).max()))
+
+                episode_rewards += rewards
+                episode_steps += 1
+                states = next_states
+                finished = terminated | (episode_steps >= max_steps_per_episode)
+                if not all_active:
+                    finished &= active
+                if not finished.any():
+                    continue
+
+                # Record finished episodes and start the next one for those agents
+                finishers = np.flatnonzero(finished)
+                finished_episodes = episodes_done[finishers]
+                np.add.at(reward_sums, finished_episodes, episode_rewards[finishers])
+                np.add.at(length_sums, finished_episodes, episode_steps[finishers])
+                if finished[0]:
+                    final_state, final_action = int(next_states[0]), int(actions[0])
+                episodes_done[finishers] += 1
+                episode_rewards[finishers] = 0.0
+                episode_steps[finishers] = 0
+                states[finishers] = self.model.reset_batch(self.rng, len(finishers))
+                if not all_active or finished_episodes.max() + 1 == num_episodes:
+                    active = episodes_done < num_episodes
+                    all_active = False
+
+                # Report every episode that all agents have now finished
+                while reported < episodes_done.min():
+                    self.last_episode_length = float(length_sums[reported] / num_agents)
+                    self.last_max_q_change = max_q_change
+                    self.last_policy_changes = policy_changes
+                    max_q_change, policy_changes = 0.0, 0
+
+                    # Agent 0 is the one shown in frames
+                    EnvironmentManager.set_state(self.env, final_state, final_action)
+
+                    if callback:
+                        mean_reward = float(reward_sums[reported] / num_agents)
+                        if lazy:
+                            callback(reported, mean_reward, None, None)
+                        else:
+                            callback(reported, mean_reward, self.get_learning_data(), self.render_frame())
+                    reported += 1
+
+                    if reported == num_episodes or (control is not None and control.should_stop()):
+                        return
+
+    def greedy_action(self, state: int) -> int:
+        """
+        Return the greedy action of the agent-averaged Q-values in a state.
+
+        Args:
+            state: State index
+
+        Returns:
+            Action index
+        """
+        return int(self._greedy_actions(self.q_table[:, state].mean(axis=0)[None, :])[0])
+
+    def get_learning_data(self) -> Dict[str, Any]:
+        """
+        Return the agent-averaged Q-table for visualization.
+
+        Returns:
+            Dictionary with q_table (mean over agents) and num_agents
+        """
+        return {
+            'q_table': self.q_table.mean(axis=0).tolist(),
+            'num_agents': self.num_agents
+        }
+
+    def get_learning_delta(self) -> Dict[str, Any]:
+        """
+        Return agent-averaged Q-values of cells updated since the previous call.
+
+        Returns:
+            Dictionary with q_updates as a list of [state, action, value]
+        """
+        states, actions = np.nonzero(self.dirty_cells)
+        self.dirty_cells[states, actions] = False
+        values = self.q_table[:, states, actions].mean(axis=0)
+        return {
+            'q_updates': [list(cell) for cell in zip(states.tolist(), actions.tolist(), values.tolist())]
+        }
+
+    @staticmethod
+    def get_parameter_schema(environment: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return batched Q-Learning parameter specifications.
+
+        Args:
+            environment: Optional environment name for environment-specific parameters
+
+        Returns:
+            Dictionary of parameter specifications
+        """
+        schema = QLearning.get_parameter_schema(environment)
+        schema['num_agents'] = {
+            'type': 'int',
+            'min': 1,
+            'max': 1024,
+            'default': 16,
+            'description': 'Number of agents trained in parallel'
+        }
+        return schema
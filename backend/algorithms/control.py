@@ -0,0 +1,89 @@
+import threading
+from typing import Optional
+
+
+class TrainingControl:
+    """
+    Cooperative cancellation token with pause and resume for a training run.
+
+    Algorithms check it between episodes (see BaseAlgorithm.train): a paused
+    run blocks there without using CPU until it is resumed or cancelled, a
+    cancelled run stops before its next episode and keeps what it has
+    learned. Any thread may call pause, resume and cancel.
+    """
+
+    def __init__(self):
+        """Initialize a running, not cancelled control."""
+        self.cancelled = False
+        self.reason: Optional[str] = None
+        # Set while the run may continue (cleared by pause)
+        self._running = threading.Event()
+        self._running.set()
+        # Set by the training coordinator once the run has stopped
+        self._finished = threading.Event()
+
+    @property
+    def paused(self) -> bool:
+        """True while the run is paused (and not cancelled)."""
+        return not self._running.is_set()
+
+    @property
+    def state(self) -> str:
+        """'running', 'paused', 'cancelling' or 'stopped'."""
+        if self._finished.is_set():
+            return 'stopped'
+        if self.cancelled:
+            return 'cancelling'
+        return 'paused' if self.paused else 'running'
+
+    def pause(self) -> None:
+        """Hold the run before its next episode."""
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self) -> None:
+        """Continue a paused run."""
+        self._running.set()
+
+    def cancel(self, reason: str = 'cancelled') -> None:
+        """
+        Stop the run before its next episode (also wakes a paused run).
+
+        Args:
+            reason: Why the run was stopped (e.g. 'cancelled', 'unwatched',
+                    'reset', or 'converged' for a stopping rule)
+        """
+        if not self.cancelled:
+            self.reason = reason
+            self.cancelled = True
+        self._running.set()
+
+    def should_stop(self) -> bool:
+        """
+        Wait while paused, then report whether the run has to stop.
+
+        Called by algorithms before every episode; costs one flag check
+        while the run is neither paused nor cancelled.
+
+        Returns:
+            True if the run was cancelled
+        """
+        if not self._running.is_set():
+            self._running.wait()
+        return self.cancelled
+
+    def finish(self) -> None:
+        """Mark the run as stopped (called when the training call returns)."""
+        self._finished.set()
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the run has stopped.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the run stopped within the timeout
+        """
+        return self._finished.wait(timeout)
@@ -0,0 +1,238 @@
+from abc import abstractmethod
+import numpy as np
+from typing import Dict, Any, Callable, Optional
+from environments.environment_manager import EnvironmentManager
+from .base_algorithm import BaseAlgorithm
+from .control import TrainingControl
+
+
+class DynamicProgrammingAlgorithm(BaseAlgorithm):
+    """
+    Common base for model-based planners on discrete environments.
+
+    Planners read the full transition model (env.unwrapped.P, compiled into a
+    TabularModel) instead of sampling episodes, and every sweep works on whole
+    (S, A) arrays. One training "episode" is one sweep; the reported reward is
+    the expected return of the current greedy policy (value estimate) from the
+    start-state distribution. Training stops early once the solution has
+    converged.
+    """
+
+    CHECKPOINT_ARRAYS = ('q_table',)
+
+    def __init__(self, env, parameters: Dict[str, Any]):
+        """
+        Initialize the planner.
+
+        Args:
+            env: Gymnasium environment exposing env.unwrapped.P
+            parameters: Dict with discount_factor and theta
+
+        Raises:
+            ValueError: If the environment has no tabular model
+        """
+        super().__init__(env, parameters)
+
+        self.discount_factor = parameters.get('discount_factor', 0.95)
+        self.theta = parameters.get('theta', 1e-8)
+
+        self.model = EnvironmentManager.compile_environment(env)
+        self.q_table = np.zeros((self.model.num_states, self.model.num_actions))
+
+        # Number of sweeps the last train() call needed to converge (None if it did not)
+        self.converged_after: Optional[int] = None
+
+    @abstractmethod
+    def _sweep(self) -> bool:
+        """
+        Run one planning sweep, updating q_table.
+
+        Returns:
+            True if the solution has converged
+        """
+        pass
+
+    def _expected_return(self) -> float:
+        """Value estimate of the greedy policy from the start-state distribution."""
+        return float(self.model.initial_distribution @ self.q_table.max(axis=1))
+
+    def train(
+        self,
+        num_episodes: int,
+        callback: Optional[Callable] = None,
+        lazy: bool = False,
+        control: Optional[TrainingControl] = None
+    ) -> None:
+        """
+        Plan for at most num_episodes sweeps.
+
+        Args:
+            num_episodes: Maximum number of sweeps
+            callback: Called after each sweep with (sweep, expected_return, learning_data, frame)
+            lazy: Pass None for learning_data and frame; see BaseAlgorithm.train
+            control: Optional pause/cancellation token checked between episodes
+        """
+        self.converged_after = None
+        if callback and not lazy:
+            # Frames show the start state; planning never moves the agent
+            self.env.reset()
+
+        for sweep in range(num_episodes):
+            if control is not None and control.should_stop():
+                break
+
+            previous = self.q_table
+            converged = self._sweep()
+            # Sweeps replace q_table, so the previous one is still intact
+            self.last_max_q_change = float(np.abs(self.q_table - previous).max())
+            self.last_policy_changes = int(np.count_nonzero(self.q_table.argmax(axis=1) != previous.argmax(axis=1)))
+
+            if callback:
+                if lazy:
+                    callback(sweep, self._expected_return(), None, None)
+                else:
+                    callback(sweep, self._expected_return(), self.get_learning_data(), self.render_frame())
+
+            if converged:
+                self.converged_after = sweep + 1
+                break
+
+    def greedy_action(self, state: int) -> int:
+        """
+        Return the greedy action of the planned Q-values in a state.
+
+        Args:
+            state: State index
+
+        Returns:
+            Action index
+        """
+        return int(np.argmax(self.q_table[state]))
+
+    def get_learning_data(self) -> Dict[str, Any]:
+        """
+        Return Q-table for visualization.
+
+        Returns:
+            Dictionary with q_table as nested list
+        """
+        return {
+            'q_table': self.q_table.tolist()
+        }
+
+    @staticmethod
+    def _common_schema() -> Dict[str, Dict[str, Any]]:
+        """Parameters shared by all planners."""
+        return {
+            'discount_factor': {
+                'type': 'float',
+                'min': 0.0,
+                'max': 0.99,
+                'default': 0.95,
+                'description': '0 ≤ γ < 1 - importance of future rewards'
+            },
+            'theta': {
+                'type': 'float',
+                'min': 0.0,
+                'max': 1.0,
+                'default': 1e-8,
+                'description': 'Convergence threshold on the largest value change'
+            }
+        }
+
+
+class ValueIteration(DynamicProgrammingAlgorithm):
+    """
+    Value iteration: repeated Bellman optimality backups over all states at once.
+    """
+
+    CHECKPOINT_ARRAYS = ('q_table', 'values')
+
+    def __init__(self, env, parameters: Dict[str, Any]):
+        """
+        Initialize value iteration.
+
+        Args:
+            env: Gymnasium environment exposing env.unwrapped.P
+            parameters: Dict with discount_factor and theta
+        """
+        super().__init__(env, parameters)
+        self.values = np.zeros(self.model.num_states)
+
+    def _sweep(self) -> bool:
+        """One synchronous Bellman optimality backup."""
+        self.q_table = self.model.bellman_q(self.values, self.discount_factor)
+        new_values = self.q_table.max(axis=1)
+        delta = np.abs(new_values - self.values).max()
+        self.values = new_values
+        return delta < self.theta
+
+    @staticmethod
+    def get_parameter_schema(environment: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return value iteration parameter specifications.
+
+        Args:
+            environment: Optional environment name (unused)
+
+        Returns:
+            Dictionary of parameter specifications
+        """
+        schema = DynamicProgrammingAlgorithm._common_schema()
+        schema['num_episodes'] = {
+            'type': 'int',
+            'default': 1000,
+            'description': 'Maximum number of sweeps (stops early on convergence)'
+        }
+        return schema
+
+
+class PolicyIteration(DynamicProgrammingAlgorithm):
+    """
+    Policy iteration: exact policy evaluation (one linear solve) followed by
+    greedy policy improvement, until the policy is stable.
+    """
+
+    CHECKPOINT_ARRAYS = ('q_table', 'policy')
+
+    def __init__(self, env, parameters: Dict[str, Any]):
+        """
+        Initialize policy iteration with the all-zeros policy.
+
+        Args:
+            env: Gymnasium environment exposing env.unwrapped.P
+            parameters: Dict with discount_factor and theta
+        """
+        super().__init__(env, parameters)
+        self.policy = np.zeros(self.model.num_states, dtype=np.int64)
+
+    def _sweep(self) -> bool:
+        """Evaluate the current policy exactly, then improve it greedily."""
+        values = self.model.evaluate_policy(self.policy, self.discount_factor)
+        self.q_table = self.model.bellman_q(values, self.discount_factor)
+
+        # Keep the current action unless another one is better by more than
+        # theta, so ties between equally good actions cannot cycle forever
+        current = self.q_table[np.arange(self.model.num_states), self.policy]
+        improved = self.q_table.max(axis=1) > current + self.theta
+        self.policy = np.where(improved, self.q_table.argmax(axis=1), self.policy)
+        return not improved.any()
+
+    @staticmethod
+    def get_parameter_schema(environment: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Return policy iteration parameter specifications.
+
+        Args:
+            environment: Optional environment name (unused)
+
+        Returns:
+            Dictionary of parameter specifications
+        """
+        schema = DynamicProgrammingAlgorithm._common_schema()
+        schema['num_episodes'] = {
+            'type': 'int',
+            'default': 100,
+            'description': 'Maximum number of policy improvement steps (stops early when stable)'
+        }
+        return schema
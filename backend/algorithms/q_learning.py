@@ -1,6 +1,10 @@
+import time
 import numpy as np
 from typing import Dict, Any, Callable, Optional
+from environments.environment_manager import EnvironmentManager
+from monitoring import METRICS
 from .base_algorithm import BaseAlgorithm
+from .control import TrainingControl
 
 
 class QLearning(BaseAlgorithm):
@@ -10,13 +14,18 @@ class QLearning(BaseAlgorithm):
     Uses epsilon-greedy exploration and standard Q-learning update rule.
     """
 
+    CHECKPOINT_ARRAYS = ('q_table',)
+    RECORDS_TRAJECTORIES = True
+
     def __init__(self, env, parameters: Dict[str, Any]):
         """
         Initialize Q-Learning algorithm.
 
         Args:
             env: Gymnasium environment with discrete observation and action spaces
-            parameters: Dict with learning_rate, discount_factor, exploration_rate
+            parameters: Dict with learning_rate, discount_factor, exploration_rate.
+                        Set use_compiled_model=True to train on the environment's
+                        compiled TabularModel instead of calling env.step().
         """
         super().__init__(env, parameters)
 
@@ -25,6 +34,11 @@ class QLearning(BaseAlgorithm):
         self.discount_factor = parameters.get('discount_factor', 0.95)
         self.exploration_rate = parameters.get('exploration_rate', 0.1)
 
+        # Optionally step a compiled tabular model instead of the gym.make wrapper stack
+        self.model = None
+        if parameters.get('use_compiled_model', False):
+            self.model = EnvironmentManager.compile_environment(env)
+
         # Extract Q-initialization parameters
         q_init_strategy = parameters.get('q_init_strategy', 'fixed')
         q_init_value = float(parameters.get('q_init_value', 0.0))
@@ -50,6 +64,9 @@ class QLearning(BaseAlgorithm):
         for state in self.terminal_states:
             self.q_table[state, :] = 0.0
 
+        # Q-table cells updated since the last get_learning_delta() call
+        self.dirty_cells = np.zeros(self.q_table.shape, dtype=bool)
+
     def _get_terminal_states(self, env) -> set:
         """
         Identify terminal states (holes and goals) from the environment.
@@ -107,7 +124,7 @@ class QLearning(BaseAlgorithm):
                 raise ValueError(
                     f"Invalid Q-value initialization: min ({min_val}) must be less than max ({max_val})"
                 )
-            return np.random.uniform(min_val, max_val, (num_states, num_actions))
+            return self.random.generator.uniform(min_val, max_val, (num_states, num_actions))
         else:
             raise ValueError(f"Unknown Q-value initialization strategy: {strategy}")
 
@@ -123,100 +140,180 @@ class QLearning(BaseAlgorithm):
         Returns:
             Action index with highest Q-value (random if tied)
         """
-        max_value = np.max(q_values)
-        max_actions = np.where(q_values == max_value)[0]
-        return np.random.choice(max_actions)
-
-    def train(self, num_episodes: int, callback: Optional[Callable] = None) -> None:
+        # Small action rows are faster as Python lists than through NumPy calls
+        values = q_values.tolist()
+        best = max(values)
+        ties = values.count(best)
+        if ties == 1:
+            return values.index(best)
+        tied_actions = [action for action, value in enumerate(values) if value == best]
+        return tied_actions[self.random.integers(ties)]
+
+    def train(
+        self,
+        num_episodes: int,
+        callback: Optional[Callable] = None,
+        lazy: bool = False,
+        control: Optional[TrainingControl] = None
+    ) -> None:
         """
         Train Q-Learning agent.
 
-        CRITICAL: Only renders the final frame of each episode!
+        CRITICAL: Only renders the final frame of each episode, and only for a
+        non-lazy callback!
+
+        Also tracks last_max_q_change and last_policy_changes per episode.
+        The greedy action of a state can only change when its updated cell
+        overtakes it or the greedy cell itself decreases, so tracking costs
+        two comparisons per step (a row argmax only in the latter case).
+
+        With a recorder set, every transition of an episode is buffered and
+        handed to recorder.record_episode() when the episode ends.
 
         Args:
             num_episodes: Number of episodes to train
             callback: Called after each episode with (episode, reward, learning_data, frame)
+            lazy: Pass None for learning_data and frame; see BaseAlgorithm.train
+            control: Optional pause/cancellation token checked between episodes
         """
-        max_steps_per_episode = 100  # Prevent infinite loops
+        max_steps_per_episode = EnvironmentManager.max_episode_steps(self.env)  # Prevent infinite loops
+        rng = self.env.unwrapped.np_random
+        draw = self.random.random
+        num_actions = self.env.action_space.n
+
+        # Phase timing; checked once so disabled metrics cost nothing per step
+        timed = METRICS.enabled
+        clock = time.perf_counter
+
+        # Greedy (first-maximum) action per state, kept current for policy-change counting
+        q_table = self.q_table
+        greedy = q_table.argmax(axis=1).tolist()
+
+        recorder = self.recorder
 
         for episode in range(num_episodes):
-            state, _ = self.env.reset()
+            if control is not None and control.should_stop():
+                break
+
+            if self.model is not None:
+                state = self.model.reset(rng)
+            else:
+                state, _ = self.env.reset()
             total_reward = 0
             done = False
             steps = 0
+            action = None
+            select_time = step_time = update_time = 0.0
+            max_q_change = 0.0
+            policy_changes = 0
+            if recorder is not None:
+                states, actions, rewards, next_states, terminals = [], [], [], [], []
 
             # Run episode
             while not done and steps < max_steps_per_episode:
+                if timed:
+                    start = clock()
+
                 # Epsilon-greedy action selection
-                if np.random.random() < self.exploration_rate:
-                    action = self.env.action_space.sample()
+                if draw() < self.exploration_rate:
+                    action = int(draw() * num_actions)
                 else:
                     action = self._argmax_random_tiebreak(self.q_table[state])
 
+                if timed:
+                    selected = clock()
+                    select_time += selected - start
+
                 # Take action
-                next_state, reward, terminated, truncated, _ = self.env.step(action)
+                if self.model is not None:
+                    next_state, reward, terminated = self.model.step(state, action, rng)
+                    truncated = False
+                else:
+                    next_state, reward, terminated, truncated, _ = self.env.step(action)
                 done = terminated or truncated
                 total_reward += reward
+                if recorder is not None:
+                    states.append(state)
+                    actions.append(action)
+                    rewards.append(reward)
+                    next_states.append(next_state)
+                    terminals.append(terminated)
+
+                if timed:
+                    stepped = clock()
+                    step_time += stepped - selected
 
                 # Q-learning update rule (use regular argmax here for speed)
                 best_next_action = self._argmax_random_tiebreak(self.q_table[next_state])
                 td_target = reward + self.discount_factor * self.q_table[next_state, best_next_action]
-                td_error = td_target - self.q_table[state, action]
-                self.q_table[state, action] += self.learning_rate * td_error
+                current = self.q_table[state, action]
+                td_error = td_target - current
+                q_change = self.learning_rate * td_error
+                value = current + q_change
+                self.q_table[state, action] = value
+                self.dirty_cells[state, action] = True
+
+                # Convergence tracking
+                q_change = abs(q_change)
+                if q_change > max_q_change:
+                    max_q_change = q_change
+                best = greedy[state]
+                if action == best:
+                    if td_error < 0:
+                        best = int(q_table[state].argmax())
+                else:
+                    best_value = q_table[state, best]
+                    if value > best_value or (value == best_value and action < best):
+                        best = action
+                if best != greedy[state]:
+                    greedy[state] = best
+                    policy_changes += 1
+
+                if timed:
+                    update_time += clock() - stepped
 
                 state = next_state
                 steps += 1
 
-            # CRITICAL: Render only AFTER episode completes
-            frame = self.env.render()
+            self.last_episode_length = steps
+            self.last_max_q_change = float(max_q_change)
+            self.last_policy_changes = policy_changes
+            if recorder is not None:
+                recorder.record_episode(states, actions, rewards, next_states, terminals)
+            if timed:
+                METRICS.observe('action_selection', select_time, self.metrics_session, steps)
+                METRICS.observe('env_step', step_time, self.metrics_session, steps)
+                METRICS.observe('td_update', update_time, self.metrics_session, steps)
+
+            # Keep the environment in the episode's final state for on-demand rendering
+            if self.model is not None:
+                EnvironmentManager.set_state(self.env, state, action)
 
             # Call callback with episode results
             if callback:
-                learning_data = self.get_learning_data()
-
                 # Debug logging every 100 episodes
                 if episode % 100 == 0:
                     print(f"DEBUG: Episode {episode}: Q-table min={np.min(self.q_table):.4f}, max={np.max(self.q_table):.4f}, mean={np.mean(self.q_table):.4f}")
                     print(f"DEBUG: Q-table sample (state 0): {self.q_table[0]}")
 
-                callback(episode, total_reward, learning_data, frame)
+                if lazy:
+                    callback(episode, total_reward, None, None)
+                else:
+                    # CRITICAL: Render only AFTER episode completes
+                    frame = self.render_frame()
+                    callback(episode, total_reward, self.get_learning_data(), frame)
 
-    def play_policy(self, callback: Optional[Callable] = None) -> list:
+    def greedy_action(self, state: int) -> int:
         """
-        Execute learned policy and collect all frames.
-
-        CRITICAL: Renders EVERY step during playback!
+        Return the greedy action in a state (random among tied Q-values).
 
         Args:
-            callback: Called after each step with (frame)
+            state: State index
 
         Returns:
-            List of all frames from the episode
+            Action index
         """
-        max_steps = 100  # Prevent infinite loops
-        frames = []
-        state, _ = self.env.reset()
-        done = False
-        steps = 0
-
-        while not done and steps < max_steps:
-            # Select best action (greedy, with random tie-breaking)
-            action = self._argmax_random_tiebreak(self.q_table[state])
-
-            # Take action
-            state, _, terminated, truncated, _ = self.env.step(action)
-            done = terminated or truncated
-
-            # CRITICAL: Render AFTER every step
-            frame = self.env.render()
-            frames.append(frame)
-
-            if callback:
-                callback(frame)
-
-            steps += 1
-
-        return frames
+        return self._argmax_random_tiebreak(self.q_table[state])
 
     def get_learning_data(self) -> Dict[str, Any]:
         """
@@ -229,6 +326,20 @@ class QLearning(BaseAlgorithm):
             'q_table': self.q_table.tolist()
         }
 
+    def get_learning_delta(self) -> Dict[str, Any]:
+        """
+        Return Q-table cells updated since the previous call.
+
+        Returns:
+            Dictionary with q_updates as a list of [state, action, value]
+        """
+        states, actions = np.nonzero(self.dirty_cells)
+        self.dirty_cells[states, actions] = False
+        values = self.q_table[states, actions]
+        return {
+            'q_updates': [list(cell) for cell in zip(states.tolist(), actions.tolist(), values.tolist())]
+        }
+
     @staticmethod
     def get_parameter_schema(environment: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
@@ -243,7 +354,9 @@ class QLearning(BaseAlgorithm):
         # Environment-specific num_episodes defaults
         num_episodes_defaults = {
             'FrozenLake-v1': 5000,
-            'FrozenLake-v1-NoSlip': 500
+            'FrozenLake-v1-NoSlip': 500,
+            'FrozenLake8x8-v1': 20000,
+            'FrozenLake8x8-v1-NoSlip': 2000
         }
 
         # Get environment-specific default or use fallback
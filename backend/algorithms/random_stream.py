@@ -0,0 +1,82 @@
+import numpy as np
+from typing import List
+
+
+# Uniform draws generated per refill (one NumPy call per block instead of per step)
+DEFAULT_BLOCK_SIZE = 1024
+
+
+class RandomStream:
+    """
+    Per-session source of uniform random numbers, served from pre-drawn blocks.
+
+    Drawing single numbers from NumPy costs a function call into C per draw,
+    and the global np.random state is shared by every session in the process,
+    so concurrent sessions interleave their draws and a seed does not make a
+    run reproducible. A RandomStream owns its np.random.Generator and draws
+    block_size uniforms at a time; exploration decisions and tie-breaks then
+    read plain Python floats from the block.
+
+    The sequence of values only depends on the generator's initial state, so
+    two streams built from equally seeded environments produce identical
+    draws regardless of what other sessions do.
+    """
+
+    def __init__(self, generator: np.random.Generator, block_size: int = DEFAULT_BLOCK_SIZE):
+        """
+        Initialize the stream.
+
+        Args:
+            generator: Generator the blocks are drawn from
+            block_size: Number of uniforms drawn per refill
+        """
+        self.generator = generator
+        self.block_size = block_size
+        self._block: List[float] = []
+        self._index = 0
+
+    @classmethod
+    def from_env(cls, env, block_size: int = DEFAULT_BLOCK_SIZE) -> 'RandomStream':
+        """
+        Create a stream seeded from an environment's random generator.
+
+        The stream uses a jumped copy of the environment's bit generator: it is
+        determined by the environment's seed but statistically independent of
+        the environment's own draws (transitions, resets), and creating it does
+        not advance the environment's generator.
+
+        Args:
+            env: Gymnasium environment (seeded via reset(seed=...) for reproducible runs)
+            block_size: Number of uniforms drawn per refill
+
+        Returns:
+            RandomStream
+        """
+        generator = np.random.Generator(env.unwrapped.np_random.bit_generator.jumped())
+        return cls(generator, block_size)
+
+    def random(self) -> float:
+        """
+        Return the next uniform number in [0, 1).
+
+        Returns:
+            Uniform float
+        """
+        index = self._index
+        if index >= len(self._block):
+            self._block = self.generator.random(self.block_size).tolist()
+            index = 0
+        self._index = index + 1
+        return self._block[index]
+
+    def integers(self, high: int) -> int:
+        """
+        Return a uniform integer in [0, high).
+
+        Args:
+            high: Exclusive upper bound (small, e.g. an action count)
+
+        Returns:
+            Uniform integer
+        """
+        return int(self.random() * high)
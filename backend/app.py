@@ -6,6 +6,7 @@ from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import json
 import queue
+import tempfile
 import threading
 
 print("DEBUG: Starting imports...")
@@ -18,16 +19,26 @@ except Exception as e:
 
 try:
     from environments.environment_manager import EnvironmentManager
+    from environments.frame_cache import EncodedFrame
     print("DEBUG: EnvironmentManager imported successfully")
 except Exception as e:
     print(f"DEBUG: EnvironmentManager import failed: {e}")
 
 try:
     from training.trainer import TrainingCoordinator
+    from training.events import TrainingEventEncoder, EmissionPolicy, OptimalityTracker
+    from training.event_log import EventLog, OVERFLOW_POLICIES
+    from training.convergence import TrainingMetrics
+    from algorithms import TrainingControl
+    from training.evaluation import PolicyEvaluator
+    from training.executor import TrainingExecutor, QueueFullError
     print("DEBUG: TrainingCoordinator imported successfully")
 except Exception as e:
     print(f"DEBUG: TrainingCoordinator import failed: {e}")
 
+from monitoring import METRICS
+from serving import EventStream
+
 print("DEBUG: Creating Flask app...")
 app = Flask(__name__)
 
@@ -35,10 +46,119 @@ print("DEBUG: Setting up CORS...")
 # Enable CORS for frontend on localhost:3030
 CORS(app, origins=['http://localhost:3030', 'http://127.0.0.1:3030'])
 
-print("DEBUG: Creating training coordinator...")
-# Global training coordinator
-trainer = TrainingCoordinator()
-print("DEBUG: Training coordinator created successfully")
+# Global training coordinator, created by create_app(). Sessions are bounded by
+# count, estimated memory and idle time; least recently used idle sessions are
+# evicted first.
+trainer = None
+
+# Training stream events retained per session for replay to (re)connecting subscribers
+EVENT_LOG_CAPACITY = int(os.environ.get('RL_EVENT_LOG_CAPACITY', 1000))
+# Seconds a run may continue without any stream subscriber before it is cancelled
+# (covers EventSource reconnects); 0 keeps unwatched runs training
+UNWATCHED_RUN_TIMEOUT = float(os.environ.get('RL_UNWATCHED_RUN_TIMEOUT', 10))
+# Serializes "attach or start" decisions so a session never trains twice at once
+training_runs_lock = threading.Lock()
+# How stream subscribers receive frames: inline base64 PNG or content hash
+FRAME_FORMATS = ('base64', 'hash')
+# Policy playback: one event per episode, one per step, or a batch of rollouts
+PLAYBACK_MODES = ('episode', 'step', 'batch')
+# Largest number of transitions returned by one trajectory request
+MAX_TRAJECTORY_SLICE = 10000
+
+
+def collect_runtime_gauges():
+    """
+    Report queue depths, active training threads and session counts for /api/metrics.
+
+    Returns:
+        List of (name, help, samples) gauges for METRICS.render
+    """
+    sessions = trainer.sessions.items()
+    store = trainer.sessions.get_stats()
+    jobs = trainer.executor.get_stats()['jobs']
+    frame_cache = EnvironmentManager.frame_cache.get_stats()
+    frame_store = EnvironmentManager.frame_store.get_stats()
+    env_pool = EnvironmentManager.env_pool.get_stats()
+
+    backlog, subscribers, lag, high_water, dropped, blocked = [], [], [], [], [], []
+    for session_id, session in sessions:
+        event_log = session.get('event_log')
+        if event_log is not None:
+            stats = event_log.get_stats()
+            labels = {'session': session_id}
+            backlog.append((labels, stats['retained']))
+            subscribers.append((labels, stats['subscribers']))
+            lag.append((labels, stats['backlog']))
+            high_water.append((labels, stats['high_water']))
+            dropped.append((labels, stats['dropped']))
+            blocked.append((labels, stats['blocked_seconds']))
+
+    return [
+        ('sessions', 'Live training sessions', [({}, store['sessions'])]),
+        ('session_memory_bytes', 'Estimated memory of live sessions', [({}, store['memory_bytes'])]),
+        ('session_evictions', 'Sessions evicted since startup', [({}, store['evictions'])]),
+        ('training_threads_active', 'Sessions currently training in a background thread',
+         [({}, sum(1 for _, session in sessions if session['running']))]),
+        ('threads', 'Live Python threads', [({}, threading.active_count())]),
+        ('jobs', 'Background training jobs by status',
+         [({'status': status}, count) for status, count in sorted(jobs.items())]),
+        ('event_log_retained', 'Stream events retained per session', backlog),
+        ('event_log_subscribers', 'Connected stream subscribers per session', subscribers),
+        ('event_log_subscriber_backlog', 'Largest unread backlog of a connected subscriber per session', lag),
+        ('event_log_subscriber_backlog_high_water', 'Largest subscriber backlog seen per session', high_water),
+        ('event_log_dropped_events', 'Events merged or dropped for slow subscribers per session', dropped),
+        ('event_log_blocked_seconds', 'Time training waited for blocking subscribers per session', blocked),
+        ('frame_cache_entries', 'Encoded frames in the frame cache', [({}, frame_cache['size'])]),
+        ('frame_store_entries', 'Frames fetchable from /api/frames', [({}, frame_store['size'])]),
+        ('env_pool_idle', 'Pre-constructed environments ready for checkout',
+         [({'pool': pool}, idle) for pool, idle in sorted(env_pool['idle'].items())])
+    ]
+
+
+def create_app():
+    """
+    Create the training coordinator, warm the environment pools and return the app.
+
+    Not done at import: worker processes of the training executor ('spawn')
+    re-import the main module, and must not build a coordinator or warm
+    environments of their own. Safe to call more than once.
+
+    Returns:
+        The Flask app
+    """
+    global trainer
+    if trainer is not None:
+        return app
+
+    print("DEBUG: Creating training coordinator...")
+    trainer = TrainingCoordinator(
+        max_sessions=int(os.environ.get('RL_MAX_SESSIONS', 200)),
+        max_memory_bytes=int(os.environ.get('RL_SESSION_MEMORY_MB', 512)) * 1024 * 1024,
+        idle_ttl=float(os.environ.get('RL_SESSION_TTL_SECONDS', 3600)),
+        # Trained sessions survive restarts when a checkpoint directory is configured
+        checkpoint_dir=os.environ.get('RL_CHECKPOINT_DIR'),
+        # Background training jobs run in worker processes (default: one per CPU)
+        executor=TrainingExecutor(
+            max_workers=int(os.environ.get('RL_TRAINING_WORKERS', 0)) or None,
+            max_queued=int(os.environ.get('RL_MAX_QUEUED_JOBS', 100))
+        ),
+        # Recorded training transitions (sessions created with record_trajectories)
+        trajectory_dir=os.environ.get('RL_TRAJECTORY_DIR') or os.path.join(
+            tempfile.gettempdir(), 'rl-playground-trajectories'
+        )
+    )
+    print("DEBUG: Training coordinator created successfully")
+
+    # Spare environments per name and render mode, so session creation skips gym.make
+    EnvironmentManager.env_pool.size = int(os.environ.get('RL_ENV_POOL_SIZE', 2))
+    EnvironmentManager.env_pool.warm(
+        EnvironmentManager.get_available_environments(),
+        ['rgb_array', None]
+    )
+    EnvironmentManager.warm_previews()
+
+    METRICS.add_collector(collect_runtime_gauges)
+    return app
 
 
 @app.route('/test')
@@ -72,6 +192,60 @@ def get_environments():
     return jsonify(environments)
 
 
+@app.route('/api/environments/maps', methods=['POST'])
+def create_map():
+    """
+    Name a generated or custom FrozenLake map.
+
+    The returned name can be used as environment anywhere (training, jobs,
+    sweeps, previews); the map is rebuilt from the name itself.
+
+    Expected JSON body, either a custom layout:
+    {
+        "desc": ["SFFF", "FHFH", "FFFH", "HFFG"],
+        "slippery": true
+    }
+    or a generated map:
+    {
+        "size": 16,
+        "frozen_prob": 0.8,
+        "seed": 3,
+        "slippery": true
+    }
+
+    Returns:
+        JSON with environment name, map rows and size [rows, cols]
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        slippery = bool(data.get('slippery', True))
+
+        if 'desc' in data:
+            desc = data['desc']
+            if not isinstance(desc, list) or not all(isinstance(row, str) for row in desc):
+                return jsonify({'error': 'desc must be a list of strings'}), 400
+            env_name = EnvironmentManager.custom_map_name(desc, slippery)
+        elif 'size' in data:
+            size = int(data['size'])
+            frozen_prob = float(data.get('frozen_prob', 0.8))
+            seed = int(data.get('seed', 0))
+            env_name = EnvironmentManager.random_map_name(size, frozen_prob, seed, slippery)
+            desc = EnvironmentManager.generate_map(size, frozen_prob, seed)
+        else:
+            return jsonify({'error': 'Either desc or size is required'}), 400
+
+        return jsonify({
+            'environment': env_name,
+            'desc': desc,
+            'size': [len(desc), len(desc[0])]
+        })
+
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Failed to create map: {str(e)}'}), 500
+
+
 @app.route('/api/environments/<env_name>/preview', methods=['GET'])
 def get_environment_preview(env_name):
     """
@@ -81,28 +255,20 @@ def get_environment_preview(env_name):
         env_name: Environment name (e.g., 'FrozenLake-v1')
 
     Returns:
-        JSON with base64-encoded preview frame
+        JSON with base64-encoded preview frame (ETag; 304 for a matching If-None-Match)
     """
     try:
-        # Create environment (render_mode is set internally)
-        env = EnvironmentManager.create_environment(env_name)
-
-        # Reset to get initial state
-        env.reset()
-
-        # Render the first frame (using the actual environment rendering)
-        frame = env.render()
-
-        # Convert to base64
-        frame_base64 = EnvironmentManager.frame_to_base64(frame)
-
-        # Clean up
-        env.close()
+        # Rendered once per environment (at startup), served from memory
+        preview = EnvironmentManager.get_preview(env_name)
 
-        return jsonify({
-            'frame': frame_base64,
+        response = jsonify({
+            'frame': preview.base64,
             'environment': env_name
         })
+        # Revalidate on every use; unchanged previews cost a 304 without a body
+        response.set_etag(preview.digest)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -143,9 +309,17 @@ def start_training():
             "algorithm": "Q-Learning",
             "environment": "FrozenLake-v1",
             "parameters": {...},
-            "seed": 42 (optional)
+            "seed": 42 (optional),
+            "render": "eager" | "lazy" (optional, default "eager"),
+            "record_trajectories": false (optional)
         }
 
+    Training streams only render frames (and build learning data) for the
+    events they emit. In "lazy" mode the environment is also created
+    headless, and set up for rendering when the first frame is needed.
+    With record_trajectories, every training transition is recorded (see
+    GET /api/train/<session_id>/trajectories).
+
     Returns:
         JSON with session_id
     """
@@ -155,6 +329,8 @@ def start_training():
         environment = data.get('environment')
         parameters = data.get('parameters', {})
         seed = data.get('seed')
+        render = data.get('render', 'eager')
+        record = bool(data.get('record_trajectories', False))
 
         # Validate inputs
         if not algorithm:
@@ -163,7 +339,7 @@ def start_training():
             return jsonify({'error': 'Environment is required'}), 400
 
         # Create session
-        session_id = trainer.create_session(algorithm, environment, parameters, seed)
+        session_id = trainer.create_session(algorithm, environment, parameters, seed, render, record)
 
         return jsonify({'session_id': session_id})
 
@@ -181,106 +357,516 @@ def stream_training(session_id):
     Args:
         session_id: Session UUID
 
+    Query Parameters:
+        episodes: Optional number of episodes (default: the session's num_episodes).
+                  Streaming an already trained or restored session continues
+                  training from its current Q-table.
+        snapshot_interval: Optional. Send the full learning data every N events
+                           and only changed Q-table cells in between. Without
+                           it, every event carries the full learning data.
+        emit: Optional emission mode: 'every' (default), 'rate' or 'adaptive'
+        every: Optional. In 'every' mode, send one event per N episodes (default 1)
+        max_rate: Maximum events per second for 'rate' and 'adaptive' modes
+        optimality: Optional. If 'true', every event carries an 'optimality'
+                    field comparing the Q-table with the optimal Q*
+                    (q_distance, optimal_actions, regret)
+        evaluate_every: Optional. Attach an 'evaluation' of the greedy policy
+                        (see /api/evaluate) to the first emitted event at least
+                        N episodes after the previous evaluation, and to the last
+        metrics_window: Optional. Episodes covered by the rolling statistics in
+                        every event's 'metrics' field (default 100): success_rate,
+                        mean_reward, mean_length, plus the last episode's
+                        max_q_change and policy_changes (greedy-action flips)
+        stop_threshold: Optional. Stop early once the greedy policy has not
+                        changed and no Q-value changed by this much for
+                        stop_window consecutive episodes; the completion event
+                        then reports converged and episodes
+        stop_window: Optional. Stable episodes required by stop_threshold (default 100)
+
+        last_event_id: Optional. Resume after this event ID (same as the
+                       Last-Event-ID header EventSource sends on reconnect)
+        frames: Optional frame format of this subscriber: 'base64' (default,
+                'frame' field with the inline PNG) or 'hash' ('frame_hash'
+                field; fetch the image from /api/frames/<hash>.png)
+        buffer: Optional. Maximum number of unread events this subscriber
+                may fall behind (default: RL_EVENT_LOG_CAPACITY)
+        overflow: Optional. What a subscriber whose backlog exceeds its buffer
+                  gets: 'drop' (default; the oldest unread events are merged
+                  into one event with the latest learning data and a 'merged'
+                  count), 'coalesce' (like drop, with the merged episodes in
+                  its 'window') or 'block' (training waits for the subscriber)
+
+    Skipped episodes are aggregated into the 'window' field of the next event.
+    The last episode and the final learning data are always sent.
+
+    The stream ends with a 'complete', 'error' or 'cancelled' event (see
+    control_training). A run whose subscribers have all been gone for
+    UNWATCHED_RUN_TIMEOUT seconds is cancelled.
+
+    Training runs once per session, decoupled from the connection: events go
+    to a bounded per-session log that any number of subscribers read. While a
+    run is active (or when resuming with Last-Event-ID), the request attaches
+    to it and the training query parameters are ignored. Subscribers resume
+    after their last event if it is still retained, otherwise they start at
+    the oldest retained full snapshot.
+
     Returns:
-        SSE stream of training updates
+        SSE stream of training updates, each with an 'id' field
     """
-    if not trainer.session_exists(session_id):
+    session = trainer.get_session(session_id)
+    if session is None:
         return jsonify({'error': 'Session not found'}), 404
 
-    session = trainer.get_session(session_id)
-    num_episodes = int(session['parameters'].get('num_episodes', 1000))
+    try:
+        last_event_id = parse_last_event_id()
+        frame_format = parse_frame_format()
+        buffer_size, overflow = parse_overflow_policy()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
-    def generate():
-        """Generator function for SSE events."""
-        # Create a queue to pass data from training thread to SSE stream
-        event_queue = queue.Queue()
+    with training_runs_lock:
+        event_log = session.get('event_log')
+        # Attach to the running (or just finished) run instead of starting another one
+        resume = event_log is not None and (not event_log.closed or last_event_id is not None)
+        if not resume:
+            try:
+                event_log = start_training_run(session_id, session)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
 
-        def callback(episode, reward, learning_data, frame):
-            """Callback for each episode - puts data into queue."""
-            print(f"DEBUG: Episode {episode} completed with reward {reward}")
+    return stream_event_log(event_log, last_event_id, session_id, frame_format, buffer_size, overflow)
 
-            # Convert frame to base64
-            frame_base64 = EnvironmentManager.frame_to_base64(frame)
 
-            # Create event data
-            event_data = {
-                'episode': episode,
-                'reward': reward,
-                'learning_data': learning_data,
-                'frame': frame_base64,
-                'status': 'training'
-            }
+def parse_last_event_id():
+    """
+    Read the position a (re)connecting SSE client wants to resume after.
 
-            # Put event into queue (instead of yielding)
-            event_queue.put(event_data)
+    EventSource sends the Last-Event-ID header on reconnect; the
+    last_event_id query parameter covers the first connection of a client
+    that resumes manually.
 
-        def train_in_thread():
-            """Run training in a separate thread."""
-            try:
-                print(f"DEBUG: Starting training for session {session_id} with {num_episodes} episodes")
-
-                # Start training
-                trainer.train(session_id, num_episodes, callback)
-
-                print(f"DEBUG: Training completed successfully for session {session_id}")
-
-                # Send completion event
-                completion_data = {
-                    'status': 'complete',
-                    'message': 'Training completed successfully'
-                }
-                event_queue.put(completion_data)
-
-            except Exception as e:
-                print(f"DEBUG: Training failed with error: {e}")
-                print(f"DEBUG: Error type: {type(e)}")
-                import traceback
-                print(f"DEBUG: Full traceback: {traceback.format_exc()}")
-
-                # Send error event
-                error_data = {
-                    'status': 'error',
-                    'message': str(e)
-                }
-                event_queue.put(error_data)
-            finally:
-                # Signal end of training
-                event_queue.put(None)
-
-        # Start training in background thread
-        training_thread = threading.Thread(target=train_in_thread)
-        training_thread.daemon = True
-        training_thread.start()
-
-        # Yield events from the queue
-        while True:
-            try:
-                # Get event from queue (blocks until available)
-                event_data = event_queue.get(timeout=1)
+    Returns:
+        Event ID or None
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        return int(last_event_id) if last_event_id else None
+    except ValueError:
+        raise ValueError('Last-Event-ID must be an integer')
 
-                if event_data is None:
-                    # End of training signal
-                    break
 
-                # Yield SSE event
-                yield f"data: {json.dumps(event_data)}\n\n"
+def parse_frame_format():
+    """
+    Read how a stream subscriber wants frames delivered.
 
-            except queue.Empty:
-                # No data available, send keep-alive comment
-                yield ": keep-alive\n\n"
-                continue
+    Returns:
+        One of FRAME_FORMATS
 
-    # Return SSE response with proper headers
+    Raises:
+        ValueError: If the format is unknown
+    """
+    frame_format = request.args.get('frames', 'base64')
+    if frame_format not in FRAME_FORMATS:
+        raise ValueError(f"Unknown frame format '{frame_format}'. Available formats: {list(FRAME_FORMATS)}")
+    return frame_format
+
+
+def parse_overflow_policy():
+    """
+    Read how a stream subscriber that falls behind is handled.
+
+    Returns:
+        Tuple (buffer_size, overflow): maximum backlog (None for the log
+        capacity) and one of OVERFLOW_POLICIES
+
+    Raises:
+        ValueError: If the buffer size or policy is invalid
+    """
+    buffer_size = request.args.get('buffer', type=int)
+    if buffer_size is not None and buffer_size < 1:
+        raise ValueError('buffer must be a positive integer')
+    overflow = request.args.get('overflow', 'drop')
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(f"Unknown overflow policy '{overflow}'. Available policies: {list(OVERFLOW_POLICIES)}")
+    return buffer_size, overflow
+
+
+def serialize_frame(encoded, frame_format):
+    """
+    Turn an encoded frame into its wire form.
+
+    Args:
+        encoded: EncodedFrame
+        frame_format: 'base64' or 'hash'
+
+    Returns:
+        Base64 PNG string, or the content hash (the frame is published to
+        /api/frames so the client can fetch it)
+    """
+    if frame_format == 'hash':
+        return EnvironmentManager.publish_frame(encoded)
+    return encoded.base64
+
+
+def serialize_event(event_data, frame_format):
+    """
+    Prepare a logged event for one subscriber.
+
+    Training events keep the EncodedFrame in the log, so every subscriber
+    can choose its own frame format.
+
+    Args:
+        event_data: Event from an EventLog
+        frame_format: 'base64' or 'hash'
+
+    Returns:
+        JSON-serializable event ('frame' or 'frame_hash')
+    """
+    encoded = event_data.get('frame')
+    if not isinstance(encoded, EncodedFrame):
+        return event_data
+    event_data = dict(event_data)
+    if frame_format == 'hash':
+        del event_data['frame']
+        event_data['frame_hash'] = serialize_frame(encoded, frame_format)
+    else:
+        event_data['frame'] = encoded.base64
+    return event_data
+
+
+def stream_event_log(event_log, last_event_id=None, session_id=None, frame_format='base64',
+                     buffer_size=None, overflow='drop'):
+    """
+    Stream an event log as Server-Sent Events until it is closed.
+
+    The body is an EventStream: the development server iterates it in the
+    request's thread, the production server (python -m serving, uvicorn)
+    serves it from the event loop without a thread per subscriber.
+
+    Args:
+        event_log: EventLog to read
+        last_event_id: Resume after this event ID, if still retained
+        session_id: Session the stream belongs to (for metrics)
+        frame_format: How frames are sent, see parse_frame_format
+        buffer_size: Maximum backlog of this subscriber, see parse_overflow_policy
+        overflow: Overflow policy of this subscriber
+
+    Returns:
+        SSE response, each event with an 'id' field
+    """
+    stream = EventStream(
+        event_log,
+        last_event_id,
+        serialize=lambda event_data: serialize_event(event_data, frame_format),
+        encoding_key=frame_format,
+        session_id=session_id,
+        buffer_size=buffer_size,
+        overflow=overflow
+    )
+
+    # Return SSE response with proper headers; passed through so servers see the EventStream
     return Response(
-        stream_with_context(generate()),
+        stream,
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no',
             'Connection': 'keep-alive'
-        }
+        },
+        direct_passthrough=True
+    )
+
+
+def start_training_run(session_id, session):
+    """
+    Start training a session in a background thread that writes to a new event log.
+
+    Training runs exactly once per call, independent of any SSE connection;
+    subscribers read the returned log. Settings come from the request that
+    starts the run (see stream_training). Caller holds training_runs_lock.
+
+    Args:
+        session_id: Session UUID
+        session: Session dictionary
+
+    Returns:
+        EventLog of the new run
+
+    Raises:
+        ValueError: If the query parameters are invalid or the session is busy
+    """
+    if session['running']:
+        raise ValueError(f"Session '{session_id}' is already training")
+
+    snapshot_interval = request.args.get('snapshot_interval', type=int)
+    if snapshot_interval is not None and snapshot_interval < 1:
+        raise ValueError('snapshot_interval must be a positive integer')
+
+    emission_policy = EmissionPolicy(
+        mode=request.args.get('emit', 'every'),
+        every=request.args.get('every', 1, type=int),
+        max_rate=request.args.get('max_rate', type=float)
+    )
+
+    algorithm = session['algorithm']
+    env = session['environment']
+    num_episodes = request.args.get('episodes', type=int) or int(session['parameters'].get('num_episodes', 1000))
+
+    # Rolling statistics for every event, and the optional convergence stopping rule
+    metrics = TrainingMetrics(
+        window=request.args.get('metrics_window', 100, type=int),
+        stop_threshold=request.args.get('stop_threshold', type=float),
+        stop_window=request.args.get('stop_window', 100, type=int)
     )
 
+    # Distance to the optimal solution (Q* is solved once per environment)
+    optimality = None
+    if request.args.get('optimality', 'false').lower() in ('1', 'true'):
+        optimality = OptimalityTracker(algorithm, env)
+
+    # Periodic greedy-policy evaluation (exact when the environment has a model)
+    evaluate_every = request.args.get('evaluate_every', type=int)
+    if evaluate_every is not None and evaluate_every < 1:
+        raise ValueError('evaluate_every must be a positive integer')
+    evaluator = PolicyEvaluator(algorithm, env) if evaluate_every else None
+    last_evaluation = [None]
+
+    # Sequence numbers and snapshot/delta encoding, reachable by the resync endpoint
+    encoder = TrainingEventEncoder(algorithm, snapshot_interval)
+    session['event_encoder'] = encoder
+
+    # Pause/resume/cancel token, checked by the algorithm between episodes
+    control = TrainingControl()
+    session['control'] = control
+
+    def cancel_if_unwatched():
+        """Cancel the run if still nobody is subscribed (the clients went away)."""
+        if event_log.subscribers == 0 and not event_log.closed:
+            app.logger.info("No subscribers left for session %s, cancelling training", session_id)
+            control.cancel('unwatched')
+
+    def on_idle():
+        """Last subscriber left: give reconnecting clients a grace period."""
+        if UNWATCHED_RUN_TIMEOUT > 0:
+            timer = threading.Timer(UNWATCHED_RUN_TIMEOUT, cancel_if_unwatched)
+            timer.daemon = True
+            timer.start()
+
+    # Event IDs continue across runs so a stale Last-Event-ID never matches a new run
+    previous_log = session.get('event_log')
+    # Slow subscribers receive merged events carrying the latest learning data
+    event_log = EventLog(
+        EVENT_LOG_CAPACITY,
+        start_id=previous_log.last_id if previous_log else 0,
+        merge=TrainingEventEncoder.merge,
+        on_idle=on_idle
+    )
+    session['event_log'] = event_log
+
+    def callback(episode, reward, learning_data, frame):
+        """Callback for each episode - appends an event to the log."""
+        # Aggregate every episode, but only build events the policy lets through
+        emission_policy.record(episode, reward, algorithm.last_episode_length)
+        # A stopped run (converged or cancelled) ends here, so its last episode is sent too
+        if not emission_policy.should_emit(episode, num_episodes) and not control.cancelled:
+            return
+
+        print(f"DEBUG: Episode {episode} completed with reward {reward}")
+
+        # Encode the frame (cached per environment state, rendered on demand:
+        # training is lazy and passes no frame); subscribers receive it inline
+        # or as a content hash
+        encoded_frame = EnvironmentManager.get_encoded_frame(env, frame)
+
+        # Create event data (learning data as full snapshot or sparse delta)
+        event_data = {
+            'episode': episode,
+            'reward': reward,
+            'frame': encoded_frame,
+            'window': emission_policy.flush(episode),
+            'metrics': metrics.snapshot(),
+            'status': 'training'
+        }
+        event_data.update(encoder.encode())
+        if optimality is not None:
+            event_data['optimality'] = optimality.measure()
+        if evaluator is not None and (
+            last_evaluation[0] is None
+            or episode - last_evaluation[0] >= evaluate_every
+            or episode >= num_episodes - 1
+        ):
+            event_data['evaluation'] = evaluator.evaluate()
+            last_evaluation[0] = episode
+
+        event_log.append(event_data, sync_point=event_data['snapshot'])
+
+    def train_in_thread():
+        """Run training in a separate thread."""
+        try:
+            print(f"DEBUG: Starting training for session {session_id} with {num_episodes} episodes")
+
+            # Start training
+            episodes = trainer.train(session_id, num_episodes, callback, control, metrics)
+
+            if control.cancelled and control.reason != 'converged':
+                app.logger.info("Training %s after %d episodes for session %s", control.reason, episodes, session_id)
+
+                # Send cancellation event with what was learned so far
+                event_log.append({
+                    'status': 'cancelled',
+                    'reason': control.reason,
+                    'message': f'Training stopped after {episodes} of {num_episodes} episodes',
+                    'episodes': episodes,
+                    'learning_data': algorithm.get_learning_data()
+                }, sync_point=True)
+                return
+
+            print(f"DEBUG: Training completed successfully for session {session_id}")
+
+            # Send completion event, always with the final learning data
+            completion_data = {
+                'status': 'complete',
+                'message': 'Training completed successfully',
+                'episodes': episodes,
+                'converged': metrics.converged,
+                'learning_data': algorithm.get_learning_data()
+            }
+            if metrics.converged:
+                completion_data['message'] = f'Training converged after {episodes} of {num_episodes} episodes'
+            event_log.append(completion_data, sync_point=True)
+
+        except Exception as e:
+            print(f"DEBUG: Training failed with error: {e}")
+            print(f"DEBUG: Error type: {type(e)}")
+            import traceback
+            print(f"DEBUG: Full traceback: {traceback.format_exc()}")
+
+            # Send error event
+            error_data = {
+                'status': 'error',
+                'message': str(e)
+            }
+            event_log.append(error_data, sync_point=True)
+        finally:
+            # Signal end of training
+            event_log.close()
+
+    # Mark the session busy before the thread starts so a concurrent request attaches
+    session['running'] = True
+    training_thread = threading.Thread(target=train_in_thread)
+    training_thread.daemon = True
+    training_thread.start()
+
+    return event_log
+
+
+@app.route('/api/train/<session_id>/resync', methods=['POST'])
+def resync_training(session_id):
+    """
+    Request a full learning-data snapshot in the next training event.
+
+    Clients call this when they detect a gap in the event sequence numbers.
+
+    Args:
+        session_id: Session UUID
+
+    Returns:
+        JSON success message
+    """
+    session = trainer.get_session(session_id)
+    if session is None:
+        return jsonify({'error': 'Session not found'}), 404
+
+    encoder = session.get('event_encoder')
+    if encoder is None:
+        return jsonify({'error': 'Session is not streaming'}), 409
+
+    encoder.request_resync()
+    return jsonify({'message': 'Snapshot scheduled', 'seq': encoder.seq})
+
+
+@app.route('/api/train/<session_id>/<any(pause, resume, cancel):action>', methods=['POST'])
+def control_training(session_id, action):
+    """
+    Pause, resume or cancel a session's streamed training run.
+
+    The run checks its control between episodes: a paused run holds before
+    its next episode without using CPU, a cancelled one stops there, keeps
+    the episodes it completed and ends its stream with a 'cancelled' event.
+
+    Args:
+        session_id: Session UUID
+        action: 'pause', 'resume' or 'cancel'
+
+    Returns:
+        JSON with session_id and state ('running', 'paused', 'cancelling'
+        or 'stopped'), or 409 if the session is not training
+    """
+    if trainer.get_session(session_id) is None:
+        return jsonify({'error': 'Session not found'}), 404
+
+    actions = {
+        'pause': trainer.pause_training,
+        'resume': trainer.resume_training,
+        'cancel': trainer.cancel_training
+    }
+    try:
+        state = actions[action](session_id)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 409
+
+    return jsonify({'session_id': session_id, 'state': state})
+
+
+@app.route('/api/train/<session_id>/trajectories', methods=['GET'])
+def get_trajectories(session_id):
+    """
+    Fetch a slice of a session's recorded training transitions.
+
+    Args:
+        session_id: Session UUID
+
+    Query Parameters:
+        start: Index of the first transition (default 0)
+        stop: Index after the last transition (default start + 1000, at most
+              MAX_TRAJECTORY_SLICE transitions are returned)
+        episode: Return this recorded episode instead of start/stop
+
+    Returns:
+        JSON with transitions and episodes (recorded so far), start, stop and
+        columns (episode, step, state, action, reward, next_state and
+        terminated lists), or 404 if the session records no trajectories
+    """
+    recorder = trainer.get_trajectories(session_id)
+    if recorder is None:
+        return jsonify({'error': 'No trajectories recorded for this session'}), 404
+
+    episode = request.args.get('episode', type=int)
+    if episode is not None:
+        transitions = recorder.episode_range(episode)
+        if transitions is None:
+            return jsonify({'error': f'Episode {episode} is not recorded'}), 404
+        start, stop = transitions.start, transitions.stop
+    else:
+        start = request.args.get('start', 0, type=int)
+        stop = request.args.get('stop', start + 1000, type=int)
+    if start < 0 or stop < start:
+        return jsonify({'error': 'start and stop must satisfy 0 <= start <= stop'}), 400
+    stop = min(stop, start + MAX_TRAJECTORY_SLICE)
+
+    columns = recorder.read(start, stop)
+    return jsonify({
+        'session_id': session_id,
+        'transitions': recorder.length,
+        'episodes': recorder.episodes,
+        'start': start,
+        'stop': start + len(columns['state']),
+        'columns': {name: values.tolist() for name, values in columns.items()}
+    })
+
 
 @app.route('/api/play-policy/stream/<session_id>', methods=['GET'])
 def stream_playback(session_id):
@@ -290,25 +876,114 @@ def stream_playback(session_id):
     Args:
         session_id: Session UUID
 
+    Query Parameters:
+        frames: Optional frame format: 'base64' (default, 'frames' field) or
+                'hash' ('frame_hashes' field; fetch /api/frames/<hash>.png)
+        mode: Optional playback mode:
+              'episode' (default) - one event with all frames of one episode
+              'step'  - one 'playing' event per step, sent as soon as the
+                        step's frame is rendered, then a 'complete' event
+              'batch' - run many episodes; 'playing' events for the steps of
+                        a random sample of episodes, 'progress' events with
+                        aggregate outcome statistics, then 'complete'
+        rollouts: Number of episodes in batch mode (default 100)
+        render_episodes: Episodes rendered in batch mode (default 1)
+        seed: Optional seed for choosing the rendered episodes
+
     Returns:
         SSE stream with all frames from policy execution
     """
-    if not trainer.session_exists(session_id):
+    session = trainer.get_session(session_id)
+    if session is None:
         return jsonify({'error': 'Session not found'}), 404
 
+    try:
+        frame_format = parse_frame_format()
+        mode = request.args.get('mode', 'episode')
+        if mode not in PLAYBACK_MODES:
+            raise ValueError(f"Unknown playback mode '{mode}'. Available modes: {list(PLAYBACK_MODES)}")
+        if mode == 'step':
+            steps = trainer.iter_policy(session_id)
+        elif mode == 'batch':
+            num_rollouts = request.args.get('rollouts', 100, type=int)
+            rollouts = trainer.iter_rollouts(
+                session_id,
+                num_rollouts,
+                request.args.get('render_episodes', 1, type=int),
+                request.args.get('seed', type=int)
+            )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    env = session['environment']
+
+    def encode_step(step):
+        """Build the event of one played step, encoding its frame while the environment is in that state."""
+        encoded = EnvironmentManager.get_encoded_frame(env, step['frame'])
+        event_data = {
+            'status': 'playing',
+            'step': step['step'],
+            'action': step['action'],
+            'reward': step['reward']
+        }
+        event_data['frame' if frame_format == 'base64' else 'frame_hash'] = serialize_frame(encoded, frame_format)
+        return event_data
+
+    def generate_steps():
+        """Generator function for SSE events, one per step."""
+        try:
+            total_reward = 0.0
+            num_frames = 0
+            for step in steps:
+                total_reward += step['reward']
+                num_frames += 1
+                yield f"data: {json.dumps(encode_step(step))}\n\n"
+            yield f"data: {json.dumps({'status': 'complete', 'num_frames': num_frames, 'reward': total_reward})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+
+    def generate_batch():
+        """Generator function for SSE events of a rollout batch."""
+        # About 100 progress events per batch, plus one after each rendered episode
+        progress_every = max(1, num_rollouts // 100)
+        try:
+            stats = None
+            for item in rollouts:
+                if item['kind'] == 'step':
+                    event_data = encode_step(item)
+                    event_data['episode'] = item['episode']
+                    yield f"data: {json.dumps(event_data)}\n\n"
+                    continue
+                stats = item['stats']
+                if item['rendered'] or (item['episode'] + 1) % progress_every == 0:
+                    event_data = {
+                        'status': 'progress',
+                        'episode': item['episode'],
+                        'outcome': {key: item[key] for key in ('return', 'length', 'success', 'truncated')},
+                        'stats': stats.summary()
+                    }
+                    yield f"data: {json.dumps(event_data)}\n\n"
+            yield f"data: {json.dumps({'status': 'complete', 'stats': stats.summary()})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+
     def generate():
         """Generator function for SSE events."""
         try:
-            # Execute policy and collect all frames
-            frames = trainer.play_policy(session_id)
+            frames = []
 
-            # Convert all frames to base64
-            frames_base64 = [EnvironmentManager.frame_to_base64(frame) for frame in frames]
+            def callback(frame):
+                """Encode each frame while the environment is still in its state."""
+                encoded = EnvironmentManager.get_encoded_frame(env, frame)
+                frames.append(serialize_frame(encoded, frame_format))
+
+            # Execute policy, encoding frames as they are rendered
+            trainer.play_policy(session_id, callback)
 
             # Send all frames in one event
             event_data = {
-                'frames': frames_base64,
-                'num_frames': len(frames_base64),
+                'frames' if frame_format == 'base64' else 'frame_hashes': frames,
+                'num_frames': len(frames),
                 'status': 'complete'
             }
             yield f"data: {json.dumps(event_data)}\n\n"
@@ -321,9 +996,11 @@ def stream_playback(session_id):
             }
             yield f"data: {json.dumps(error_data)}\n\n"
 
+    generators = {'episode': generate, 'step': generate_steps, 'batch': generate_batch}
+
     # Return SSE response with proper headers
     return Response(
-        stream_with_context(generate()),
+        stream_with_context(generators[mode]()),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
@@ -333,6 +1010,314 @@ def stream_playback(session_id):
     )
 
 
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    Submit a background training job to the worker process pool.
+
+    Request body (either an existing session or a new one):
+        {
+            "session_id": "...",          (optional, continue this session)
+            "algorithm": "Q-Learning",    (required without session_id)
+            "environment": "FrozenLake-v1",
+            "parameters": {...},
+            "seed": 42,                   (optional)
+            "num_episodes": 5000          (optional, default: parameters.num_episodes)
+        }
+
+    Returns:
+        202 with job_id, session_id and status
+    """
+    try:
+        data = request.json or {}
+        session_id = data.get('session_id')
+
+        if session_id is None:
+            if not data.get('algorithm'):
+                return jsonify({'error': 'Algorithm is required'}), 400
+            if not data.get('environment'):
+                return jsonify({'error': 'Environment is required'}), 400
+            session_id = trainer.create_session(
+                data['algorithm'], data['environment'], data.get('parameters', {}), data.get('seed'), 'lazy'
+            )
+
+        session = trainer.get_session(session_id)
+        if session is None:
+            return jsonify({'error': 'Session not found'}), 404
+
+        num_episodes = int(data.get('num_episodes') or session['parameters'].get('num_episodes', 1000))
+        job_id = trainer.submit_training_job(session_id, num_episodes)
+
+        return jsonify(trainer.executor.get_status(job_id)), 202
+
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Internal error: {str(e)}'}), 500
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """
+    List background training jobs and executor load.
+
+    Returns:
+        JSON with jobs (status dicts) and stats (workers, counts per status)
+    """
+    return jsonify({
+        'jobs': trainer.executor.list_jobs(),
+        'stats': trainer.executor.get_stats()
+    })
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """
+    Poll a background training job.
+
+    Args:
+        job_id: Job UUID
+
+    Returns:
+        JSON status: queued, running, completed, failed or cancelled
+    """
+    status = trainer.executor.get_status(job_id)
+    if status is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(status)
+
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """
+    Fetch the result of a completed training job.
+
+    Args:
+        job_id: Job UUID
+
+    Returns:
+        JSON with rewards (per episode) and learning_data (final Q-table),
+        or 409 if the job has not completed
+    """
+    status = trainer.executor.get_status(job_id)
+    if status is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if status['status'] != 'completed':
+        return jsonify({'error': f"Job is {status['status']}", 'status': status}), 409
+
+    job = trainer.executor.get_job(job_id)
+    return jsonify({
+        'job_id': job_id,
+        'session_id': job['session_id'],
+        'rewards': job['result']['rewards'].tolist(),
+        'learning_data': job.get('learning_data')
+    })
+
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """
+    Cancel a job that is still queued.
+
+    Args:
+        job_id: Job UUID
+
+    Returns:
+        JSON success message, or 409 if the job already started
+    """
+    if trainer.executor.get_status(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if not trainer.executor.cancel(job_id):
+        return jsonify({'error': 'Job already started'}), 409
+    return jsonify({'message': 'Job cancelled'})
+
+
+@app.route('/api/evaluate/<session_id>', methods=['GET'])
+def evaluate_policy(session_id):
+    """
+    Evaluate a session's greedy policy.
+
+    Args:
+        session_id: Session UUID
+
+    Query Parameters:
+        method: 'auto' (default), 'exact' or 'monte_carlo'. 'auto' solves the
+                environment model exactly when there is one and otherwise
+                falls back to Monte-Carlo rollouts.
+        rollouts: Number of Monte-Carlo rollouts (default 1000, max 100000)
+        seed: Optional seed for Monte-Carlo rollouts
+
+    Returns:
+        JSON with success probability and expected return (exact), or success
+        rate, mean return and length with 95% confidence intervals (Monte-Carlo)
+    """
+    if not trainer.session_exists(session_id):
+        return jsonify({'error': 'Session not found'}), 404
+
+    num_rollouts = request.args.get('rollouts', 1000, type=int)
+    if not 1 <= num_rollouts <= 100000:
+        return jsonify({'error': 'rollouts must be between 1 and 100000'}), 400
+
+    try:
+        result = trainer.evaluate_policy(
+            session_id,
+            method=request.args.get('method', 'auto'),
+            num_rollouts=num_rollouts,
+            seed=request.args.get('seed', type=int)
+        )
+        return jsonify(result)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Internal error: {str(e)}'}), 500
+
+
+@app.route('/api/sweep', methods=['POST'])
+def start_sweep():
+    """
+    Start a hyperparameter sweep across the training worker processes.
+
+    Request body:
+        {
+            "algorithm": "Q-Learning",
+            "environment": "FrozenLake-v1",
+            "space": {"learning_rate": [0.05, 0.1, 0.5], "discount_factor": [0.9, 0.99]},
+            "mode": "grid",                (or "random" with num_samples and
+                                            lists or {"min", "max"} ranges)
+            "num_samples": 20,             (random mode only)
+            "seeds": 3,                    (count or list of seeds, default 1)
+            "num_episodes": 2000,          (default: schema default)
+            "parameters": {...},           (optional fixed parameters)
+            "threshold": 0.5,              (success rate for episodes_to_threshold)
+            "window": 100                  (rolling window for success rates)
+        }
+
+    All values are validated against the algorithm's parameter schema.
+
+    Returns:
+        202 with sweep_id, total runs and status
+    """
+    try:
+        sweep = trainer.start_sweep(request.json or {})
+        return jsonify({'sweep_id': sweep.sweep_id, 'total': len(sweep.runs), 'status': 'running'}), 202
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Internal error: {str(e)}'}), 500
+
+
+@app.route('/api/sweep/<sweep_id>', methods=['GET'])
+def get_sweep(sweep_id):
+    """
+    Get a sweep's progress and its ranked result table.
+
+    Args:
+        sweep_id: Sweep UUID
+
+    Returns:
+        JSON with status, run counts and ranking (one row per configuration,
+        aggregated over seeds, best first)
+    """
+    sweep = trainer.get_sweep(sweep_id)
+    if sweep is None:
+        return jsonify({'error': 'Sweep not found'}), 404
+    return jsonify(sweep.get_status())
+
+
+@app.route('/api/sweep/<sweep_id>/stream', methods=['GET'])
+def stream_sweep(sweep_id):
+    """
+    Stream sweep results via Server-Sent Events as runs finish.
+
+    Every event carries the finished run's metrics (final_success_rate, auc,
+    episodes_to_threshold), progress counts and the current top entries; the
+    last event has status 'complete' and the full ranking. Supports
+    Last-Event-ID like the training stream.
+
+    Args:
+        sweep_id: Sweep UUID
+
+    Returns:
+        SSE stream of sweep results
+    """
+    sweep = trainer.get_sweep(sweep_id)
+    if sweep is None:
+        return jsonify({'error': 'Sweep not found'}), 404
+    try:
+        last_event_id = parse_last_event_id()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return stream_event_log(sweep.events, last_event_id)
+
+
+@app.route('/api/frames/<frame_hash>.png', methods=['GET'])
+def get_frame(frame_hash):
+    """
+    Serve a frame by the content hash sent in stream events.
+
+    The URL names the image content, so the response never changes: it is
+    cacheable forever, and revalidation with If-None-Match returns 304.
+
+    Args:
+        frame_hash: Content hash ('frame_hash' / 'frame_hashes' event fields)
+
+    Returns:
+        PNG image, or 404 if the hash is unknown or has been evicted
+    """
+    encoded = EnvironmentManager.get_published_frame(frame_hash)
+    if encoded is None:
+        return jsonify({'error': 'Frame not found'}), 404
+
+    response = Response(encoded.png, mimetype='image/png')
+    response.set_etag(encoded.digest)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response.make_conditional(request)
+
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Export hot-path timings and runtime gauges in the Prometheus text format.
+
+    Phases (env_step, action_selection, td_update, render, png_encode,
+    json_encode, queue_wait) are reported in total and per session.
+    Recording is switched off with RL_METRICS=0.
+
+    Returns:
+        Plain-text metrics (exposition format 0.0.4)
+    """
+    return Response(METRICS.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/frame-cache/stats', methods=['GET'])
+def get_frame_cache_stats():
+    """
+    Get frame cache hit/miss counters.
+
+    Returns:
+        JSON with hits, misses, hit_rate, size and max_size
+    """
+    return jsonify(EnvironmentManager.frame_cache.get_stats())
+
+
+@app.route('/api/sessions', methods=['GET'])
+def get_sessions():
+    """
+    List live training sessions with memory estimates.
+
+    Returns:
+        JSON with per-session info and store totals/limits
+    """
+    return jsonify({
+        'sessions': trainer.get_sessions_info(),
+        'stats': trainer.sessions.get_stats()
+    })
+
+
 @app.route('/api/reset', methods=['POST'])
 def reset_training():
     """
@@ -349,18 +1334,36 @@ def reset_training():
 
 
 if __name__ == '__main__':
+    create_app()
     print("Starting RL Playground Backend...")
     print("Server running on http://localhost:5001")
     print("\nAvailable endpoints:")
     print("  GET  /api/algorithms")
     print("  GET  /api/environments")
+    print("  POST /api/environments/maps")
     print("  GET  /api/environments/<env_name>/preview")
     print("  GET  /api/parameters/<algorithm>")
     print("  POST /api/train")
     print("  GET  /api/train/stream/<session_id>")
+    print("  POST /api/train/<session_id>/resync")
+    print("  POST /api/train/<session_id>/pause|resume|cancel")
+    print("  GET  /api/train/<session_id>/trajectories")
     print("  GET  /api/play-policy/stream/<session_id>")
+    print("  POST /api/jobs")
+    print("  GET  /api/jobs")
+    print("  GET  /api/jobs/<job_id>")
+    print("  GET  /api/jobs/<job_id>/result")
+    print("  DELETE /api/jobs/<job_id>")
+    print("  GET  /api/evaluate/<session_id>")
+    print("  POST /api/sweep")
+    print("  GET  /api/sweep/<sweep_id>")
+    print("  GET  /api/sweep/<sweep_id>/stream")
+    print("  GET  /api/frames/<frame_hash>.png")
+    print("  GET  /api/metrics")
+    print("  GET  /api/frame-cache/stats")
+    print("  GET  /api/sessions")
     print("  POST /api/reset")
-    print("\nPress Ctrl+C to stop")
+    print("\nPress Ctrl+C to stop (production: python -m serving)")
 
     # host='0.0.0.0' allows connections from outside the container (required for Docker)
     app.run(host='0.0.0.0', debug=True, port=5001, threaded=True)
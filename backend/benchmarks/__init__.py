@@ -0,0 +1,3 @@
+from .suite import BENCHMARKS, DEFAULT_TOLERANCE, run_benchmarks, compare, format_table
+
+__all__ = ['BENCHMARKS', 'DEFAULT_TOLERANCE', 'run_benchmarks', 'compare', 'format_table']
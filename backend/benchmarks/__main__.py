@@ -0,0 +1,57 @@
+"""
+Command-line entry point for the benchmark suite.
+
+Usage (from backend/):
+    python -m benchmarks                                  # run all, print table
+    python -m benchmarks --output results.json            # save results
+    python -m benchmarks --baseline baseline.json         # flag regressions (exit code 1)
+    python -m benchmarks --only q_learning_train --quick  # subset, small workloads
+"""
+
+import argparse
+import json
+import sys
+
+from .suite import BENCHMARKS, DEFAULT_TOLERANCE, run_benchmarks, compare, format_table
+
+
+def main(argv=None) -> int:
+    """
+    Run the benchmarks and optionally compare them against a baseline.
+
+    Returns:
+        Exit code: 1 if any benchmark regressed against the baseline, else 0
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Backend hot-path benchmarks')
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help=f'Benchmark names or prefixes (available: {", ".join(BENCHMARKS)})')
+    parser.add_argument('--quick', action='store_true', help='Small workloads for smoke runs')
+    parser.add_argument('--output', metavar='FILE', help='Write results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against results from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Relative slowdown flagged as a regression (default {DEFAULT_TOLERANCE})')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only, quick=args.quick)
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            comparison = compare(results, json.load(f), args.tolerance)
+        results['comparison'] = comparison
+
+    print(format_table(results, comparison))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    regressions = [row['name'] for row in comparison or [] if row['status'] == 'regression']
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
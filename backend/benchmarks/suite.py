@@ -0,0 +1,332 @@
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import numpy as np
+
+
+# Benchmarks by name; each takes quick (bool) and returns a result dict
+BENCHMARKS: Dict[str, Callable[[bool], Dict[str, Any]]] = {}
+
+# Relative slowdown tolerated before a result counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+
+def benchmark(name: str):
+    """Register a benchmark function under a name."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def best_time(function: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Time a function several times and return the fastest run.
+
+    The minimum is the least noisy estimate on a shared machine: slower runs
+    only add interference from other processes.
+
+    Args:
+        function: Function to time (called without arguments)
+        repeat: Number of timed runs
+
+    Returns:
+        Fastest run in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def result(value: float, unit: str, higher_is_better: bool = True, **details) -> Dict[str, Any]:
+    """Build a benchmark result entry."""
+    return dict(value=value, unit=unit, higher_is_better=higher_is_better, **details)
+
+
+def _train_benchmark(environment_name: str, with_callback: bool):
+    """Build a QLearning.train episodes/sec benchmark."""
+    def run(quick: bool) -> Dict[str, Any]:
+        from algorithms import QLearning
+        from environments.environment_manager import EnvironmentManager
+
+        episodes = 200 if quick else 2000
+        callback = (lambda episode, reward, learning_data, frame: None) if with_callback else None
+
+        def train():
+            env = EnvironmentManager.create_environment(environment_name, seed=0)
+            algorithm = QLearning(env, {})
+            algorithm.train(episodes, callback)
+            env.close()
+
+        seconds = best_time(train)
+        return result(episodes / seconds, 'episodes/s', episodes=episodes)
+    return run
+
+
+for _environment in ('FrozenLake-v1', 'FrozenLake-v1-NoSlip'):
+    benchmark(f'q_learning_train[{_environment}]')(_train_benchmark(_environment, False))
+    benchmark(f'q_learning_train_callback[{_environment}]')(_train_benchmark(_environment, True))
+
+
+def _batched_speedup_benchmark(agents: int):
+    """Build a BatchedQLearning vs. sequential QLearning episodes/sec benchmark."""
+    def run(quick: bool) -> Dict[str, Any]:
+        from algorithms import QLearning
+        from algorithms.batched_q_learning import BatchedQLearning
+        from environments.environment_manager import EnvironmentManager
+
+        episodes = 100 if quick else 300
+        # Sequential episodes/sec do not depend on the number of agents, so a
+        # few runs stand in for all of them
+        sequential_runs = min(agents, 8)
+
+        def batched():
+            env = EnvironmentManager.create_environment('FrozenLake-v1', seed=0)
+            BatchedQLearning(env, {'num_agents': agents}).train(episodes)
+            env.close()
+
+        def sequential():
+            for seed in range(sequential_runs):
+                env = EnvironmentManager.create_environment('FrozenLake-v1', seed=seed)
+                QLearning(env, {}).train(episodes)
+                env.close()
+
+        batched_rate = agents * episodes / best_time(batched)
+        sequential_rate = sequential_runs * episodes / best_time(sequential)
+        return result(batched_rate / sequential_rate, 'x', agents=agents, episodes=episodes,
+                      batched_episodes_per_second=batched_rate,
+                      sequential_episodes_per_second=sequential_rate)
+    return run
+
+
+for _agents in (32, 256):
+    benchmark(f'batched_q_learning_speedup[{_agents}]')(_batched_speedup_benchmark(_agents))
+
+
+@benchmark('render_frozenlake')
+def bench_render_frozenlake(quick: bool) -> Dict[str, Any]:
+    """Frames/sec of the NumPy FrozenLake renderer."""
+    from environments.environment_manager import EnvironmentManager
+
+    env = EnvironmentManager.create_environment('FrozenLake-v1', seed=0)
+    env.reset()
+    frames = 20 if quick else 200
+    seconds = best_time(lambda: [EnvironmentManager.render_frozenlake(env) for _ in range(frames)])
+    env.close()
+    return result(frames / seconds, 'frames/s', frames=frames)
+
+
+@benchmark('frame_to_base64')
+def bench_frame_to_base64(quick: bool) -> Dict[str, Any]:
+    """Frames/sec of PNG + base64 encoding of a rendered frame."""
+    from environments.environment_manager import EnvironmentManager
+
+    env = EnvironmentManager.create_environment('FrozenLake-v1', seed=0)
+    env.reset()
+    frame = EnvironmentManager.render(env)
+    env.close()
+
+    frames = 20 if quick else 200
+    seconds = best_time(lambda: [EnvironmentManager.frame_to_base64(frame) for _ in range(frames)])
+    return result(frames / seconds, 'frames/s', frames=frames, frame_shape=list(frame.shape))
+
+
+@benchmark('json_dumps_event')
+def bench_json_dumps_event(quick: bool) -> Dict[str, Any]:
+    """Serialization cost of a full training event (frame + Q-table snapshot)."""
+    from algorithms import QLearning
+    from environments.environment_manager import EnvironmentManager
+
+    env = EnvironmentManager.create_environment('FrozenLake-v1', seed=0)
+    algorithm = QLearning(env, {'q_init_strategy': 'random'})
+    env.reset()
+    event = {
+        'episode': 0,
+        'reward': 0.0,
+        'frame': EnvironmentManager.frame_to_base64(EnvironmentManager.render(env)),
+        'status': 'training',
+        'seq': 1,
+        'snapshot': True,
+        'learning_data': algorithm.get_learning_data()
+    }
+    env.close()
+
+    events = 200 if quick else 2000
+    seconds = best_time(lambda: [json.dumps(event) for _ in range(events)])
+    return result(seconds / events * 1e6, 'us/event', higher_is_better=False,
+                  event_bytes=len(json.dumps(event)))
+
+
+@benchmark('sse_training_stream')
+def bench_sse_training_stream(quick: bool) -> Dict[str, Any]:
+    """End-to-end training stream through the Flask test client."""
+    from app import create_app
+    from training.event_log import EventLog
+
+    episodes = 100 if quick else 1000
+    client = create_app().test_client()
+
+    # Record when each event enters the log, to measure delivery latency
+    appended_at: Dict[int, float] = {}
+    original_append = EventLog.append
+
+    def timed_append(self, data, sync_point=False):
+        event_id = original_append(self, data, sync_point)
+        appended_at[event_id] = time.perf_counter()
+        return event_id
+
+    latencies: List[float] = []
+    with mock.patch.object(EventLog, 'append', timed_append):
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1',
+            'parameters': {'num_episodes': episodes}
+        }).get_json()['session_id']
+
+        start = time.perf_counter()
+        response = client.get(f'/api/train/stream/{session_id}', buffered=False)
+        events = 0
+        for chunk in response.response:
+            received = time.perf_counter()
+            text = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if text.startswith('id: '):
+                event_id = int(text[4:text.index('\n')])
+                latencies.append(received - appended_at[event_id])
+                events += 1
+        seconds = time.perf_counter() - start
+        response.close()
+        client.post('/api/reset')
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    return result(
+        events / seconds,
+        'events/s',
+        events=events,
+        latency_p50_ms=statistics.median(latencies_ms),
+        latency_p95_ms=latencies_ms[int(0.95 * (len(latencies_ms) - 1))],
+        latency_max_ms=latencies_ms[-1]
+    )
+
+
+def run_benchmarks(names: Optional[List[str]] = None, quick: bool = False) -> Dict[str, Any]:
+    """
+    Run benchmarks and collect their results.
+
+    Args:
+        names: Benchmark names to run (default: all). A name also selects every
+               benchmark it is a prefix of, e.g. 'q_learning_train'.
+        quick: Use small workloads (for CI smoke runs)
+
+    Returns:
+        Dictionary with meta (platform, versions, mode) and results (name -> result)
+
+    Raises:
+        ValueError: If a name matches no benchmark
+    """
+    selected = list(BENCHMARKS)
+    if names:
+        selected = [name for name in BENCHMARKS if any(name.startswith(prefix) for prefix in names)]
+        unknown = [prefix for prefix in names if not any(name.startswith(prefix) for name in BENCHMARKS)]
+        if unknown:
+            raise ValueError(f"Unknown benchmarks {unknown}. Available benchmarks: {list(BENCHMARKS)}")
+
+    import gymnasium
+
+    results = {}
+    for name in selected:
+        # Keep the training code's debug output out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = BENCHMARKS[name](quick)
+
+    return {
+        'meta': {
+            'timestamp': time.time(),
+            'quick': quick,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'numpy': np.__version__,
+            'gymnasium': gymnasium.__version__
+        },
+        'results': results
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Compare benchmark results against a stored baseline.
+
+    Args:
+        results: Output of run_benchmarks
+        baseline: Earlier output of run_benchmarks
+        tolerance: Relative slowdown tolerated before flagging a regression
+
+    Returns:
+        One row per benchmark with name, baseline, current, speedup (current
+        relative to baseline, > 1 is faster) and status: 'ok', 'regression',
+        'improvement', 'new' (no baseline) or 'missing' (not run)
+    """
+    rows = []
+    current_results = results['results']
+    baseline_results = baseline['results']
+
+    for name in sorted(set(current_results) | set(baseline_results)):
+        current = current_results.get(name)
+        previous = baseline_results.get(name)
+        if current is None or previous is None:
+            rows.append({'name': name, 'baseline': previous and previous['value'],
+                         'current': current and current['value'], 'speedup': None,
+                         'status': 'new' if previous is None else 'missing'})
+            continue
+
+        speedup = current['value'] / previous['value']
+        if not current.get('higher_is_better', True):
+            speedup = 1 / speedup
+
+        if speedup < 1 - tolerance:
+            status = 'regression'
+        elif speedup > 1 + tolerance:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'baseline': previous['value'], 'current': current['value'],
+                     'speedup': speedup, 'status': status})
+
+    return rows
+
+
+def format_table(results: Dict[str, Any], comparison: Optional[List[Dict[str, Any]]] = None) -> str:
+    """
+    Format results (and an optional comparison) as a plain-text table.
+
+    Args:
+        results: Output of run_benchmarks
+        comparison: Output of compare
+
+    Returns:
+        Table as a string
+    """
+    rows_by_name = {row['name']: row for row in comparison or []}
+    lines = []
+    for name, entry in results['results'].items():
+        line = f"{name:50s} {entry['value']:14.1f} {entry['unit']:12s}"
+        row = rows_by_name.get(name)
+        if row is not None and row['speedup'] is not None:
+            line += f" {row['speedup']:6.2f}x  {row['status']}"
+        elif row is not None:
+            line += f"          {row['status']}"
+        lines.append(line)
+    for row in comparison or []:
+        if row['status'] == 'missing':
+            lines.append(f"{row['name']:50s} {'-':>14s} {'':12s}          missing")
+    return '\n'.join(lines)
@@ -0,0 +1,146 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Pool key: (environment name, render mode)
+PoolKey = Tuple[str, Optional[str]]
+
+
+class EnvironmentPool:
+    """
+    Small per-environment pools of pre-constructed environments.
+
+    gym.make builds the environment and its whole wrapper stack, which costs
+    far more than a reset. The pool keeps a few idle environments per
+    (name, render mode); checkout hands one out after resetting it with the
+    caller's seed (a fresh environment seeded the same way behaves
+    identically). A single background thread rebuilds spares a moment
+    later, so construction does not compete for the GIL with the request
+    that took the environment.
+
+    Checked-out environments belong to the caller and are never returned:
+    sessions change their state and render mode, so they are closed as before.
+    """
+
+    def __init__(self, factory: Callable[[str, Optional[str]], Any], size: int = 2, refill_delay: float = 0.05):
+        """
+        Initialize empty pools.
+
+        Args:
+            factory: Builds an environment from (name, render_mode)
+            size: Idle environments kept per (name, render mode); 0 disables pooling
+            refill_delay: Seconds the refill thread waits before rebuilding spares
+        """
+        self.factory = factory
+        self.size = size
+        self.refill_delay = refill_delay
+        self._idle: Dict[PoolKey, Deque[Any]] = {}
+        self._pending = set()
+        self._refills: 'queue.Queue[PoolKey]' = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def checkout(self, env_name: str, seed: Optional[int] = None, render_mode: Optional[str] = 'rgb_array'):
+        """
+        Take an environment, reset with the given seed.
+
+        Args:
+            env_name: Environment name
+            seed: Optional random seed (None keeps the environment's own entropy)
+            render_mode: Render mode of the environment
+
+        Returns:
+            Gymnasium environment instance, already reset
+        """
+        key = (env_name, render_mode)
+        with self._lock:
+            idle = self._idle.get(key)
+            env = idle.popleft() if idle else None
+            if env is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if env is None:
+            env = self.factory(env_name, render_mode)
+        env.reset(seed=seed)
+        self._schedule_refill(key)
+        return env
+
+    def warm(self, env_names: Iterable[str], render_modes: Iterable[Optional[str]]) -> None:
+        """
+        Fill the pools for the given environments synchronously (at startup).
+
+        Args:
+            env_names: Environment names
+            render_modes: Render modes to pool for each name
+        """
+        render_modes = list(render_modes)
+        for env_name in env_names:
+            for render_mode in render_modes:
+                self._refill((env_name, render_mode))
+
+    def _schedule_refill(self, key: PoolKey) -> None:
+        """Queue a pool for topping up by the refill thread, unless it already is."""
+        with self._lock:
+            if self.size == 0 or key in self._pending:
+                return
+            self._pending.add(key)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._refill_loop, daemon=True)
+                self._worker.start()
+        self._refills.put(key)
+
+    def _refill_loop(self) -> None:
+        """Refill thread: top up queued pools, one at a time."""
+        while True:
+            key = self._refills.get()
+            time.sleep(self.refill_delay)
+            with self._lock:
+                self._pending.discard(key)
+            try:
+                self._refill(key)
+            except Exception:
+                logger.exception("Environment pool refill for %s failed", key)
+
+    def _refill(self, key: PoolKey) -> None:
+        """Build environments until the pool for key holds size idle ones."""
+        while True:
+            with self._lock:
+                idle = self._idle.setdefault(key, deque())
+                if len(idle) >= self.size:
+                    return
+            env = self.factory(*key)
+            with self._lock:
+                idle.append(env)
+
+    def clear(self) -> None:
+        """Close and drop all idle environments."""
+        with self._lock:
+            idle_envs = [env for idle in self._idle.values() for env in idle]
+            self._idle.clear()
+        for env in idle_envs:
+            env.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return pool counters.
+
+        Returns:
+            Dictionary with size, idle (per 'name/render_mode'), hits and misses
+        """
+        with self._lock:
+            return {
+                'size': self.size,
+                'idle': {f'{name}/{mode}': len(idle) for (name, mode), idle in self._idle.items()},
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -1,9 +1,33 @@
 import gymnasium as gym
+from gymnasium.envs.toy_text.frozen_lake import FrozenLakeEnv, generate_random_map
 import numpy as np
 from PIL import Image
 import io
+import re
 import base64
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from .tabular_model import TabularModel
+from .frame_cache import EncodedFrame, FrameCache
+from .lru_cache import LRUCache
+from .env_pool import EnvironmentPool
+from .frozenlake_renderer import FrozenLakeRenderer
+from monitoring import METRICS
+
+
+# Largest FrozenLake map side (rows or columns)
+MAX_MAP_SIZE = 64
+
+# Frozen-tile probability range of generated maps; sparser maps rarely have a path to the goal
+MIN_FROZEN_PROB = 0.7
+
+# Step limit of episodes on maps without a Gymnasium default
+DEFAULT_MAX_EPISODE_STEPS = 100
+
+# Generated map names: FrozenLake-Random-<size>x<size>[-p<frozen prob>]-s<seed>[-NoSlip]
+RANDOM_MAP_PATTERN = re.compile(r'^FrozenLake-Random-(\d+)x(\d+)(?:-p(\d*\.?\d+))?-s(\d+)(-NoSlip)?$')
+
+# Custom map names: FrozenLake-Custom-<rows joined by _>[-NoSlip], e.g. FrozenLake-Custom-SF_HG
+CUSTOM_MAP_PATTERN = re.compile(r'^FrozenLake-Custom-([A-Za-z_]+?)(-NoSlip)?$')
 
 
 class EnvironmentManager:
@@ -18,13 +42,42 @@ class EnvironmentManager:
     # Future: Add more environments
     SUPPORTED_ENVIRONMENTS = [
         'FrozenLake-v1-NoSlip',
-        'FrozenLake-v1'
+        'FrozenLake-v1',
+        'FrozenLake8x8-v1-NoSlip',
+        'FrozenLake8x8-v1'
     ]
 
+    # Besides these, generated and custom FrozenLake maps are addressed by
+    # self-describing names (see RANDOM_MAP_PATTERN, CUSTOM_MAP_PATTERN and
+    # random_map_name / custom_map_name), so every component that rebuilds
+    # environments from a name (workers, checkpoints, sweeps) supports them.
+
+    # Compiled tabular models, keyed by environment id, constructor kwargs and map
+    # (bounded: every generated or custom map compiles its own, up to 64x64 states)
+    _compiled_models = LRUCache(max_size=32)
+
+    # Encoded frames, keyed by environment, map layout and agent state
+    frame_cache = FrameCache()
+
+    # Encoded frames by content hash, served by /api/frames/<hash>.png
+    frame_store = FrameCache(max_size=1024)
+
+    # Pre-constructed environments handed out by checkout_environment
+    env_pool = EnvironmentPool(lambda env_name, render_mode: EnvironmentManager.build_environment(env_name, render_mode))
+
+    # Encoded initial-state preview per environment name
+    _previews = FrameCache(max_size=256)
+
+    # Generated map layouts, keyed by (size, frozen probability, seed)
+    _generated_maps = LRUCache(max_size=64)
+
+    # Vectorized FrozenLake renderers, keyed by map layout
+    _renderers = LRUCache(max_size=32)
+
     @staticmethod
     def get_available_environments() -> List[str]:
         """
-        Get list of supported environments.
+        Get list of supported environments (generated and custom maps not included).
 
         Returns:
             List of environment names
@@ -32,13 +85,42 @@ class EnvironmentManager:
         return EnvironmentManager.SUPPORTED_ENVIRONMENTS
 
     @staticmethod
-    def create_environment(env_name: str, seed: Optional[int] = None):
+    def create_environment(env_name: str, seed: Optional[int] = None, render_mode: Optional[str] = 'rgb_array'):
         """
         Create a Gymnasium environment with rgb_array render mode.
 
         Args:
-            env_name: Name of the environment (must be in SUPPORTED_ENVIRONMENTS)
+            env_name: Supported, generated or custom environment name
+            seed: Optional random seed for reproducibility
+            render_mode: Render mode, or None for headless training (rendering
+                         can still be enabled on demand with render())
+
+        Returns:
+            Gymnasium environment instance
+
+        Raises:
+            ValueError: If environment name is not supported
+        """
+        env = EnvironmentManager.build_environment(env_name, render_mode)
+
+        # Set seed if provided
+        if seed is not None:
+            env.reset(seed=seed)
+
+        return env
+
+    @staticmethod
+    def checkout_environment(env_name: str, seed: Optional[int] = None, render_mode: Optional[str] = 'rgb_array'):
+        """
+        Take a pre-constructed environment from the pool, reset with the seed.
+
+        Behaves like create_environment (the environment is always reset)
+        without paying for gym.make when the pool has a spare.
+
+        Args:
+            env_name: Supported, generated or custom environment name
             seed: Optional random seed for reproducibility
+            render_mode: Render mode, or None for headless training
 
         Returns:
             Gymnasium environment instance
@@ -47,93 +129,375 @@ class EnvironmentManager:
             ValueError: If environment name is not supported
         """
         if env_name not in EnvironmentManager.SUPPORTED_ENVIRONMENTS:
+            # Generated and custom maps are too many to keep spares for
+            env = EnvironmentManager.build_environment(env_name, render_mode)
+            env.reset(seed=seed)
+            return env
+        return EnvironmentManager.env_pool.checkout(env_name, seed, render_mode)
+
+    @staticmethod
+    def build_environment(env_name: str, render_mode: Optional[str] = 'rgb_array'):
+        """
+        Construct a Gymnasium environment without resetting it.
+
+        Args:
+            env_name: Supported, generated or custom environment name
+            render_mode: Render mode, or None for headless training
+
+        Returns:
+            Gymnasium environment instance
+
+        Raises:
+            ValueError: If environment name is not supported
+        """
+        kwargs = EnvironmentManager.frozenlake_kwargs(env_name)
+        if kwargs is None:
             raise ValueError(
                 f"Environment '{env_name}' not supported. "
-                f"Available environments: {EnvironmentManager.SUPPORTED_ENVIRONMENTS}"
+                f"Available environments: {EnvironmentManager.SUPPORTED_ENVIRONMENTS} "
+                f"and generated or custom FrozenLake maps"
             )
 
-        # Handle FrozenLake variants
-        if env_name == 'FrozenLake-v1-NoSlip':
-            # Non-slippery version (deterministic)
-            env = gym.make('FrozenLake-v1', render_mode='rgb_array', is_slippery=False)
-        elif env_name == 'FrozenLake-v1':
-            # Standard slippery version (stochastic)
-            env = gym.make('FrozenLake-v1', render_mode='rgb_array', is_slippery=True)
-        else:
-            # Default: create environment with rgb_array rendering
-            env = gym.make(env_name, render_mode='rgb_array')
+        # All FrozenLake variants are FrozenLake-v1 with a map, slipperiness and step limit
+        return gym.make('FrozenLake-v1', render_mode=render_mode, **kwargs)
 
-        # Set seed if provided
-        if seed is not None:
-            env.reset(seed=seed)
+    @staticmethod
+    def frozenlake_kwargs(env_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Translate a FrozenLake environment name into gym.make arguments.
 
-        return env
+        Args:
+            env_name: Supported, generated or custom FrozenLake map name
+
+        Returns:
+            Keyword arguments for gym.make('FrozenLake-v1', ...) (map, is_slippery,
+            max_episode_steps), or None if the name is not a FrozenLake map
+
+        Raises:
+            ValueError: If a generated or custom map name describes an invalid map
+        """
+        if env_name in EnvironmentManager.SUPPORTED_ENVIRONMENTS:
+            slippery = not env_name.endswith('-NoSlip')
+            if env_name.startswith('FrozenLake8x8'):
+                return {'map_name': '8x8', 'is_slippery': slippery, 'max_episode_steps': 200}
+            return {'map_name': '4x4', 'is_slippery': slippery, 'max_episode_steps': 100}
+
+        match = RANDOM_MAP_PATTERN.match(env_name)
+        if match:
+            rows, cols, frozen_prob, seed, no_slip = match.groups()
+            if rows != cols:
+                raise ValueError(f"Generated maps are square, got {rows}x{cols}")
+            desc = EnvironmentManager.generate_map(int(rows), float(frozen_prob or 0.8), int(seed))
+            return EnvironmentManager._map_kwargs(desc, no_slip is None)
+
+        match = CUSTOM_MAP_PATTERN.match(env_name)
+        if match:
+            rows, no_slip = match.groups()
+            desc = rows.split('_')
+            EnvironmentManager.validate_map(desc)
+            return EnvironmentManager._map_kwargs(desc, no_slip is None)
+
+        return None
 
     @staticmethod
-    def render_frozenlake(env) -> np.ndarray:
+    def _map_kwargs(desc: List[str], slippery: bool) -> Dict[str, Any]:
+        """gym.make arguments for a map layout; the step limit grows with the map."""
+        max_steps = max(DEFAULT_MAX_EPISODE_STEPS, 8 * (len(desc) + len(desc[0])))
+        return {'desc': desc, 'is_slippery': slippery, 'max_episode_steps': max_steps}
+
+    @staticmethod
+    def generate_map(size: int, frozen_prob: float = 0.8, seed: int = 0) -> List[str]:
         """
-        Manually render FrozenLake environment without pygame.
+        Generate a random FrozenLake map with a path from start to goal.
+
+        Maps are deterministic in (size, frozen_prob, seed) and cached.
 
         Args:
-            env: FrozenLake environment instance
+            size: Side length (2 to MAX_MAP_SIZE)
+            frozen_prob: Probability of a tile being frozen (MIN_FROZEN_PROB to 1)
+            seed: Seed of the layout
 
         Returns:
-            RGB numpy array representing the current state
+            Map rows, e.g. ['SF', 'FG']
+
+        Raises:
+            ValueError: If size or frozen_prob is out of range
+        """
+        if not 2 <= size <= MAX_MAP_SIZE:
+            raise ValueError(f"Map size must be between 2 and {MAX_MAP_SIZE}, got {size}")
+        if not MIN_FROZEN_PROB <= frozen_prob <= 1:
+            raise ValueError(f"frozen_prob must be between {MIN_FROZEN_PROB} and 1, got {frozen_prob}")
+
+        key = (size, frozen_prob, seed)
+        desc = EnvironmentManager._generated_maps.get(key)
+        if desc is None:
+            desc = generate_random_map(size=size, p=frozen_prob, seed=seed)
+            EnvironmentManager._generated_maps.put(key, desc)
+        return desc
+
+    @staticmethod
+    def validate_map(desc: List[str]) -> None:
+        """
+        Check a custom FrozenLake map layout.
+
+        Args:
+            desc: Map rows of S (start), F (frozen), H (hole) and G (goal)
+
+        Raises:
+            ValueError: If the map is not rectangular, too large, uses unknown
+                        tiles, or does not have exactly one start and a goal
+        """
+        if not desc or not desc[0]:
+            raise ValueError("Map must have at least one row and column")
+        if len(desc) > MAX_MAP_SIZE or any(len(row) > MAX_MAP_SIZE for row in desc):
+            raise ValueError(f"Maps are at most {MAX_MAP_SIZE}x{MAX_MAP_SIZE}")
+        if any(len(row) != len(desc[0]) for row in desc):
+            raise ValueError("All map rows must have the same length")
+        tiles = ''.join(desc)
+        if set(tiles) - set('SFHG'):
+            raise ValueError("Map tiles must be S, F, H or G")
+        if tiles.count('S') != 1 or 'G' not in tiles:
+            raise ValueError("Map must have exactly one start (S) and at least one goal (G)")
+
+    @staticmethod
+    def random_map_name(size: int, frozen_prob: float = 0.8, seed: int = 0, slippery: bool = True) -> str:
+        """
+        Build the environment name of a generated map (validating the arguments).
+
+        Args:
+            size: Side length (2 to MAX_MAP_SIZE)
+            frozen_prob: Probability of a tile being frozen
+            seed: Seed of the layout
+            slippery: Slippery (stochastic) transitions
+
+        Returns:
+            Environment name, e.g. 'FrozenLake-Random-16x16-p0.8-s3'
+
+        Raises:
+            ValueError: If the arguments are out of range
+        """
+        EnvironmentManager.generate_map(size, frozen_prob, seed)
+        suffix = '' if slippery else '-NoSlip'
+        return f"FrozenLake-Random-{size}x{size}-p{float(frozen_prob):g}-s{seed}{suffix}"
+
+    @staticmethod
+    def custom_map_name(desc: List[str], slippery: bool = True) -> str:
+        """
+        Build the environment name of a custom map (validating the layout).
+
+        Args:
+            desc: Map rows of S, F, H and G
+            slippery: Slippery (stochastic) transitions
+
+        Returns:
+            Environment name, e.g. 'FrozenLake-Custom-SF_HG'
+
+        Raises:
+            ValueError: If the map is invalid
+        """
+        EnvironmentManager.validate_map(desc)
+        suffix = '' if slippery else '-NoSlip'
+        return f"FrozenLake-Custom-{'_'.join(desc)}{suffix}"
+
+    @staticmethod
+    def get_preview(env_name: str) -> EncodedFrame:
+        """
+        Return the encoded initial-state frame of an environment.
+
+        The preview never changes, so it is rendered once per environment
+        (see warm_previews) and served from memory afterwards.
+
+        Args:
+            env_name: Supported, generated or custom environment name
+
+        Returns:
+            EncodedFrame of the environment after reset
+
+        Raises:
+            ValueError: If environment name is not supported
         """
-        # Get current state
-        state = env.unwrapped.s
+        preview = EnvironmentManager._previews.get(env_name)
+        if preview is None:
+            env = EnvironmentManager.create_environment(env_name)
+            try:
+                env.reset()
+                preview = EncodedFrame.from_png(EnvironmentManager.frame_to_png(EnvironmentManager.render(env)))
+            finally:
+                env.close()
+            EnvironmentManager._previews.put(env_name, preview)
+        return preview
 
-        # FrozenLake is 4x4 grid
-        grid_size = 4
-        cell_size = 100  # pixels per cell
-        img_size = grid_size * cell_size
+    @staticmethod
+    def warm_previews() -> None:
+        """Render the previews of all supported environments ahead of the first request."""
+        for env_name in EnvironmentManager.SUPPORTED_ENVIRONMENTS:
+            EnvironmentManager.get_preview(env_name)
+
+    @staticmethod
+    def compile_environment(env) -> TabularModel:
+        """
+        Compile a discrete environment's model (env.unwrapped.P) into dense arrays.
+
+        Works for any toy-text environment (FrozenLake variants and custom maps,
+        Taxi, CliffWalking, ...). Models are cached per environment id,
+        constructor arguments and map layout, so sessions on the same
+        environment share one compiled model; the least recently used models
+        are dropped beyond _compiled_models.max_size (sessions keep theirs).
+
+        Args:
+            env: Gymnasium environment instance
+
+        Returns:
+            TabularModel with step/reset driven by a np.random.Generator
+
+        Raises:
+            ValueError: If the environment has no tabular model
+        """
+        key = EnvironmentManager._model_key(env)
+        model = EnvironmentManager._compiled_models.get(key)
+        if model is None:
+            model = TabularModel.from_env(env)
+            EnvironmentManager._compiled_models.put(key, model)
+        return model
+
+    @staticmethod
+    def _model_key(env) -> Tuple:
+        """
+        Build the cache key identifying an environment's dynamics.
+
+        Args:
+            env: Gymnasium environment instance
+
+        Returns:
+            Hashable tuple of (env id, constructor kwargs, map layout)
+        """
+        spec = env.spec
+        env_id = spec.id if spec is not None else type(env.unwrapped).__name__
+        kwargs = tuple(sorted(
+            (name, repr(value))
+            for name, value in (spec.kwargs if spec is not None else {}).items()
+            if name != 'render_mode'
+        ))
+        desc = getattr(env.unwrapped, 'desc', None)
+        layout = np.asarray(desc).tobytes() if desc is not None else None
+        return (env_id, kwargs, layout)
+
+    @staticmethod
+    def set_state(env, state: int, last_action: Optional[int] = None) -> None:
+        """
+        Move a toy-text environment to an arbitrary state without stepping it.
+
+        Used by algorithms that step a compiled TabularModel instead of the
+        environment itself, so that frames rendered later show the right state.
+
+        Args:
+            env: Gymnasium environment instance
+            state: State index
+            last_action: Last action taken (sets the agent sprite direction)
+        """
+        unwrapped = env.unwrapped
+        unwrapped.s = int(state)
+        if last_action is not None:
+            unwrapped.lastaction = int(last_action)
 
-        # Create RGB image
-        img = np.ones((img_size, img_size, 3), dtype=np.uint8) * 255
+    @staticmethod
+    def render(env) -> np.ndarray:
+        """
+        Render the environment's current state as an RGB frame.
 
-        # Define colors
-        colors = {
-            'S': (135, 206, 250),  # Light blue for start
-            'F': (255, 255, 255),  # White for frozen
-            'H': (100, 100, 100),  # Dark gray for hole
-            'G': (50, 205, 50),    # Green for goal
-            'agent': (255, 0, 0)   # Red for agent
-        }
+        FrozenLake maps of any size are drawn by the vectorized renderer (see
+        render_frozenlake). Other environments created headless
+        (render_mode=None) are switched to rgb_array on the first call, so
+        rendering only costs anything once a consumer actually asks for a frame.
 
-        # Get the map from environment
-        desc = env.unwrapped.desc.astype(str)
+        Args:
+            env: Gymnasium environment instance
 
-        # Draw grid
-        for row in range(grid_size):
-            for col in range(grid_size):
-                cell_type = desc[row, col]
-                color = colors.get(cell_type, (255, 255, 255))
+        Returns:
+            RGB numpy array
+        """
+        unwrapped = env.unwrapped
+        with METRICS.timer('render'):
+            if isinstance(unwrapped, FrozenLakeEnv):
+                return EnvironmentManager.render_frozenlake(env)
+            if unwrapped.render_mode is None:
+                unwrapped.render_mode = 'rgb_array'
+            return unwrapped.render()
 
-                y1 = row * cell_size
-                y2 = (row + 1) * cell_size
-                x1 = col * cell_size
-                x2 = (col + 1) * cell_size
+    @staticmethod
+    def render_state(env, state: int, last_action: Optional[int] = None) -> np.ndarray:
+        """
+        Render a toy-text environment at an arbitrary state.
 
-                img[y1:y2, x1:x2] = color
+        Args:
+            env: Gymnasium environment instance
+            state: State index to display
+            last_action: Last action taken (sets the agent sprite direction)
 
-                # Draw grid lines
-                img[y1:y1+2, x1:x2] = (0, 0, 0)  # Top border
-                img[y1:y2, x1:x1+2] = (0, 0, 0)  # Left border
+        Returns:
+            RGB numpy array
+        """
+        EnvironmentManager.set_state(env, state, last_action)
+        return EnvironmentManager.render(env)
 
-        # Draw agent position
-        agent_row = state // grid_size
-        agent_col = state % grid_size
-        agent_y = agent_row * cell_size + cell_size // 2
-        agent_x = agent_col * cell_size + cell_size // 2
-        agent_radius = cell_size // 3
+    @staticmethod
+    def render_frozenlake(env) -> np.ndarray:
+        """
+        Render a FrozenLake environment of any map size without pygame.
 
-        # Draw agent as circle (simple implementation)
-        for y in range(max(0, agent_y - agent_radius), min(img_size, agent_y + agent_radius)):
-            for x in range(max(0, agent_x - agent_radius), min(img_size, agent_x + agent_radius)):
-                if (x - agent_x) ** 2 + (y - agent_y) ** 2 <= agent_radius ** 2:
-                    img[y, x] = colors['agent']
+        Uses a FrozenLakeRenderer per map layout (cached), so a frame costs a
+        copy of the precomputed background plus one agent cell, and frames of
+        large maps are capped at 512 pixels.
 
-        return img
+        Args:
+            env: FrozenLake environment instance
+
+        Returns:
+            RGB numpy array representing the current state
+        """
+        unwrapped = env.unwrapped
+        desc = np.asarray(unwrapped.desc)
+        key = (desc.shape, desc.tobytes())
+        renderer = EnvironmentManager._renderers.get(key)
+        if renderer is None:
+            renderer = FrozenLakeRenderer(desc)
+            EnvironmentManager._renderers.put(key, renderer)
+        return renderer.render(unwrapped.s)
+
+    @staticmethod
+    def max_episode_steps(env) -> int:
+        """
+        Return the step limit of an environment's episodes.
+
+        Args:
+            env: Gymnasium environment instance
+
+        Returns:
+            The registered (or map-dependent) limit, DEFAULT_MAX_EPISODE_STEPS if none
+        """
+        spec = env.spec
+        return (spec.max_episode_steps if spec is not None else None) or DEFAULT_MAX_EPISODE_STEPS
+
+    @staticmethod
+    def frame_to_png(frame: np.ndarray) -> bytes:
+        """
+        Convert numpy RGB array to PNG bytes.
+
+        Args:
+            frame: Numpy array of shape (height, width, 3) with RGB values
+
+        Returns:
+            PNG-encoded image
+        """
+        with METRICS.timer('png_encode'):
+            # Convert numpy array to PIL Image
+            image = Image.fromarray(frame.astype(np.uint8))
+
+            # Save to bytes buffer as PNG
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG')
+
+        return buffer.getvalue()
 
     @staticmethod
     def frame_to_base64(frame: np.ndarray) -> str:
@@ -146,28 +510,109 @@ class EnvironmentManager:
         Returns:
             Base64-encoded PNG string (without data URI prefix)
         """
-        # Convert numpy array to PIL Image
-        image = Image.fromarray(frame.astype(np.uint8))
+        return base64.b64encode(EnvironmentManager.frame_to_png(frame)).decode('utf-8')
 
-        # Save to bytes buffer as PNG
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        buffer.seek(0)
+    @staticmethod
+    def frame_key(env) -> Tuple:
+        """
+        Build the cache key identifying the frame an environment would render.
 
-        # Encode to base64
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
+        FrozenLake frames are fully determined by the environment and map and
+        the agent state: the vectorized renderer draws the same agent sprite
+        whatever the last action was, and terminal overlays such as the
+        cracked hole are a function of the state.
 
-        return img_base64
+        Args:
+            env: Gymnasium environment instance
+
+        Returns:
+            Hashable frame key
+        """
+        return EnvironmentManager._model_key(env), int(env.unwrapped.s)
+
+    @staticmethod
+    def get_encoded_frame(env, frame: Optional[np.ndarray] = None) -> EncodedFrame:
+        """
+        Return the encoded frame for the environment's current state, using the frame cache.
+
+        On a hit this is a dictionary lookup. On a miss the given frame (or a
+        fresh render if none is given) is encoded and stored.
+
+        Args:
+            env: Gymnasium environment instance, in the state the frame shows
+            frame: Optional already-rendered frame for the current state
+
+        Returns:
+            EncodedFrame (content hash, PNG bytes and base64 string)
+        """
+        key = EnvironmentManager.frame_key(env)
+        encoded = EnvironmentManager.frame_cache.get(key)
+        if encoded is None:
+            if frame is None:
+                frame = EnvironmentManager.render(env)
+            encoded = EncodedFrame.from_png(EnvironmentManager.frame_to_png(frame))
+            EnvironmentManager.frame_cache.put(key, encoded)
+        return encoded
+
+    @staticmethod
+    def get_frame_base64(env, frame: Optional[np.ndarray] = None) -> str:
+        """
+        Return the base64 PNG for the environment's current state, using the frame cache.
+
+        Args:
+            env: Gymnasium environment instance, in the state the frame shows
+            frame: Optional already-rendered frame for the current state
+
+        Returns:
+            Base64-encoded PNG string (without data URI prefix)
+        """
+        return EnvironmentManager.get_encoded_frame(env, frame).base64
+
+    @staticmethod
+    def publish_frame(encoded: EncodedFrame) -> str:
+        """
+        Make an encoded frame fetchable by its content hash.
+
+        Called whenever a hash is sent to a client, so the frame is in the
+        (bounded, least recently used) store when the client requests it.
+
+        Args:
+            encoded: Encoded frame
+
+        Returns:
+            The frame's content hash
+        """
+        EnvironmentManager.frame_store.put(encoded.digest, encoded)
+        return encoded.digest
+
+    @staticmethod
+    def get_published_frame(digest: str) -> Optional[EncodedFrame]:
+        """
+        Look up a published frame by content hash.
+
+        Args:
+            digest: Content hash from a stream event
+
+        Returns:
+            EncodedFrame or None if unknown or evicted
+        """
+        return EnvironmentManager.frame_store.get(digest)
 
     @staticmethod
     def validate_environment_name(env_name: str) -> bool:
         """
         Check if environment name is valid.
 
+        Accepts the supported environments and valid generated or custom
+        FrozenLake map names.
+
         Args:
             env_name: Environment name to validate
 
         Returns:
             True if valid, False otherwise
         """
-        return env_name in EnvironmentManager.SUPPORTED_ENVIRONMENTS
+        try:
+            return EnvironmentManager.frozenlake_kwargs(env_name) is not None
+        except ValueError:
+            return False
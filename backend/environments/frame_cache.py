@@ -0,0 +1,37 @@
+import base64
+import hashlib
+from typing import NamedTuple
+
+from .lru_cache import LRUCache
+
+
+class EncodedFrame(NamedTuple):
+    """A PNG-encoded frame with its content hash and base64 form."""
+
+    digest: str
+    png: bytes
+    base64: str
+
+    @classmethod
+    def from_png(cls, png: bytes) -> 'EncodedFrame':
+        """
+        Wrap PNG bytes, computing the content hash and base64 string.
+
+        Args:
+            png: PNG-encoded image
+
+        Returns:
+            EncodedFrame whose digest identifies the image content
+        """
+        return cls(hashlib.blake2b(png, digest_size=16).hexdigest(), png, base64.b64encode(png).decode('ascii'))
+
+
+class FrameCache(LRUCache):
+    """
+    Bounded, thread-safe LRU cache for encoded frames.
+
+    Toy-text environments only have a handful of distinct frames (one per
+    agent state), so the same PNG gets encoded over and over during training
+    and playback. The cache maps a frame key (or a content hash) to its
+    EncodedFrame and counts hits and misses.
+    """
@@ -0,0 +1,197 @@
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+
+# Longest side of a rendered frame in pixels; cells shrink as maps grow
+MAX_FRAME_SIZE = 512
+
+# Cell size the sprite art is drawn for (and the largest cell rendered)
+NATIVE_CELL_SIZE = 64
+
+# Cell outline, as drawn by Gymnasium's renderer
+BORDER_COLOR = (180, 200, 230)
+
+# Flat colors used when Gymnasium's sprite images are not available
+FALLBACK_COLORS = {
+    'S': (135, 206, 250),
+    'F': (255, 255, 255),
+    'H': (100, 100, 100),
+    'G': (50, 205, 50),
+    'agent': (255, 0, 0)
+}
+
+# Tile kinds; every map cell is one of them
+TILE_HOLE, TILE_ICE, TILE_CRACK_A, TILE_CRACK_B, TILE_START, TILE_GOAL = range(6)
+
+
+def _sprite_directory() -> Optional[str]:
+    """Directory of Gymnasium's toy-text sprite images, if installed."""
+    try:
+        from gymnasium.envs.toy_text import frozen_lake
+    except ImportError:
+        return None
+    directory = os.path.join(os.path.dirname(frozen_lake.__file__), 'img')
+    return directory if os.path.isdir(directory) else None
+
+
+def _load_sprite(name: str, size: Tuple[int, int]) -> Optional[np.ndarray]:
+    """
+    Load a sprite image scaled to size (width, height).
+
+    Returns:
+        Float RGBA array of shape (height, width, 4) in [0, 1], or None if missing
+    """
+    directory = _sprite_directory()
+    path = os.path.join(directory, name) if directory else None
+    if path is None or not os.path.exists(path):
+        return None
+    image = Image.open(path).convert('RGBA').resize(size, Image.NEAREST)
+    return np.asarray(image, dtype=np.float32) / 255.0
+
+
+def _blend(cell: np.ndarray, sprite: Optional[np.ndarray], x: int, y: int) -> None:
+    """Alpha-blend an RGBA sprite onto a float RGB cell at (x, y), in place."""
+    if sprite is None:
+        return
+    height, width = sprite.shape[:2]
+    alpha = sprite[..., 3:]
+    region = cell[y:y + height, x:x + width]
+    region[:] = region * (1.0 - alpha) + sprite[..., :3] * alpha
+
+
+class FrozenLakeRenderer:
+    """
+    NumPy renderer for FrozenLake maps of any size.
+
+    Gymnasium's renderer blits every tile of the map for every frame, so its
+    cost grows with the map. This renderer composes the static map once
+    (tile sprites placed with array reshapes) and precomputes, for every tile
+    kind, the cell with the agent alpha-blended onto it. A frame is then a
+    copy of the background plus one cell assignment, so its cost depends only
+    on the output resolution, which is capped at max_frame_size.
+
+    The look follows Gymnasium's sprites (ice, holes, cracks, start letter,
+    goal flag, cell outlines; the agent is hidden when it falls into a hole).
+    """
+
+    def __init__(self, desc: np.ndarray, max_frame_size: int = MAX_FRAME_SIZE):
+        """
+        Precompute the background and agent cells of a map.
+
+        Args:
+            desc: Map as a (rows, cols) array of b'S', b'F', b'H', b'G'
+            max_frame_size: Longest side of rendered frames in pixels
+        """
+        desc = np.asarray(desc).astype(str)
+        self.nrow, self.ncol = desc.shape
+        self.cell_size = max(1, min(NATIVE_CELL_SIZE, max_frame_size // max(self.nrow, self.ncol)))
+
+        # Tile kind per cell; cracks are scattered deterministically by position, like Gymnasium
+        rows, cols = np.indices(desc.shape)
+        crack = (cols * 3 + rows * 5) % 7
+        self.tile_kinds = np.select(
+            [desc == 'H', desc == 'S', desc == 'G', crack == 0, crack == 1],
+            [TILE_HOLE, TILE_START, TILE_GOAL, TILE_CRACK_A, TILE_CRACK_B],
+            default=TILE_ICE
+        )
+
+        tiles, agent_tiles = self._build_tiles()
+        self.agent_tiles = agent_tiles
+
+        # (rows, cols, cell, cell, 3) -> (rows * cell, cols * cell, 3)
+        size = self.cell_size
+        self.background = np.ascontiguousarray(
+            tiles[self.tile_kinds].transpose(0, 2, 1, 3, 4).reshape(self.nrow * size, self.ncol * size, 3)
+        )
+
+    def _build_tiles(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compose one cell image per tile kind, without and with the agent.
+
+        Returns:
+            (tiles, agent_tiles), both uint8 arrays of shape (kinds, cell, cell, 3)
+        """
+        size = self.cell_size
+        scale = size / NATIVE_CELL_SIZE
+
+        def overlay(name, native_size):
+            """Load an overlay sprite keeping its proportions (art is drawn for 64 px cells)."""
+            width, height = (max(1, round(native_size[0] * scale)), max(1, round(native_size[1] * scale)))
+            return _load_sprite(name, (width, height))
+
+        ice = _load_sprite('tile_ice.png', (size, size))
+        hole = _load_sprite('tile_hole.png', (size, size))
+        cracks = [_load_sprite('tile_ice_crack_a.png', (size, size)), _load_sprite('tile_ice_crack_b.png', (size, size))]
+        agent = overlay('agent.png', (40, 36))
+        flag = overlay('goal_flag.png', (24, 32))
+        letter_s = overlay('letter_s.png', (12, 20))
+        letter_g = overlay('letter_g.png', (12, 20))
+        margin = round(size * 0.06)
+
+        def base(sprite, fallback):
+            cell = np.empty((size, size, 3), dtype=np.float32)
+            if sprite is None:
+                cell[:] = np.array(FALLBACK_COLORS[fallback], dtype=np.float32) / 255.0
+            else:
+                cell[:] = sprite[..., :3]
+            return cell
+
+        def corner(cell, sprite):
+            if sprite is not None and margin + sprite.shape[1] <= size and margin + sprite.shape[0] <= size:
+                _blend(cell, sprite, margin, margin)
+
+        def centered(cell, sprite, fallback=None):
+            if sprite is None:
+                if fallback is not None:
+                    # Flat disc when the sprite art is missing
+                    yy, xx = np.ogrid[:size, :size]
+                    disc = (yy - size / 2 + 0.5) ** 2 + (xx - size / 2 + 0.5) ** 2 <= (size / 3) ** 2
+                    cell[disc] = np.array(FALLBACK_COLORS[fallback], dtype=np.float32) / 255.0
+                return
+            height, width = sprite.shape[:2]
+            _blend(cell, sprite, max(0, (size - width) // 2), max(0, (size - height) // 2))
+
+        tiles = [base(hole, 'H'), base(ice, 'F'), base(ice, 'F'), base(ice, 'F'), base(ice, 'S'), base(ice, 'G')]
+        _blend(tiles[TILE_CRACK_A], cracks[0], 0, 0)
+        _blend(tiles[TILE_CRACK_B], cracks[1], 0, 0)
+        corner(tiles[TILE_START], letter_s)
+        if flag is not None and flag.shape[0] + round(size * 0.12) <= size:
+            _blend(tiles[TILE_GOAL], flag, max(0, (size - flag.shape[1]) // 2),
+                   size - flag.shape[0] - round(size * 0.12))
+        corner(tiles[TILE_GOAL], letter_g)
+
+        border = np.array(BORDER_COLOR, dtype=np.float32) / 255.0
+        for cell in tiles:
+            cell[0, :] = cell[-1, :] = border
+            cell[:, 0] = cell[:, -1] = border
+
+        agent_tiles = []
+        for kind, cell in enumerate(tiles):
+            with_agent = cell.copy()
+            if kind != TILE_HOLE:
+                centered(with_agent, agent, fallback='agent')
+            agent_tiles.append(with_agent)
+
+        def to_uint8(cells):
+            return np.round(np.stack(cells) * 255.0).astype(np.uint8)
+
+        return to_uint8(tiles), to_uint8(agent_tiles)
+
+    def render(self, state: int) -> np.ndarray:
+        """
+        Render the map with the agent in a state.
+
+        Args:
+            state: Agent state index (row * ncol + col)
+
+        Returns:
+            RGB uint8 array of shape (rows * cell, cols * cell, 3)
+        """
+        row, col = divmod(int(state), self.ncol)
+        size = self.cell_size
+        frame = self.background.copy()
+        frame[row * size:(row + 1) * size, col * size:(col + 1) * size] = self.agent_tiles[self.tile_kinds[row, col]]
+        return frame
@@ -0,0 +1,306 @@
+import numpy as np
+from bisect import bisect_right
+from typing import Dict, Optional, Tuple
+
+
+class TabularModel:
+    """
+    Dense, array-based copy of a discrete environment's transition model.
+
+    Built from env.unwrapped.P of toy-text environments (FrozenLake, Taxi,
+    CliffWalking, ...). Each (state, action) pair has up to K outcomes, stored
+    in padded (S, A, K) arrays. Stepping only needs a random draw and an array
+    lookup, so it bypasses the gym.make wrapper stack and the environment's
+    Python step() entirely.
+
+    All randomness comes from the np.random.Generator passed to reset/step.
+    """
+
+    def __init__(
+        self,
+        transition_probs: np.ndarray,
+        next_states: np.ndarray,
+        rewards: np.ndarray,
+        terminals: np.ndarray,
+        initial_distribution: np.ndarray,
+        max_episode_steps: Optional[int] = None
+    ):
+        """
+        Initialize the model from dense arrays.
+
+        Args:
+            transition_probs: Outcome probabilities, shape (S, A, K)
+            next_states: Outcome next states, shape (S, A, K)
+            rewards: Outcome rewards, shape (S, A, K)
+            terminals: Outcome terminated flags, shape (S, A, K)
+            initial_distribution: Start-state distribution, shape (S,)
+            max_episode_steps: Step limit from the environment spec (None if unlimited)
+        """
+        self.transition_probs = transition_probs
+        self.next_states = next_states
+        self.rewards = rewards
+        self.terminals = terminals
+        self.initial_distribution = initial_distribution
+        self.max_episode_steps = max_episode_steps
+
+        self.num_states, self.num_actions, self.max_outcomes = transition_probs.shape
+
+        # Cumulative probabilities for sampling. Each pair's last real outcome
+        # (and the padding after it) is pushed to infinity so rounding never
+        # lets a draw fall past it.
+        self.cumulative_probs = np.cumsum(transition_probs, axis=2)
+        has_prob = transition_probs[:, :, ::-1] > 0
+        last_outcome = self.max_outcomes - 1 - np.argmax(has_prob, axis=2)
+        self.cumulative_probs[np.arange(self.max_outcomes) >= last_outcome[:, :, None]] = np.inf
+        self._initial_cumulative = np.cumsum(initial_distribution)
+        last_start = len(initial_distribution) - 1 - np.argmax(initial_distribution[::-1] > 0)
+        self._initial_cumulative[last_start:] = np.inf
+
+        # Flat views for step_batch: one integer index per (state, action) pair
+        # or outcome instead of two- and three-array fancy indexing
+        self._pair_cumulative = self.cumulative_probs.reshape(self.num_states * self.num_actions, self.max_outcomes)
+        self._outcome_next_states = self.next_states.reshape(-1)
+        self._outcome_rewards = self.rewards.reshape(-1)
+        self._outcome_terminals = self.terminals.reshape(-1)
+
+        # Python-level lookup tables for the scalar step() fast path
+        self._step_table = [
+            [
+                (
+                    self.cumulative_probs[s, a].tolist(),
+                    self.next_states[s, a].tolist(),
+                    self.rewards[s, a].tolist(),
+                    self.terminals[s, a].tolist()
+                )
+                for a in range(self.num_actions)
+            ]
+            for s in range(self.num_states)
+        ]
+
+        # States entered through a terminating transition (holes, goals, ...)
+        self.terminal_states = np.unique(next_states[terminals & (transition_probs > 0)])
+
+        # Expected immediate rewards (S, A) and the probability mass that
+        # continues the episode, for the dynamic-programming operators
+        self.expected_rewards = (transition_probs * rewards).sum(axis=2)
+        self.continue_probs = np.where(terminals, 0.0, transition_probs)
+
+        # Optimal Q-values per discount factor (see optimal_q)
+        self._optimal_q: Dict[float, np.ndarray] = {}
+
+    @classmethod
+    def from_env(cls, env) -> 'TabularModel':
+        """
+        Compile a Gymnasium toy-text environment into a TabularModel.
+
+        Args:
+            env: Environment (wrapped or not) whose unwrapped env exposes P
+
+        Returns:
+            TabularModel instance
+
+        Raises:
+            ValueError: If the environment has no tabular model
+        """
+        unwrapped = env.unwrapped
+        model = getattr(unwrapped, 'P', None)
+        if model is None:
+            raise ValueError(
+                f"Environment '{getattr(env.spec, 'id', type(unwrapped).__name__)}' "
+                f"does not expose a tabular model (env.unwrapped.P)"
+            )
+
+        num_states = env.observation_space.n
+        num_actions = env.action_space.n
+        max_outcomes = max(len(model[s][a]) for s in range(num_states) for a in range(num_actions))
+        shape = (num_states, num_actions, max_outcomes)
+
+        transition_probs = np.zeros(shape)
+        next_states = np.zeros(shape, dtype=np.int64)
+        rewards = np.zeros(shape)
+        terminals = np.zeros(shape, dtype=bool)
+
+        for s in range(num_states):
+            for a in range(num_actions):
+                for k, (prob, next_state, reward, terminated) in enumerate(model[s][a]):
+                    transition_probs[s, a, k] = prob
+                    next_states[s, a, k] = next_state
+                    rewards[s, a, k] = reward
+                    terminals[s, a, k] = terminated
+
+        initial_distribution = getattr(unwrapped, 'initial_state_distrib', None)
+        if initial_distribution is None:
+            initial_distribution = np.zeros(num_states)
+            initial_distribution[int(getattr(unwrapped, 'start_state_index', 0))] = 1.0
+
+        max_episode_steps = env.spec.max_episode_steps if env.spec is not None else None
+
+        return cls(
+            transition_probs,
+            next_states,
+            rewards,
+            terminals,
+            np.asarray(initial_distribution, dtype=float),
+            max_episode_steps
+        )
+
+    def reset(self, rng: np.random.Generator) -> int:
+        """
+        Sample a start state.
+
+        Args:
+            rng: Random generator
+
+        Returns:
+            Start state index
+        """
+        return int(np.searchsorted(self._initial_cumulative, rng.random(), side='right'))
+
+    def step(self, state: int, action: int, rng: np.random.Generator) -> Tuple[int, float, bool]:
+        """
+        Sample a single transition.
+
+        Args:
+            state: Current state index
+            action: Action index
+            rng: Random generator
+
+        Returns:
+            Tuple of (next_state, reward, terminated)
+        """
+        cumulative, next_states, rewards, terminals = self._step_table[state][action]
+        outcome = bisect_right(cumulative, rng.random()) if self.max_outcomes > 1 else 0
+        return next_states[outcome], rewards[outcome], terminals[outcome]
+
+    def reset_batch(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """
+        Sample start states for a batch of episodes.
+
+        Args:
+            rng: Random generator
+            size: Number of episodes
+
+        Returns:
+            Array of start states, shape (size,)
+        """
+        return np.searchsorted(self._initial_cumulative, rng.random(size), side='right')
+
+    def step_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample one transition for each (state, action) pair.
+
+        Args:
+            states: Current states, shape (N,)
+            actions: Actions, shape (N,)
+            rng: Random generator
+
+        Returns:
+            Tuple of (next_states, rewards, terminated), each of shape (N,)
+        """
+        cells = states * self.num_actions + actions
+        if self.max_outcomes > 1:
+            draws = rng.random(len(states))
+            # First outcome whose cumulative probability exceeds the draw
+            outcome = (draws[:, None] < self._pair_cumulative[cells]).argmax(axis=1)
+            cells = cells * self.max_outcomes + outcome
+        return self._outcome_next_states[cells], self._outcome_rewards[cells], self._outcome_terminals[cells]
+
+    def bellman_q(self, values: np.ndarray, discount_factor: float) -> np.ndarray:
+        """
+        Apply the Bellman operator to state values for all (state, action) pairs.
+
+        Q(s, a) = E[r] + gamma * sum_k p_k * V(s'_k), where terminating
+        outcomes contribute no future value.
+
+        Args:
+            values: State values, shape (S,)
+            discount_factor: Discount factor gamma
+
+        Returns:
+            Q-values, shape (S, A)
+        """
+        return self.expected_rewards + discount_factor * (self.continue_probs * values[self.next_states]).sum(axis=2)
+
+    def evaluate_policy(self, policy: np.ndarray, discount_factor: float) -> np.ndarray:
+        """
+        Compute the exact state values of a deterministic policy.
+
+        Solves the linear system (I - gamma * P_pi) V = R_pi.
+
+        Args:
+            policy: Action per state, shape (S,)
+            discount_factor: Discount factor gamma
+
+        Returns:
+            State values, shape (S,)
+        """
+        states = np.arange(self.num_states)
+        transition_matrix = np.zeros((self.num_states, self.num_states))
+        np.add.at(
+            transition_matrix,
+            (np.repeat(states, self.max_outcomes), self.next_states[states, policy].ravel()),
+            self.continue_probs[states, policy].ravel()
+        )
+        system = np.eye(self.num_states) - discount_factor * transition_matrix
+        policy_rewards = self.expected_rewards[states, policy]
+        try:
+            return np.linalg.solve(system, policy_rewards)
+        except np.linalg.LinAlgError:
+            # Undiscounted policies that never terminate make the system singular
+            return np.linalg.lstsq(system, policy_rewards, rcond=None)[0]
+
+    def value_iteration(
+        self,
+        discount_factor: float,
+        theta: float = 1e-8,
+        max_iterations: int = 10000
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Compute optimal Q-values by value iteration.
+
+        Args:
+            discount_factor: Discount factor gamma
+            theta: Stop when no state value changes by more than theta
+            max_iterations: Maximum number of sweeps
+
+        Returns:
+            Tuple of (Q-values of shape (S, A), number of sweeps)
+        """
+        values = np.zeros(self.num_states)
+        for iteration in range(1, max_iterations + 1):
+            q_values = self.bellman_q(values, discount_factor)
+            new_values = q_values.max(axis=1)
+            delta = np.abs(new_values - values).max()
+            values = new_values
+            if delta < theta:
+                break
+        return self.bellman_q(values, discount_factor), iteration
+
+    def optimal_q(self, discount_factor: float) -> np.ndarray:
+        """
+        Return the optimal Q-values, solved once per discount factor.
+
+        Models are cached per environment configuration (see
+        EnvironmentManager.compile_environment), so this acts as a Q* oracle
+        for all sessions on the same environment.
+
+        Args:
+            discount_factor: Discount factor gamma
+
+        Returns:
+            Optimal Q-values, shape (S, A) (read-only)
+        """
+        q_values = self._optimal_q.get(discount_factor)
+        if q_values is None:
+            # Polish the value-iteration result with one exact evaluation of its greedy policy
+            approximate_q, _ = self.value_iteration(discount_factor)
+            values = self.evaluate_policy(approximate_q.argmax(axis=1), discount_factor)
+            q_values = self.bellman_q(values, discount_factor)
+            q_values.setflags(write=False)
+            self._optimal_q[discount_factor] = q_values
+        return q_values
@@ -0,0 +1,3 @@
+from .metrics import METRICS, MetricsRegistry
+
+__all__ = ['METRICS', 'MetricsRegistry']
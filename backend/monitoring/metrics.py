@@ -0,0 +1,238 @@
+import bisect
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Histogram bucket upper bounds in seconds (10 us .. 10 s)
+DEFAULT_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+)
+
+# A collector returns samples for gauges read at scrape time:
+# list of (name, help, [(labels, value), ...])
+Collector = Callable[[], List[Tuple[str, str, List[Tuple[Dict[str, str], float]]]]]
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count of observations."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Timing counters and histograms for the training and streaming hot paths.
+
+    Each phase (env_step, action_selection, td_update, render, png_encode,
+    json_encode, queue_wait, ...) accumulates total seconds and call counts,
+    aggregated and per session, plus an aggregated latency histogram.
+    Per-step phases are observed once per episode with the episode's total,
+    so the registry lock is taken per episode, not per step. Gauges (queue
+    depths, active threads, session counts) come from collectors evaluated
+    at scrape time.
+
+    When disabled, observe() and timer() return immediately and
+    instrumented loops skip their clock reads (they check enabled once per
+    call), so the hot paths run at uninstrumented speed.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = 'rl'):
+        """
+        Initialize an empty registry.
+
+        Args:
+            enabled: Record observations (can be toggled at runtime)
+            buckets: Histogram bucket upper bounds in seconds
+            prefix: Metric name prefix
+        """
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+
+        self._totals: Dict[str, List[float]] = {}
+        self._session_totals: Dict[Tuple[str, str], List[float]] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def observe(self, phase: str, seconds: float, session_id: Optional[str] = None, calls: int = 1) -> None:
+        """
+        Record time spent in a phase.
+
+        Args:
+            phase: Phase name
+            seconds: Time spent
+            session_id: Session the time belongs to, if any
+            calls: Number of calls the time covers (e.g. steps in an episode)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            total = self._totals.setdefault(phase, [0.0, 0])
+            total[0] += seconds
+            total[1] += calls
+            if session_id is not None:
+                session_total = self._session_totals.setdefault((phase, session_id), [0.0, 0])
+                session_total[0] += seconds
+                session_total[1] += calls
+            histogram = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase: str, session_id: Optional[str] = None) -> Iterator[None]:
+        """
+        Time a block of code as one call of a phase.
+
+        Args:
+            phase: Phase name
+            session_id: Session the time belongs to, if any
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, session_id)
+
+    def add_collector(self, collector: Collector) -> None:
+        """
+        Register a function that reports gauges at scrape time.
+
+        Args:
+            collector: Returns a list of (name, help, [(labels, value), ...])
+        """
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Collector) -> None:
+        """
+        Unregister a function added with add_collector.
+
+        Args:
+            collector: Previously added collector
+        """
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def forget_session(self, session_id: str) -> None:
+        """
+        Drop the per-session counters of a removed session.
+
+        Args:
+            session_id: Session UUID
+        """
+        with self._lock:
+            for key in [key for key in self._session_totals if key[1] == session_id]:
+                del self._session_totals[key]
+
+    def reset(self) -> None:
+        """Clear all recorded observations (collectors stay registered)."""
+        with self._lock:
+            self._totals.clear()
+            self._session_totals.clear()
+            self._histograms.clear()
+
+    def get_phase_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return aggregated totals per phase.
+
+        Returns:
+            Dictionary phase -> {'seconds', 'calls'}
+        """
+        with self._lock:
+            return {phase: {'seconds': seconds, 'calls': calls} for phase, (seconds, calls) in self._totals.items()}
+
+    def render(self) -> str:
+        """
+        Export all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics text (version 0.0.4)
+        """
+        name = self.prefix
+        lines: List[str] = []
+
+        with self._lock:
+            totals = sorted(self._totals.items())
+            session_totals = sorted(self._session_totals.items())
+            histograms = sorted(
+                (phase, list(h.counts), h.sum, h.count) for phase, h in self._histograms.items()
+            )
+
+        lines += [f'# HELP {name}_metrics_enabled Whether hot-path instrumentation is recording',
+                  f'# TYPE {name}_metrics_enabled gauge',
+                  f'{name}_metrics_enabled {int(self.enabled)}']
+
+        lines += [f'# HELP {name}_phase_seconds_total Time spent per phase, all sessions',
+                  f'# TYPE {name}_phase_seconds_total counter']
+        lines += [f'{name}_phase_seconds_total{_labels(phase=phase)} {_number(seconds)}'
+                  for phase, (seconds, _) in totals]
+        lines += [f'# HELP {name}_phase_calls_total Calls (steps, frames, events) per phase, all sessions',
+                  f'# TYPE {name}_phase_calls_total counter']
+        lines += [f'{name}_phase_calls_total{_labels(phase=phase)} {calls}' for phase, (_, calls) in totals]
+
+        lines += [f'# HELP {name}_session_phase_seconds_total Time spent per phase and session',
+                  f'# TYPE {name}_session_phase_seconds_total counter']
+        lines += [f'{name}_session_phase_seconds_total{_labels(phase=phase, session=session)} {_number(seconds)}'
+                  for (phase, session), (seconds, _) in session_totals]
+        lines += [f'# HELP {name}_session_phase_calls_total Calls per phase and session',
+                  f'# TYPE {name}_session_phase_calls_total counter']
+        lines += [f'{name}_session_phase_calls_total{_labels(phase=phase, session=session)} {calls}'
+                  for (phase, session), (_, calls) in session_totals]
+
+        lines += [f'# HELP {name}_phase_duration_seconds Duration per observation (episode, frame, event)',
+                  f'# TYPE {name}_phase_duration_seconds histogram']
+        for phase, counts, total, count in histograms:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_phase_duration_seconds_bucket{_labels(phase=phase, le=_number(bound))} {cumulative}')
+            lines.append(f'{name}_phase_duration_seconds_sum{_labels(phase=phase)} {_number(total)}')
+            lines.append(f'{name}_phase_duration_seconds_count{_labels(phase=phase)} {count}')
+
+        for collector in self._collectors:
+            for metric, help_text, samples in collector():
+                lines += [f'# HELP {name}_{metric} {help_text}', f'# TYPE {name}_{metric} gauge']
+                lines += [f'{name}_{metric}{_labels(**labels)} {_number(value)}' for labels, value in samples]
+
+        return '\n'.join(lines) + '\n'
+
+
+def _number(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _labels(**labels: Any) -> str:
+    """Format a label set, escaping values."""
+    if not labels:
+        return ''
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+# Process-wide registry. RL_METRICS=0 disables recording from startup.
+METRICS = MetricsRegistry(enabled=os.environ.get('RL_METRICS', '1') != '0')
@@ -0,0 +1,4 @@
+from .event_stream import EventStream
+from .asgi import WSGIAdapter, run_server
+
+__all__ = ['EventStream', 'WSGIAdapter', 'run_server']
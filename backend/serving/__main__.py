@@ -0,0 +1,37 @@
+"""
+Production entry point: serve the backend with uvicorn (ASGI).
+
+Usage (from backend/):
+    python -m serving                          # 0.0.0.0:5001
+    python -m serving --port 8000 --threads 32
+
+`python app.py` keeps running the Flask development server (debugger and
+reloader) for local use.
+"""
+
+import argparse
+import os
+
+from .asgi import DEFAULT_WORKER_THREADS, run_server
+
+
+def main(argv=None) -> None:
+    """Parse the command line and serve until interrupted."""
+    parser = argparse.ArgumentParser(prog='python -m serving', description='RL Playground backend (uvicorn)')
+    parser.add_argument('--host', default=os.environ.get('RL_HOST', '0.0.0.0'), help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('RL_PORT', 5001)), help='TCP port')
+    parser.add_argument('--threads', type=int,
+                        default=int(os.environ.get('RL_HTTP_THREADS', DEFAULT_WORKER_THREADS)),
+                        help=f'Threads running view functions (default {DEFAULT_WORKER_THREADS})')
+    args = parser.parse_args(argv)
+
+    # Creating the app sets up the trainer and warms the environment pools
+    from app import create_app
+    app = create_app()
+
+    print("Starting RL Playground Backend (production server)...")
+    run_server(app, args.host, args.port, args.threads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+import asyncio
+import io
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from monitoring import METRICS
+from .event_stream import EventStream
+
+
+logger = logging.getLogger(__name__)
+
+# Threads running Flask views (and synchronous streaming bodies such as playback)
+DEFAULT_WORKER_THREADS = 16
+
+# Largest request body accepted (larger ones get 413)
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# Seconds an idle keep-alive connection stays open
+KEEPALIVE_TIMEOUT = 75
+
+# Headers owned by the connection, never passed through from the application
+HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'upgrade'}
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WSGIAdapter:
+    """
+    ASGI application that serves a WSGI application (the Flask app).
+
+    HTTP parsing, framing and connection handling are left to the ASGI
+    server (uvicorn, see run_server). The adapter only decides where each
+    response is produced:
+
+    - View functions run in a fixed pool of worker threads.
+    - EventStream bodies (training and sweep streams) are handed back to the
+      event loop and iterated asynchronously, so an open stream costs a
+      coroutine and a socket, not a thread. Reading and encoding their
+      events also runs in the worker pool (EventStream.executor), so a large
+      snapshot never stalls the loop. A disconnect (http.disconnect) ends
+      the stream right away, which unsubscribes it from its log.
+    - Other streaming bodies (policy playback) are iterated in the worker
+      thread, one chunk at a time with backpressure from the socket.
+    """
+
+    def __init__(self, app: Callable, worker_threads: int = DEFAULT_WORKER_THREADS):
+        """
+        Initialize the adapter.
+
+        Args:
+            app: WSGI application
+            worker_threads: Threads running view functions
+        """
+        self.app = app
+        self.executor = ThreadPoolExecutor(max_workers=worker_threads, thread_name_prefix='http-worker')
+        self.active_requests = 0
+        self.open_streams = 0
+
+    def collect_gauges(self) -> List[Tuple[str, str, List[Tuple[Dict[str, str], float]]]]:
+        """
+        Report requests in progress and open streams for /api/metrics.
+
+        Returns:
+            List of (name, help, samples) gauges for METRICS.render
+        """
+        return [
+            ('http_requests_active', 'Requests in progress on the ASGI server', [({}, self.active_requests)]),
+            ('sse_streams', 'Event streams served by the event loop', [({}, self.open_streams)])
+        ]
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        """ASGI entry point."""
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            self.active_requests += 1
+            try:
+                await self._handle_request(scope, receive, send)
+            finally:
+                self.active_requests -= 1
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Register the gauges on startup, release the worker threads on shutdown."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                METRICS.add_collector(self.collect_gauges)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                METRICS.remove_collector(self.collect_gauges)
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> Optional[bytes]:
+        """
+        Read the whole request body.
+
+        Returns:
+            The body, or None if it exceeds MAX_BODY_BYTES or the client left
+        """
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    @staticmethod
+    def _environ(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+        """Build the WSGI environ of a request."""
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope['query_string'].decode('latin-1'),
+            'SERVER_NAME': str(server[0]),
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in scope['headers']:
+            key = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                environ[key] = value
+            else:
+                key = 'HTTP_' + key
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+    async def _handle_request(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        """Run the application for a request and send its response."""
+        body = await self._read_body(receive)
+        if body is None:
+            await self._send_error(send, 413, 'Request body too large')
+            return
+
+        loop = asyncio.get_running_loop()
+        environ = self._environ(scope, body)
+        disconnected = asyncio.Event()
+        state: Dict[str, Any] = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            state['status'] = int(status.split(' ', 1)[0])
+            state['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in response_headers if name.lower() not in HOP_BY_HOP_HEADERS
+            ]
+            return lambda data: None  # Legacy write() callable is not supported
+
+        def send_threadsafe(message):
+            """From a worker thread: send and wait until it is written (backpressure)."""
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def run_application():
+            """Worker thread: call the view; stream synchronous bodies from here."""
+            response = self.app(environ, start_response)
+            if isinstance(response, EventStream):
+                return response
+            try:
+                send_threadsafe({'type': 'http.response.start', 'status': state['status'], 'headers': state['headers']})
+                state['sent'] = True
+                for data in response:
+                    if disconnected.is_set():
+                        break
+                    if data:
+                        send_threadsafe({'type': 'http.response.body', 'body': data, 'more_body': True})
+                send_threadsafe({'type': 'http.response.body', 'body': b''})
+            finally:
+                if hasattr(response, 'close'):
+                    response.close()
+            return None
+
+        async def watch_disconnect():
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+            disconnected.set()
+
+        watcher = asyncio.ensure_future(watch_disconnect())
+        try:
+            try:
+                stream = await loop.run_in_executor(self.executor, run_application)
+            except Exception:
+                logger.exception("Request %s %s failed", scope['method'], scope['path'])
+                if not state.get('sent'):
+                    await self._send_error(send, 500, 'Internal Server Error')
+                return
+
+            if stream is not None:
+                await send({'type': 'http.response.start', 'status': state['status'], 'headers': state['headers']})
+                await self._stream_events(stream, send, watcher)
+        finally:
+            watcher.cancel()
+
+    async def _stream_events(self, stream: EventStream, send: Send, watcher: 'asyncio.Future') -> None:
+        """Send an EventStream from the event loop until it ends or the client disconnects."""
+        self.open_streams += 1
+        stream.executor = self.executor
+        events = stream.__aiter__()
+
+        async def forward():
+            async for data in events:
+                await send({'type': 'http.response.body', 'body': data, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        sender = asyncio.ensure_future(forward())
+        try:
+            await asyncio.wait([sender, watcher], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not sender.done():
+                sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+            # Unsubscribe from the log right away, also on disconnect or shutdown
+            await events.aclose()
+            self.open_streams -= 1
+            if sender.done() and not sender.cancelled() and sender.exception() is not None:
+                raise sender.exception()
+
+    @staticmethod
+    async def _send_error(send: Send, status: int, message: str) -> None:
+        """Send a plain-text error response."""
+        body = message.encode('utf-8')
+        await send({'type': 'http.response.start', 'status': status, 'headers': [
+            (b'content-type', b'text/plain; charset=utf-8'),
+            (b'content-length', str(len(body)).encode('latin-1'))
+        ]})
+        await send({'type': 'http.response.body', 'body': body})
+
+
+def run_server(app: Callable, host: str = '0.0.0.0', port: int = 5001,
+               worker_threads: int = DEFAULT_WORKER_THREADS) -> None:
+    """
+    Serve a WSGI application with uvicorn until SIGINT/SIGTERM.
+
+    Args:
+        app: WSGI application
+        host: Interface to listen on
+        port: TCP port
+        worker_threads: Threads running view functions
+    """
+    import uvicorn
+
+    print(f"Server running on http://{host}:{port} (uvicorn, {worker_threads} worker threads)")
+    uvicorn.run(WSGIAdapter(app, worker_threads), host=host, port=port, lifespan='on',
+                timeout_keep_alive=KEEPALIVE_TIMEOUT, backlog=1024)
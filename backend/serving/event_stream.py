@@ -0,0 +1,173 @@
+import asyncio
+import json
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from monitoring import METRICS
+from training.event_log import EventLog
+
+
+# Seconds without events after which a keep-alive comment is sent
+KEEPALIVE_INTERVAL = 1.0
+
+
+class EventStream:
+    """
+    Response body that streams an EventLog as Server-Sent Events.
+
+    The body can be consumed in two ways. Iterating it (the Flask dev server,
+    the test client, any WSGI server) blocks the calling thread on the log,
+    like a generator would. The ASGI adapter (see WSGIAdapter) recognizes an
+    EventStream returned by a view and iterates it with `async for` instead:
+    the coroutine sleeps on an asyncio.Event that the log sets when an event
+    is appended, so an open stream costs no thread while it waits. Reading
+    (which may merge a backlog) and JSON encoding run in an executor, never
+    on the event loop.
+
+    Views return it with direct_passthrough=True, so Werkzeug hands the
+    object itself to the server (like a wsgi.file_wrapper).
+
+    Subscribers with the same encoding key share each event's encoded bytes
+    (EventLog.memoize), so a session watched by hundreds of clients
+    serializes every event once per frame format, not once per client.
+
+    Each stream reads through its own Subscription, so a client that cannot
+    keep up receives at most buffer_size events per write, handled by its
+    overflow policy (see training.event_log.OVERFLOW_POLICIES).
+    """
+
+    def __init__(
+        self,
+        event_log: EventLog,
+        last_event_id: Optional[int] = None,
+        serialize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        encoding_key: Optional[Hashable] = None,
+        session_id: Optional[str] = None,
+        keepalive_interval: float = KEEPALIVE_INTERVAL,
+        buffer_size: Optional[int] = None,
+        overflow: str = 'drop'
+    ):
+        """
+        Initialize the stream (nothing is read until it is iterated).
+
+        Args:
+            event_log: EventLog to read
+            last_event_id: Resume after this event ID, if still retained
+            serialize: Turns a logged event into the JSON-serializable data sent
+                       to this subscriber (default: the event itself)
+            encoding_key: Identifies what serialize produces; streams of the
+                          same log with equal keys share encoded events
+                          (None with a serialize function disables sharing)
+            session_id: Session the stream belongs to (for metrics)
+            keepalive_interval: Seconds without events before a keep-alive comment
+            buffer_size: Maximum backlog of this subscriber (default: the log capacity)
+            overflow: What happens when the backlog exceeds buffer_size:
+                      'block', 'drop' or 'coalesce'
+        """
+        self.event_log = event_log
+        self.last_event_id = last_event_id
+        self.serialize = serialize
+        self.encoding_key = encoding_key if serialize is not None else 'json'
+        self.session_id = session_id
+        self.keepalive_interval = keepalive_interval
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        # Executor that reads and encodes events for async iteration (set by
+        # the server; None uses the event loop's default executor)
+        self.executor: Optional[Executor] = None
+        self._iterator: Optional[Iterator[bytes]] = None
+
+    def _encode(self, event_id: int, event_data: Dict[str, Any], shared: bool = True) -> bytes:
+        """Format one event as an SSE message with its 'id' field (shared per encoding key unless merged)."""
+        def encode():
+            with METRICS.timer('json_encode', self.session_id):
+                data = self.serialize(event_data) if self.serialize is not None else event_data
+                payload = json.dumps(data)
+            return f"id: {event_id}\ndata: {payload}\n\n".encode('utf-8')
+
+        if self.encoding_key is None or not shared:
+            return encode()
+        return self.event_log.memoize(event_id, ('sse', self.encoding_key), encode)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Blocking iteration: one chunk per event, until the log is closed."""
+        self._iterator = self._generate()
+        return self._iterator
+
+    def _generate(self) -> Iterator[bytes]:
+        """Generator behind __iter__."""
+        subscription = self.event_log.subscribe(self.last_event_id, self.buffer_size, self.overflow)
+        try:
+            while True:
+                with METRICS.timer('queue_wait', self.session_id):
+                    events, finished = subscription.read(timeout=self.keepalive_interval)
+                for event_id, event_data, shared in events:
+                    yield self._encode(event_id, event_data, shared)
+                if finished:
+                    break
+                if not events:
+                    # No data available, send keep-alive comment
+                    yield b": keep-alive\n\n"
+        finally:
+            self.event_log.unsubscribe(subscription)
+
+    def close(self) -> None:
+        """End a blocking iteration (called by WSGI servers when the response is done)."""
+        if self._iterator is not None:
+            self._iterator.close()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """
+        Non-blocking iteration for the ASGI adapter.
+
+        Yields the same bytes as blocking iteration, with the events available
+        at each wakeup joined into one chunk; waiting for events does not
+        occupy a thread, reading and encoding them borrows one from executor.
+        """
+        event_log = self.event_log
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        # Set while the coroutine may be waiting; appends only cross threads to wake it once
+        armed = [False]
+
+        def notify():
+            # Called by the training thread on append/close
+            if not armed[0]:
+                return
+            armed[0] = False
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                # Loop already closed (server shut down); the stream is gone
+                pass
+
+        subscription = event_log.subscribe(self.last_event_id, self.buffer_size, self.overflow)
+
+        def read() -> Tuple[bytes, bool]:
+            """Executor thread: read the available events and encode them as one chunk."""
+            events, finished = subscription.read(timeout=0)
+            return b''.join(self._encode(event_id, event_data, shared) for event_id, event_data, shared in events), finished
+
+        event_log.add_listener(notify)
+        try:
+            while True:
+                # Armed before reading, so an append right after the read still wakes us
+                wakeup.clear()
+                armed[0] = True
+                chunk, finished = await loop.run_in_executor(self.executor, read)
+                if chunk:
+                    # A backlog goes out as one chunk (one socket write)
+                    yield chunk
+                if finished:
+                    break
+                if not chunk:
+                    try:
+                        with METRICS.timer('queue_wait', self.session_id):
+                            await asyncio.wait_for(wakeup.wait(), self.keepalive_interval)
+                    except asyncio.TimeoutError:
+                        # No data available, send keep-alive comment
+                        yield b": keep-alive\n\n"
+        finally:
+            event_log.remove_listener(notify)
+            event_log.unsubscribe(subscription)
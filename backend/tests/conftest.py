@@ -28,7 +28,8 @@ def app():
             client = app.test_client()
             response = client.get('/api/algorithms')
     """
-    from app import app as flask_app
+    from app import create_app
+    flask_app = create_app()
     flask_app.config['TESTING'] = True
     return flask_app
 
@@ -0,0 +1,97 @@
+"""
+Tests for value iteration and policy iteration.
+"""
+
+import pytest
+import numpy as np
+import gymnasium as gym
+from algorithms import AlgorithmFactory
+from algorithms.dynamic_programming import DynamicProgrammingAlgorithm, ValueIteration, PolicyIteration
+from environments.environment_manager import EnvironmentManager
+
+
+class TestDynamicProgramming:
+    """Tests for the vectorized model-based planners."""
+
+    @pytest.mark.parametrize('env_id', ['FrozenLake-v1', 'CliffWalking'])
+    def test_value_and_policy_iteration_agree(self, env_id):
+        """
+        Test that both planners converge to the same greedy policy values.
+
+        WHY: Both must find the optimal solution of the same MDP.
+        HOW: Solve with each planner, compare state values.
+        """
+        # Arrange
+        env = gym.make(env_id)
+        value_iteration = ValueIteration(env, {'discount_factor': 0.9})
+        policy_iteration = PolicyIteration(env, {'discount_factor': 0.9})
+
+        # Act
+        value_iteration.train(1000)
+        policy_iteration.train(100)
+
+        # Assert
+        assert value_iteration.converged_after is not None
+        assert policy_iteration.converged_after is not None
+        assert np.allclose(value_iteration.q_table.max(axis=1), policy_iteration.q_table.max(axis=1), atol=1e-6)
+
+        env.close()
+
+    def test_planners_are_registered(self):
+        """
+        Test that the planners are available through the factory.
+
+        WHY: The UI and the API create algorithms by name.
+        HOW: Create both by name and train with a callback.
+        """
+        # Arrange
+        env = gym.make('FrozenLake-v1', is_slippery=False, render_mode='rgb_array')
+        rewards = []
+
+        # Act
+        for name in ['Value Iteration', 'Policy Iteration']:
+            algorithm = AlgorithmFactory.create_algorithm(name, env, {'discount_factor': 0.9})
+            algorithm.train(100, lambda episode, reward, data, frame: rewards.append(reward))
+
+        # Assert
+        assert rewards[-1] == pytest.approx(0.9 ** 5)
+
+        env.close()
+
+    def test_planner_without_sweep_cannot_be_created(self):
+        """
+        Test that a planner must implement _sweep.
+
+        WHY: A missing sweep should fail when the planner is created, not
+             when training first calls it.
+        HOW: Subclass without _sweep and instantiate it.
+        """
+        # Arrange
+        class NoSweep(DynamicProgrammingAlgorithm):
+            pass
+
+        env = gym.make('FrozenLake-v1', is_slippery=False, render_mode='rgb_array')
+
+        # Act / Assert
+        with pytest.raises(TypeError):
+            NoSweep(env, {})
+
+        env.close()
+
+    def test_optimal_q_is_cached_per_environment(self):
+        """
+        Test that Q* is solved once and shared between environments of the same kind.
+
+        WHY: Streams compare against Q* on every event; it must cost nothing after the first solve.
+        HOW: Ask two separate environments for Q*, check identity and optimality.
+        """
+        # Arrange
+        first = EnvironmentManager.compile_environment(gym.make('FrozenLake-v1'))
+        second = EnvironmentManager.compile_environment(gym.make('FrozenLake-v1'))
+
+        # Act
+        optimal_q = first.optimal_q(0.9)
+
+        # Assert
+        assert second.optimal_q(0.9) is optimal_q
+        assert np.allclose(first.bellman_q(optimal_q.max(axis=1), 0.9), optimal_q)
@@ -7,10 +7,14 @@ These are example tests to learn from. Each test follows the pattern:
 3. Assert - Check the results
 """
 
+import threading
 import pytest
 import numpy as np
 import gymnasium as gym
 from algorithms.q_learning import QLearning
+from algorithms.control import TrainingControl
+from algorithms.random_stream import RandomStream
+from environments.environment_manager import EnvironmentManager
 
 
 class TestQLearningBasics:
@@ -91,3 +95,135 @@ class TestQLearningBasics:
         assert 'min' in lr_schema, "Parameter should have 'min'"
         assert 'max' in lr_schema, "Parameter should have 'max'"
         assert 'default' in lr_schema, "Parameter should have 'default'"
+
+
+class TestQLearningRendering:
+    """Tests for eager, lazy and headless training."""
+
+    def test_train_without_callback_does_not_render(self, mocker):
+        """
+        Test that headless training never calls render.
+
+        WHY: Rendering is the most expensive part of an episode.
+        HOW: Spy on render_frame while training without a callback.
+        """
+        # Arrange
+        env = gym.make('FrozenLake-v1')
+        q_learning = QLearning(env, {})
+        spy = mocker.spy(q_learning, 'render_frame')
+
+        # Act
+        q_learning.train(20)
+
+        # Assert
+        assert spy.call_count == 0
+
+        env.close()
+
+    def test_lazy_callback_renders_on_demand(self):
+        """
+        Test that lazy training passes no frame but can render the last episode.
+
+        WHY: Consumers only pay for frames they actually use.
+        HOW: Train lazily on a headless env, then render the final state.
+        """
+        # Arrange
+        env = gym.make('FrozenLake-v1')  # no render_mode
+        q_learning = QLearning(env, {})
+        received = []
+
+        # Act
+        q_learning.train(5, lambda *args: received.append(args), lazy=True)
+        frame = q_learning.render_frame()
+
+        # Assert
+        assert all(learning_data is None and frame is None for _, _, learning_data, frame in received)
+        assert frame.ndim == 3, "On-demand render should return an RGB frame"
+
+        env.close()
+
+
+class TestQLearningControl:
+    """Tests for pausing and cancelling training between episodes."""
+
+    def test_control_pauses_and_cancels_between_episodes(self):
+        """
+        Test that a paused run holds and a cancelled run stops early.
+
+        WHY: Abandoned or paused runs must stop using CPU.
+        HOW: Pause after episode 5 from the callback, check that no episode
+             runs while paused, then cancel from another thread.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        q_learning = QLearning(env, {})
+        control = TrainingControl()
+        episodes = []
+
+        def callback(episode, reward, learning_data, frame):
+            episodes.append(episode)
+            if episode == 5:
+                control.pause()
+
+        # Act
+        thread = threading.Thread(target=q_learning.train, args=(10000, callback, True, control))
+        thread.start()
+        thread.join(timeout=0.2)
+        paused_episodes = list(episodes)
+        control.cancel()
+        thread.join(timeout=5)
+
+        # Assert
+        assert paused_episodes == list(range(6))
+        assert episodes == paused_episodes
+        assert not thread.is_alive()
+        assert control.reason == 'cancelled'
+
+
+class TestQLearningRandomness:
+    """Tests for the session-owned random stream."""
+
+    def test_same_seed_reproduces_training_under_concurrency(self):
+        """
+        Test that equally seeded sessions train identically in parallel threads.
+
+        WHY: A seed must make a run reproducible even while other sessions train.
+        HOW: Train two seeded agents and one unseeded agent concurrently, compare.
+        """
+        # Arrange
+        agents = [
+            QLearning(EnvironmentManager.create_environment('FrozenLake-v1', seed=seed, render_mode=None), {})
+            for seed in (7, 7, None)
+        ]
+        rewards = [[] for _ in agents]
+        threads = [
+            threading.Thread(target=agent.train, args=(300, lambda *args, r=r: r.append(args[1]), True))
+            for agent, r in zip(agents, rewards)
+        ]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert rewards[0] == rewards[1]
+        assert np.array_equal(agents[0].q_table, agents[1].q_table)
+
+    def test_stream_serves_generator_draws_in_blocks(self):
+        """
+        Test that pre-drawn blocks return exactly the generator's sequence.
+
+        WHY: Block refills must not skip or repeat draws.
+        HOW: Draw across several block boundaries, compare with a fresh generator.
+        """
+        # Arrange
+        stream = RandomStream(np.random.default_rng(3), block_size=8)
+
+        # Act
+        draws = [stream.random() for _ in range(20)]
+
+        # Assert
+        assert draws == np.random.default_rng(3).random(20).tolist()
+        assert all(0 <= stream.integers(4) < 4 for _ in range(100))
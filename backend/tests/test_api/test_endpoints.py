@@ -6,6 +6,7 @@ HTTP requests to our API without starting a real server.
 """
 
 import pytest
+import base64
 import json
 
 
@@ -75,6 +76,62 @@ class TestBasicEndpoints:
         assert 'max' in lr, "Parameter should specify max value"
         assert 'default' in lr, "Parameter should specify default value"
 
+    def test_environment_preview_supports_etag(self, client):
+        """
+        Test that the cached preview is revalidated with its ETag.
+
+        WHY: Page loads should not download an unchanged preview again.
+        HOW: Fetch the preview, repeat with If-None-Match, expect 304.
+        """
+        # Act
+        response = client.get('/api/environments/FrozenLake-v1/preview')
+        revalidated = client.get('/api/environments/FrozenLake-v1/preview',
+                                 headers={'If-None-Match': response.headers['ETag']})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.get_json()['frame']
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+
+    def test_create_map_returns_usable_environment(self, client):
+        """
+        Test POST /api/environments/maps names a map that can be previewed.
+
+        WHY: Generated and custom maps are used through their returned names.
+        HOW: Create a generated and an invalid custom map, preview the generated one.
+        """
+        # Act
+        response = client.post('/api/environments/maps', json={'size': 32, 'seed': 4, 'slippery': False})
+        invalid = client.post('/api/environments/maps', json={'desc': ['SFH', 'FG']})
+        data = response.get_json()
+        preview = client.get(f"/api/environments/{data['environment']}/preview")
+
+        # Assert
+        assert response.status_code == 200
+        assert data['environment'] == 'FrozenLake-Random-32x32-p0.8-s4-NoSlip'
+        assert data['size'] == [32, 32]
+        assert invalid.status_code == 400
+        assert preview.status_code == 200
+
+    def test_get_metrics(self, client):
+        """
+        Test GET /api/metrics returns Prometheus text with runtime gauges.
+
+        WHY: Monitoring scrapes this endpoint for hot-path timings and load.
+        HOW: Request the metrics, check content type and a few metric names.
+        """
+        # Act
+        response = client.get('/api/metrics')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        text = response.get_data(as_text=True)
+        assert '# TYPE rl_phase_seconds_total counter' in text
+        assert 'rl_sessions ' in text
+        assert 'rl_training_threads_active ' in text
+
 
 class TestErrorHandling:
     """Test that API handles errors correctly."""
@@ -108,3 +165,323 @@ class TestErrorHandling:
         data = response.get_json()
         assert 'message' in data, "Should have message key"
         assert 'reset successfully' in data['message'].lower(), "Should confirm reset"
+
+
+class TestTrainingStream:
+    """Test the SSE training stream and its event log."""
+
+    @staticmethod
+    def parse_events(response):
+        """Split an SSE body into (id, data) pairs."""
+        events = []
+        for block in response.get_data(as_text=True).split('\n\n'):
+            fields = dict(line.split(': ', 1) for line in block.split('\n') if ': ' in line)
+            if 'data' in fields:
+                events.append((int(fields['id']), json.loads(fields['data'])))
+        return events
+
+    def test_reconnect_replays_without_retraining(self, client):
+        """
+        Test that Last-Event-ID resumes the finished run instead of starting a new one.
+
+        WHY: EventSource reconnects must not train the same Q-table again.
+        HOW: Stream a short run, reconnect with an earlier event ID, compare.
+        """
+        # Arrange
+        from app import trainer
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 20}
+        }).get_json()['session_id']
+        events = self.parse_events(client.get(f'/api/train/stream/{session_id}'))
+
+        # Act
+        replayed = self.parse_events(client.get(
+            f'/api/train/stream/{session_id}',
+            headers={'Last-Event-ID': str(events[-3][0])}
+        ))
+
+        # Assert
+        assert events[-1][1]['status'] == 'complete'
+        assert replayed == events[-2:]
+        assert trainer.get_session(session_id)['episodes_trained'] == 20
+
+    def test_frame_hashes_are_served_with_http_caching(self, client):
+        """
+        Test that hash-mode subscribers get content hashes backed by /api/frames.
+
+        WHY: Repeated frames should cost no bytes after the browser cached them.
+        HOW: Stream with frames=hash, fetch a frame, revalidate it with its ETag.
+        """
+        # Arrange
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 10}
+        }).get_json()['session_id']
+        events = self.parse_events(client.get(f'/api/train/stream/{session_id}?frames=hash'))
+        inline = self.parse_events(client.get(f'/api/train/stream/{session_id}', headers={'Last-Event-ID': '0'}))
+        frame_hash = events[0][1]['frame_hash']
+
+        # Act
+        response = client.get(f'/api/frames/{frame_hash}.png')
+        revalidated = client.get(f'/api/frames/{frame_hash}.png', headers={'If-None-Match': f'"{frame_hash}"'})
+
+        # Assert
+        assert 'frame' not in events[0][1]
+        assert base64.b64decode(inline[0][1]['frame']) == response.data
+        assert response.mimetype == 'image/png'
+        assert response.headers['ETag'] == f'"{frame_hash}"'
+        assert 'immutable' in response.headers['Cache-Control']
+        assert revalidated.status_code == 304
+        assert client.get('/api/frames/unknown.png').status_code == 404
+
+    def test_eager_sessions_only_render_emitted_events(self, client):
+        """
+        Test that a stream builds frames and learning data per emitted event only.
+
+        WHY: Most episodes of a long run are decimated away; rendering and
+             serializing the Q-table for them is wasted hot-path time.
+        HOW: Count render_frame and get_learning_data calls of an eager
+             session streamed with every=100.
+        """
+        # Arrange
+        from app import trainer
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 500},
+            'render': 'eager'
+        }).get_json()['session_id']
+        algorithm = trainer.get_session(session_id)['algorithm']
+        calls = {'render_frame': 0, 'get_learning_data': 0}
+        for name in calls:
+            def counted(method=getattr(algorithm, name), name=name):
+                calls[name] += 1
+                return method()
+            setattr(algorithm, name, counted)
+
+        # Act
+        events = self.parse_events(client.get(f'/api/train/stream/{session_id}?every=100'))
+
+        # Assert
+        assert len(events) < 20
+        assert calls['render_frame'] == 0
+        assert calls['get_learning_data'] <= len(events)
+
+    def test_overflow_policies_keep_client_state_consistent(self, client):
+        """
+        Test the block and coalesce policies on a training stream.
+
+        WHY: A blocking subscriber must receive every event; a coalescing one
+             may receive fewer, but must end with the final Q-table.
+        HOW: Stream a run with overflow=block&buffer=1, stream another one
+             with overflow=coalesce&buffer=1 and apply its events like a client.
+        """
+        # Arrange
+        def new_session():
+            return client.post('/api/train', json={
+                'algorithm': 'Q-Learning',
+                'environment': 'FrozenLake-v1-NoSlip',
+                'parameters': {'num_episodes': 60}
+            }).get_json()['session_id']
+        blocking, coalescing = new_session(), new_session()
+
+        # Act
+        blocked = self.parse_events(client.get(f'/api/train/stream/{blocking}?overflow=block&buffer=1'))
+        coalesced = self.parse_events(client.get(
+            f'/api/train/stream/{coalescing}?overflow=coalesce&buffer=1&snapshot_interval=20'
+        ))
+        invalid = client.get(f'/api/train/stream/{coalescing}?overflow=unbounded')
+
+        # Assert
+        assert [data['seq'] for _, data in blocked[:-1]] == list(range(1, 61))
+        q_table, seq, episodes = None, 0, 0
+        for _, data in coalesced[:-1]:
+            assert data['seq'] == seq + data.get('merged', 1)
+            seq, episodes = data['seq'], episodes + data['window']['episodes']
+            if data['snapshot']:
+                q_table = data['learning_data']['q_table']
+            else:
+                for state, action, value in data['learning_delta']['q_updates']:
+                    q_table[state][action] = value
+        complete = coalesced[-1][1]
+        # A completion event that absorbed the last training events replaces their
+        # deltas with its full learning data, which the client takes over as is
+        if complete.get('merged', 1) == 1:
+            assert q_table == complete['learning_data']['q_table']
+        assert episodes + complete.get('window', {'episodes': 0})['episodes'] == 60
+        assert invalid.status_code == 400
+
+    def test_runs_can_be_paused_cancelled_and_stop_when_unwatched(self, client, monkeypatch):
+        """
+        Test the pause/resume/cancel endpoints and cancellation of unwatched runs.
+
+        WHY: Runs whose tab was closed (or that the user stopped) must not keep
+             burning CPU until all episodes are done.
+        HOW: Pause, resume and cancel a long run while streaming it; then open
+             another long run, disconnect after the first event and wait.
+        """
+        # Arrange
+        import app as app_module
+        from app import trainer
+        monkeypatch.setattr(app_module, 'UNWATCHED_RUN_TIMEOUT', 0.1)
+
+        def long_run():
+            session_id = client.post('/api/train', json={
+                'algorithm': 'Q-Learning',
+                'environment': 'FrozenLake-v1-NoSlip',
+                'parameters': {'num_episodes': 1000000}
+            }).get_json()['session_id']
+            return session_id, client.get(f'/api/train/stream/{session_id}?every=1000')
+
+        # Act
+        controlled, response = long_run()
+        paused = client.post(f'/api/train/{controlled}/pause').get_json()
+        resumed = client.post(f'/api/train/{controlled}/resume').get_json()
+        cancelled = client.post(f'/api/train/{controlled}/cancel').get_json()
+        events = self.parse_events(response)
+        stopped = client.post(f'/api/train/{controlled}/cancel')
+
+        unwatched, response = long_run()
+        next(iter(response.response))
+        response.close()
+        control = trainer.get_session(unwatched)['control']
+
+        # Assert
+        assert [paused['state'], resumed['state'], cancelled['state']] == ['paused', 'running', 'cancelling']
+        assert events[-1][1]['status'] == 'cancelled'
+        assert events[-1][1]['episodes'] == trainer.get_session(controlled)['episodes_trained'] < 1000000
+        assert stopped.status_code == 409
+        assert control.wait_finished(timeout=5)
+        assert control.reason == 'unwatched'
+        assert client.post('/api/train/unknown/pause').status_code == 404
+
+    def test_converged_runs_stop_early_with_metrics(self, client):
+        """
+        Test rolling metrics in events and the convergence stopping rule.
+
+        WHY: The deterministic lake converges long before a generous episode
+             budget is used up; the remaining episodes are wasted CPU.
+        HOW: Stream a 5000-episode NoSlip run with stop_threshold, check the
+             completion event and the metrics of the last training event.
+        """
+        # Arrange
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 5000},
+            'seed': 0
+        }).get_json()['session_id']
+
+        # Act
+        events = self.parse_events(client.get(
+            f'/api/train/stream/{session_id}?every=100&stop_threshold=0.01&stop_window=100'
+        ))
+        invalid = client.get(f'/api/train/stream/{session_id}?metrics_window=0')
+
+        # Assert
+        complete, last = events[-1][1], events[-2][1]
+        assert complete['converged'] and complete['episodes'] < 2500
+        assert last['episode'] == complete['episodes'] - 1
+        assert last['metrics']['converged'] and last['metrics']['stable_episodes'] >= 100
+        assert last['metrics']['success_rate'] > 0.5
+        assert invalid.status_code == 400
+
+    def test_recorded_trajectories_can_be_sliced(self, client):
+        """
+        Test fetching recorded transitions of a streamed run.
+
+        WHY: Clients inspect what the agent did without replaying the run.
+        HOW: Stream a recording session, fetch one episode and a slice, and
+             check the 404 of a session that records nothing.
+        """
+        # Arrange
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 30},
+            'record_trajectories': True
+        }).get_json()['session_id']
+        plain_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip'
+        }).get_json()['session_id']
+        client.get(f'/api/train/stream/{session_id}').get_data()
+
+        # Act
+        episode = client.get(f'/api/train/{session_id}/trajectories?episode=29').get_json()
+        sliced = client.get(f'/api/train/{session_id}/trajectories?start=2&stop=6').get_json()
+
+        # Assert
+        assert episode['episodes'] == 30 and episode['stop'] == episode['transitions']
+        assert set(episode['columns']['episode']) == {29}
+        assert episode['columns']['step'] == list(range(episode['stop'] - episode['start']))
+        assert sliced['stop'] - sliced['start'] == len(sliced['columns']['state']) == 4
+        assert client.get(f'/api/train/{session_id}/trajectories?start=5&stop=1').status_code == 400
+        assert client.get(f'/api/train/{session_id}/trajectories?episode=30').status_code == 404
+        assert client.get(f'/api/train/{plain_id}/trajectories').status_code == 404
+
+
+class TestPlaybackStream:
+    """Test the incremental and batch policy playback modes."""
+
+    @staticmethod
+    def trained_session(client):
+        """Create and train a short Q-Learning session, return its ID."""
+        session_id = client.post('/api/train', json={
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'parameters': {'num_episodes': 50}
+        }).get_json()['session_id']
+        client.get(f'/api/train/stream/{session_id}').get_data()
+        return session_id
+
+    @staticmethod
+    def parse_data(response):
+        """Return the data payloads of an SSE body."""
+        body = response.get_data(as_text=True)
+        return [json.loads(line[6:]) for line in body.split('\n') if line.startswith('data: ')]
+
+    def test_step_mode_sends_one_event_per_frame(self, client):
+        """
+        Test that step mode streams each frame in its own event.
+
+        WHY: Clients should not wait for the whole episode to be rendered.
+        HOW: Play with mode=step and frames=hash, check events and the summary.
+        """
+        # Arrange
+        session_id = self.trained_session(client)
+
+        # Act
+        events = self.parse_data(client.get(f'/api/play-policy/stream/{session_id}?mode=step&frames=hash'))
+
+        # Assert
+        playing = [event for event in events if event['status'] == 'playing']
+        assert events[-1] == {'status': 'complete', 'num_frames': len(playing),
+                              'reward': sum(event['reward'] for event in playing)}
+        assert [event['step'] for event in playing] == list(range(len(playing)))
+        assert all(client.get(f"/api/frames/{event['frame_hash']}.png").status_code == 200 for event in playing)
+
+    def test_batch_mode_streams_statistics(self, client):
+        """
+        Test that batch mode reports progress and final rollout statistics.
+
+        WHY: A single playback says little about a stochastic policy.
+        HOW: Run 50 rollouts rendering none, then check parameter validation.
+        """
+        # Arrange
+        session_id = self.trained_session(client)
+
+        # Act
+        events = self.parse_data(client.get(
+            f'/api/play-policy/stream/{session_id}?mode=batch&rollouts=50&render_episodes=0'
+        ))
+        invalid = client.get(f'/api/play-policy/stream/{session_id}?mode=batch&rollouts=0')
+
+        # Assert
+        assert events[-1]['status'] == 'complete'
+        assert events[-1]['stats']['episodes'] == 50
+        assert all(event['status'] == 'progress' for event in events[:-1])
+        assert invalid.status_code == 400
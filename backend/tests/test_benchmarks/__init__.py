@@ -0,0 +1 @@
+# Benchmark suite smoke tests
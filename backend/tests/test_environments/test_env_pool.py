@@ -0,0 +1,86 @@
+"""
+Tests for the pre-constructed environment pool.
+"""
+
+import time
+from environments.env_pool import EnvironmentPool
+from environments.environment_manager import EnvironmentManager
+
+
+class TestEnvironmentPool:
+    """Tests for EnvironmentPool checkout and refill."""
+
+    def test_pooled_environment_matches_fresh_environment(self):
+        """
+        Test that a seeded checkout behaves like a freshly created environment.
+
+        WHY: Sessions must be reproducible whether or not the pool had a spare.
+        HOW: Step a pooled and a fresh slippery environment with the same seed.
+        """
+        # Arrange
+        pool = EnvironmentPool(EnvironmentManager.build_environment, size=1, refill_delay=0)
+        pool.warm(['FrozenLake-v1'], [None])
+        pooled = pool.checkout('FrozenLake-v1', seed=5, render_mode=None)
+        fresh = EnvironmentManager.create_environment('FrozenLake-v1', seed=5, render_mode=None)
+
+        # Act
+        trajectories = [[env.step(1)[0] for _ in range(20)] for env in (pooled, fresh)]
+
+        # Assert
+        assert trajectories[0] == trajectories[1]
+        assert pool.get_stats()['hits'] == 1
+
+    def test_checkout_is_refilled_in_background(self):
+        """
+        Test that the pool rebuilds its spare after a checkout.
+
+        WHY: The next session should find a pre-constructed environment too.
+        HOW: Check out the only spare, wait for the refill thread.
+        """
+        # Arrange
+        pool = EnvironmentPool(EnvironmentManager.build_environment, size=1, refill_delay=0)
+        pool.warm(['FrozenLake-v1-NoSlip'], ['rgb_array'])
+
+        # Act
+        pool.checkout('FrozenLake-v1-NoSlip')
+        deadline = time.time() + 5
+        while pool.get_stats()['idle']['FrozenLake-v1-NoSlip/rgb_array'] < 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert pool.get_stats()['idle']['FrozenLake-v1-NoSlip/rgb_array'] == 1
+        pool.checkout('FrozenLake-v1-NoSlip')
+        assert pool.get_stats()['misses'] == 0
+        pool.clear()
+
+    def test_failed_refill_is_logged_with_traceback(self, caplog):
+        """
+        Test that a refill error is logged and the refill thread keeps running.
+
+        WHY: A failing factory must show up in the server log, not vanish.
+        HOW: Warm with a working factory, make it fail, check out and wait for the log record.
+        """
+        # Arrange
+        builds = []
+
+        def factory(env_name, render_mode):
+            if builds:
+                raise RuntimeError('factory broke')
+            builds.append(env_name)
+            return EnvironmentManager.build_environment(env_name, render_mode)
+
+        pool = EnvironmentPool(factory, size=1, refill_delay=0)
+        pool.warm(['FrozenLake-v1-NoSlip'], [None])
+
+        # Act
+        with caplog.at_level('ERROR', logger='environments.env_pool'):
+            pool.checkout('FrozenLake-v1-NoSlip', render_mode=None)
+            deadline = time.time() + 5
+            while not caplog.records and time.time() < deadline:
+                time.sleep(0.01)
+
+        # Assert
+        record = caplog.records[0]
+        assert 'FrozenLake-v1-NoSlip' in record.getMessage()
+        assert record.exc_info[0] is RuntimeError
+        assert pool._worker.is_alive()
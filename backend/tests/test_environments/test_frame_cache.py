@@ -0,0 +1,102 @@
+"""
+Tests for the encoded frame cache.
+"""
+
+import pytest
+from environments.environment_manager import EnvironmentManager
+from environments.frame_cache import FrameCache
+
+
+class TestFrameCache:
+    """Tests for FrameCache and EnvironmentManager.get_frame_base64."""
+
+    def test_lru_eviction_and_counters(self):
+        """
+        Test that the cache is bounded and counts hits and misses.
+
+        WHY: The cache must not grow without limit in a long-running backend.
+        HOW: Insert more entries than max_size, check the oldest is gone.
+        """
+        # Arrange
+        cache = FrameCache(max_size=2)
+
+        # Act
+        cache.put('a', 'A')
+        cache.put('b', 'B')
+        cache.get('a')          # 'a' becomes most recently used
+        cache.put('c', 'C')     # evicts 'b'
+
+        # Assert
+        assert cache.get('b') is None
+        assert cache.get('a') == 'A'
+        stats = cache.get_stats()
+        assert stats['size'] == 2
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+
+    def test_repeated_state_is_served_from_cache(self):
+        """
+        Test that rendering the same state twice only encodes once.
+
+        WHY: Training re-renders the same handful of frames thousands of times.
+        HOW: Encode the start state twice, check the second call is a hit.
+        """
+        # Arrange
+        EnvironmentManager.frame_cache.clear()
+        env = EnvironmentManager.create_environment('FrozenLake-v1', seed=0)
+
+        # Act
+        first = EnvironmentManager.get_frame_base64(env)
+        second = EnvironmentManager.get_frame_base64(env)
+
+        # Assert
+        assert first == second
+        stats = EnvironmentManager.frame_cache.get_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+
+        env.close()
+
+    def test_frame_key_depends_on_state(self):
+        """
+        Test that different agent positions get different keys.
+
+        WHY: A stale frame would show the agent in the wrong place.
+        HOW: Render two states and compare their keys.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+
+        # Act
+        key_start = EnvironmentManager.frame_key(env)
+        env.step(2)  # move right
+        key_moved = EnvironmentManager.frame_key(env)
+
+        # Assert
+        assert key_start != key_moved
+
+        env.close()
+
+    def test_frame_key_ignores_last_action(self):
+        """
+        Test that the same state reached by different actions shares one key.
+
+        WHY: The FrozenLake renderer ignores the sprite direction, so keying on
+             it would cache identical frames separately.
+        HOW: Compare the start state's key after reset and after bumping into
+             the left wall of a non-slippery lake.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        env.reset(seed=0)
+        key_reset = EnvironmentManager.frame_key(env)
+
+        # Act
+        env.step(0)  # left against the wall, stays in the start state
+        key_bumped = EnvironmentManager.frame_key(env)
+
+        # Assert
+        assert env.unwrapped.s == 0 and env.unwrapped.lastaction == 0
+        assert key_reset == key_bumped
+
+        env.close()
@@ -0,0 +1,80 @@
+"""
+Tests for the vectorized FrozenLake renderer and map names.
+"""
+
+import numpy as np
+import pytest
+from environments.environment_manager import EnvironmentManager
+from environments.frozenlake_renderer import FrozenLakeRenderer
+
+
+class TestFrozenLakeRenderer:
+    """Tests for FrozenLakeRenderer and generated/custom FrozenLake maps."""
+
+    @pytest.mark.parametrize('env_name', ['FrozenLake-v1', 'FrozenLake8x8-v1'])
+    def test_frames_match_gymnasium_renderer(self, env_name):
+        """
+        Test that the vectorized renderer draws the same frames as Gymnasium.
+
+        WHY: Replacing the pygame renderer must not change what users see.
+        HOW: Render every state with both renderers and compare the pixels.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment(env_name, seed=0)
+        env.reset()
+
+        for state in range(env.observation_space.n):
+            # Act
+            env.unwrapped.s = state
+            frame = EnvironmentManager.render(env)
+
+            # Assert
+            np.testing.assert_array_equal(frame, env.unwrapped.render())
+
+    def test_large_maps_are_capped_and_only_agent_cell_changes(self):
+        """
+        Test the output size cap and per-frame composition on a 64x64 map.
+
+        WHY: Frames of large maps must stay small enough to encode and stream.
+        HOW: Render two states and compare shapes and the changed region.
+        """
+        # Arrange
+        desc = np.asarray(EnvironmentManager.generate_map(64, seed=1), dtype='c')
+        renderer = FrozenLakeRenderer(desc)
+
+        # Act
+        start = renderer.render(0)
+        moved = renderer.render(1)
+
+        # Assert
+        assert renderer.cell_size == 8
+        assert start.shape == moved.shape == (512, 512, 3)
+        changed_rows, changed_cols = np.nonzero((start != moved).any(axis=-1))
+        assert changed_rows.max() < 8
+        assert changed_cols.max() < 16
+
+    def test_map_names_build_environments(self):
+        """
+        Test that generated and custom map names create the described maps.
+
+        WHY: Workers, checkpoints and sweeps rebuild environments from their name alone.
+        HOW: Build environments from generated names and check map, dynamics and step limit.
+        """
+        # Arrange
+        custom = EnvironmentManager.custom_map_name(['SFH', 'FFG'], slippery=False)
+        generated = EnvironmentManager.random_map_name(16, frozen_prob=0.9, seed=7)
+
+        # Act
+        custom_env = EnvironmentManager.create_environment(custom, seed=0)
+        generated_env = EnvironmentManager.create_environment(generated, seed=0)
+
+        # Assert
+        assert custom == 'FrozenLake-Custom-SFH_FFG-NoSlip'
+        assert custom_env.unwrapped.desc.shape == (2, 3)
+        assert custom_env.step(2)[0] == 1
+        assert generated_env.unwrapped.desc.shape == (16, 16)
+        assert EnvironmentManager.max_episode_steps(generated_env) == 256
+        assert [b''.join(row).decode() for row in generated_env.unwrapped.desc] == \
+            EnvironmentManager.generate_map(16, 0.9, 7)
+        assert not EnvironmentManager.validate_environment_name('FrozenLake-Custom-SFH_FG')
+        assert not EnvironmentManager.validate_environment_name('FrozenLake-Random-65x65-s0')
@@ -0,0 +1,154 @@
+"""
+Tests for compiled tabular environment models.
+"""
+
+import pytest
+import numpy as np
+import gymnasium as gym
+from environments.environment_manager import EnvironmentManager
+from algorithms.q_learning import QLearning
+
+
+class TestTabularModel:
+    """Tests for EnvironmentManager.compile_environment and TabularModel."""
+
+    def test_compiled_arrays_match_env_model(self):
+        """
+        Test that the dense arrays reproduce env.unwrapped.P.
+
+        WHY: The compiled model must have exactly the environment's dynamics.
+        HOW: Compare every (state, action, outcome) entry against P.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1')
+
+        # Act
+        model = EnvironmentManager.compile_environment(env)
+
+        # Assert
+        assert model.transition_probs.shape == (16, 4, 3)
+        for s, actions in env.unwrapped.P.items():
+            for a, outcomes in actions.items():
+                for k, (prob, next_state, reward, terminated) in enumerate(outcomes):
+                    assert model.transition_probs[s, a, k] == prob
+                    assert model.next_states[s, a, k] == next_state
+                    assert model.rewards[s, a, k] == reward
+                    assert model.terminals[s, a, k] == terminated
+
+        env.close()
+
+    def test_models_are_cached_per_map(self):
+        """
+        Test that compiled models are shared per environment and map.
+
+        WHY: Compiling P is done once, not once per session.
+        HOW: Compile two envs with the same/different maps and compare identity.
+        """
+        # Arrange
+        env_a = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip')
+        env_b = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip')
+        env_custom = gym.make('FrozenLake-v1', desc=['SF', 'HG'], is_slippery=False)
+
+        # Act
+        model_a = EnvironmentManager.compile_environment(env_a)
+        model_b = EnvironmentManager.compile_environment(env_b)
+        model_custom = EnvironmentManager.compile_environment(env_custom)
+
+        # Assert
+        assert model_a is model_b, "Same environment should reuse the compiled model"
+        assert model_custom is not model_a, "A different map must compile separately"
+        assert model_custom.num_states == 4
+
+    def test_model_cache_is_bounded(self):
+        """
+        Test that compiled models of many distinct maps are evicted.
+
+        WHY: Every generated or custom map compiles its own model (up to
+             4096 states); keeping all of them would grow without limit.
+        HOW: Compile more generated maps than the cache holds, check its size
+             and that the most recent model is still shared.
+        """
+        # Arrange
+        cache = EnvironmentManager._compiled_models
+        names = [
+            EnvironmentManager.random_map_name(4, seed=seed, slippery=False)
+            for seed in range(cache.max_size + 5)
+        ]
+
+        # Act
+        models = [EnvironmentManager.compile_environment(EnvironmentManager.create_environment(name, render_mode=None))
+                  for name in names]
+        again = EnvironmentManager.compile_environment(EnvironmentManager.create_environment(names[-1], render_mode=None))
+
+        # Assert
+        assert cache.get_stats()['size'] == cache.max_size
+        assert again is models[-1]
+
+    @pytest.mark.parametrize('env_id', ['Taxi', 'CliffWalking'])
+    def test_other_toy_text_environments(self, env_id):
+        """
+        Test that other toy-text environments compile and step.
+
+        WHY: The backend is not limited to FrozenLake.
+        HOW: Compile, then take a few random steps with a seeded generator.
+        """
+        # Arrange
+        env = gym.make(env_id)
+        rng = np.random.default_rng(0)
+
+        # Act
+        model = EnvironmentManager.compile_environment(env)
+        state = model.reset(rng)
+        for _ in range(10):
+            state, reward, terminated = model.step(state, int(rng.integers(model.num_actions)), rng)
+
+        # Assert
+        assert 0 <= state < env.observation_space.n
+        assert model.initial_distribution[model.reset(rng)] > 0
+
+        env.close()
+
+    def test_step_distribution_matches_slippery_dynamics(self):
+        """
+        Test that sampled transitions follow the slippery probabilities.
+
+        WHY: Sampling bugs would silently change what the agent learns.
+        HOW: Sample many batched steps from one (state, action), check frequencies.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1')
+        model = EnvironmentManager.compile_environment(env)
+        rng = np.random.default_rng(0)
+        states = np.full(30000, 5 + 1)  # state 6 (frozen), action 1 (down)
+        actions = np.ones(30000, dtype=np.int64)
+
+        # Act
+        next_states, _, _ = model.step_batch(states, actions, rng)
+
+        # Assert - each of the three outcomes has probability 1/3
+        _, counts = np.unique(next_states, return_counts=True)
+        assert len(counts) == 3
+        assert np.allclose(counts / counts.sum(), 1 / 3, atol=0.02)
+
+        env.close()
+
+    def test_q_learning_can_train_on_compiled_model(self):
+        """
+        Test that QLearning learns when opting into the compiled model.
+
+        WHY: The compiled path must be a drop-in replacement for env.step().
+        HOW: Train on the deterministic lake and check the start state value.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        env.action_space.seed(0)
+        np.random.seed(0)
+        q_learning = QLearning(env, {'exploration_rate': 0.3, 'use_compiled_model': True})
+
+        # Act
+        q_learning.train(1000)
+
+        # Assert
+        assert q_learning.q_table[0].max() > 0
+
+        env.close()
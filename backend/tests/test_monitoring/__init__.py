@@ -0,0 +1 @@
+# Hot-path metrics tests
@@ -0,0 +1,81 @@
+"""
+Tests for the hot-path metrics registry.
+"""
+
+from algorithms import QLearning
+from environments.environment_manager import EnvironmentManager
+from monitoring import METRICS, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Tests for phase timing and the Prometheus text export."""
+
+    def test_render_reports_totals_histogram_and_gauges(self):
+        """
+        Test the exposition format of counters, histograms and collector gauges.
+
+        WHY: Prometheus scrapers reject malformed metric lines.
+        HOW: Observe two phases and a collector, then check the rendered samples.
+        """
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.001, 0.1))
+        registry.add_collector(lambda: [('queue_depth', 'Queued events', [({'queue': 'a"b'}, 3)])])
+
+        # Act
+        registry.observe('env_step', 0.05, session_id='s1', calls=10)
+        registry.observe('env_step', 0.5, session_id='s1', calls=20)
+        with registry.timer('render'):
+            pass
+        text = registry.render()
+
+        # Assert
+        assert 'rl_phase_seconds_total{phase="env_step"} 0.55' in text
+        assert 'rl_phase_calls_total{phase="env_step"} 30' in text
+        assert 'rl_session_phase_calls_total{phase="env_step",session="s1"} 30' in text
+        assert 'rl_phase_duration_seconds_bucket{phase="env_step",le="0.1"} 1' in text
+        assert 'rl_phase_duration_seconds_bucket{phase="env_step",le="+Inf"} 2' in text
+        assert 'rl_phase_calls_total{phase="render"} 1' in text
+        assert 'rl_queue_depth{queue="a\\"b"} 3' in text
+
+    def test_disabled_registry_records_nothing(self):
+        """
+        Test that a disabled registry ignores observations.
+
+        WHY: RL_METRICS=0 must leave the hot paths uninstrumented.
+        HOW: Observe and time on a disabled registry, then read the totals.
+        """
+        # Arrange
+        registry = MetricsRegistry(enabled=False)
+
+        # Act
+        registry.observe('env_step', 1.0)
+        with registry.timer('render'):
+            pass
+
+        # Assert
+        assert registry.get_phase_totals() == {}
+        assert 'rl_metrics_enabled 0' in registry.render()
+
+    def test_q_learning_records_step_phases_per_session(self):
+        """
+        Test that Q-Learning training reports its per-step phases.
+
+        WHY: The metrics must show where training time goes, per session.
+        HOW: Train a few episodes with a session label, compare call counts to steps.
+        """
+        # Arrange
+        METRICS.reset()
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        algorithm = QLearning(env, {})
+        algorithm.metrics_session = 'session-1'
+        steps = []
+
+        # Act
+        algorithm.train(20, lambda *args: steps.append(algorithm.last_episode_length), lazy=True)
+        totals = METRICS.get_phase_totals()
+
+        # Assert
+        for phase in ('action_selection', 'env_step', 'td_update'):
+            assert totals[phase]['calls'] == sum(steps)
+            assert totals[phase]['seconds'] > 0
+        assert 'session="session-1"' in METRICS.render()
@@ -0,0 +1 @@
+# Async server tests
@@ -0,0 +1,248 @@
+"""
+Tests for the ASGI adapter (served by uvicorn) and EventStream bodies.
+"""
+
+import http.client
+import socket
+import threading
+import time
+
+import pytest
+from flask import Flask, Response, jsonify, request
+
+from serving import EventStream, WSGIAdapter
+from training.event_log import EventLog
+
+uvicorn = pytest.importorskip('uvicorn')
+
+
+@pytest.fixture
+def serve():
+    """Serve apps with uvicorn on free ports, each on its own thread."""
+    running = []
+
+    def start(app, worker_threads=4):
+        adapter = WSGIAdapter(app, worker_threads)
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        server = uvicorn.Server(uvicorn.Config(adapter, lifespan='on', log_level='warning'))
+        thread = threading.Thread(target=server.run, kwargs={'sockets': [sock]}, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+        adapter.port = sock.getsockname()[1]
+        running.append((server, thread))
+        return adapter
+
+    yield start
+
+    for server, thread in running:
+        server.should_exit = True
+        thread.join(5)
+
+
+def make_app(event_log):
+    """Flask app with an event stream and a JSON echo route."""
+    app = Flask(__name__)
+
+    @app.route('/stream')
+    def stream():
+        return Response(EventStream(event_log, keepalive_interval=30), mimetype='text/event-stream',
+                        direct_passthrough=True)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify({'received': request.get_json(), 'thread': threading.current_thread().name})
+
+    return app
+
+
+class TestWSGIAdapter:
+    """Tests for WSGIAdapter request handling and stream fan-out."""
+
+    def test_event_streams_are_served_without_threads(self, serve):
+        """
+        Test that many open event streams do not add threads.
+
+        WHY: Hundreds of EventSource subscribers must not exhaust the thread pool.
+        HOW: Open 200 streams, check thread count and gauges, then publish and close the log.
+        """
+        # Arrange
+        event_log = EventLog()
+        server = serve(make_app(event_log), worker_threads=4)
+        threads_before = threading.active_count()
+        clients = []
+        for _ in range(200):
+            client = socket.create_connection(('127.0.0.1', server.port))
+            client.sendall(b'GET /stream HTTP/1.1\r\nHost: test\r\n\r\n')
+            clients.append(client)
+        deadline = time.time() + 10
+        while server.open_streams < 200 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # Act
+        open_streams = server.open_streams
+        threads_while_streaming = threading.active_count()
+        event_log.append({'episode': 0}, sync_point=True)
+        event_log.close()
+        bodies = []
+        for client in clients:
+            client.settimeout(10)
+            data = b''
+            while not data.endswith(b'0\r\n\r\n'):
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+            bodies.append(data)
+            client.close()
+
+        # Assert
+        assert open_streams == 200
+        assert threads_while_streaming <= threads_before + 4
+        assert all(b'transfer-encoding: chunked' in body.lower() for body in bodies)
+        assert all(b'id: 1\ndata: {"episode": 0}\n\n' in body for body in bodies)
+
+    def test_requests_are_dispatched_to_worker_threads_with_keep_alive(self, serve):
+        """
+        Test that ordinary requests run in the worker pool over a reused connection.
+
+        WHY: REST endpoints keep working unchanged behind the ASGI server.
+        HOW: Send two JSON POSTs on one connection and check the echoed bodies.
+        """
+        # Arrange
+        server = serve(make_app(EventLog()))
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+
+        # Act
+        responses = []
+        for value in (1, 2):
+            connection.request('POST', '/echo', body=f'{{"value": {value}}}',
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            responses.append((response.status, response.getheader('Connection'), response.read()))
+        connection.close()
+
+        # Assert
+        assert [status for status, _, _ in responses] == [200, 200]
+        assert all(header != 'close' for _, header, _ in responses)
+        assert b'"value":1' in responses[0][2].replace(b' ', b'')
+        assert b'"value":2' in responses[1][2].replace(b' ', b'')
+        assert b'http-worker' in responses[0][2]
+
+    def test_failed_requests_are_logged_with_traceback(self, serve, caplog):
+        """
+        Test that an application error becomes a 500 and a logged traceback.
+
+        WHY: Failures must reach the server log, not stdout debug output.
+        HOW: Serve a WSGI app that raises and check the response and log record.
+        """
+        # Arrange
+        def failing_app(environ, start_response):
+            raise RuntimeError('view crashed')
+
+        server = serve(failing_app)
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+
+        # Act
+        with caplog.at_level('ERROR', logger='serving.asgi'):
+            connection.request('GET', '/boom')
+            response = connection.getresponse()
+            body = response.read()
+        connection.close()
+
+        # Assert
+        assert response.status == 500
+        assert body == b'Internal Server Error'
+        record = next(record for record in caplog.records if record.name == 'serving.asgi')
+        assert 'GET /boom' in record.getMessage()
+        assert record.exc_info[0] is RuntimeError
+
+    def test_disconnected_stream_unsubscribes(self, serve):
+        """
+        Test that a client disconnect ends its event stream right away.
+
+        WHY: Unwatched training runs are cancelled once their last subscriber
+             leaves, which relies on the stream unsubscribing.
+        HOW: Open a stream, close the socket, wait for the subscriber count
+             and the open-stream gauge to drop to zero.
+        """
+        # Arrange
+        event_log = EventLog()
+        server = serve(make_app(event_log))
+        client = socket.create_connection(('127.0.0.1', server.port))
+        client.sendall(b'GET /stream HTTP/1.1\r\nHost: test\r\n\r\n')
+        deadline = time.time() + 10
+        while server.open_streams < 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # Act
+        client.close()
+        while (server.open_streams or event_log.get_stats()['subscribers']) and time.time() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert server.open_streams == 0
+        assert event_log.get_stats()['subscribers'] == 0
+
+    def test_events_are_encoded_off_the_event_loop(self, serve):
+        """
+        Test that stream events are serialized in the worker pool.
+
+        WHY: Encoding a large snapshot on the event loop would stall every
+             other open stream.
+        HOW: Serve a stream with a serializer that records its thread.
+        """
+        # Arrange
+        event_log = EventLog()
+        event_log.append({'episode': 0}, sync_point=True)
+        event_log.close()
+        threads = []
+        app = Flask(__name__)
+
+        def serialize(data):
+            threads.append(threading.current_thread().name)
+            return data
+
+        @app.route('/stream')
+        def stream():
+            return Response(EventStream(event_log, serialize=serialize), mimetype='text/event-stream',
+                            direct_passthrough=True)
+
+        server = serve(app)
+
+        # Act
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+        connection.request('GET', '/stream')
+        body = connection.getresponse().read()
+        connection.close()
+
+        # Assert
+        assert b'data: {"episode": 0}' in body
+        assert threads and all(name.startswith('http-worker') for name in threads)
+
+    def test_subscribers_share_encoded_events(self):
+        """
+        Test that streams with the same encoding key serialize each event once.
+
+        WHY: A session watched by many clients should not JSON-encode every event per client.
+        HOW: Read one log through two streams with a counting serializer.
+        """
+        # Arrange
+        event_log = EventLog()
+        event_log.append({'episode': 0}, sync_point=True)
+        event_log.append({'episode': 1})
+        event_log.close()
+        calls = []
+
+        def serialize(data):
+            calls.append(data['episode'])
+            return data
+
+        # Act
+        first = b''.join(EventStream(event_log, serialize=serialize, encoding_key='base64'))
+        second = b''.join(EventStream(event_log, serialize=serialize, encoding_key='base64'))
+
+        # Assert
+        assert first == second
+        assert calls == [0, 1]
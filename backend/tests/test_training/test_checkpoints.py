@@ -0,0 +1,97 @@
+"""
+Tests for persistent session checkpoints.
+"""
+
+import pytest
+import numpy as np
+from training.checkpoints import CheckpointStore
+from training.trainer import TrainingCoordinator
+
+
+class TestCheckpoints:
+    """Tests for CheckpointStore and checkpoint-backed sessions."""
+
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        """
+        Test that saved arrays come back memory-mapped and unchanged.
+
+        WHY: Cold-loading a session should cost an mmap, not a copy or retrain.
+        HOW: Save a Q-table, load it, check type and values.
+        """
+        # Arrange
+        store = CheckpointStore(str(tmp_path))
+        q_table = np.arange(64, dtype=float).reshape(16, 4)
+
+        # Act
+        store.save('abc', {'episodes_trained': 3}, {'q_table': q_table}, [0.0, 1.0, 0.0])
+        checkpoint = store.load('abc')
+
+        # Assert
+        assert isinstance(checkpoint['arrays']['q_table'], np.memmap)
+        assert np.array_equal(checkpoint['arrays']['q_table'], q_table)
+        assert checkpoint['rewards'] == [0.0, 1.0, 0.0]
+        assert checkpoint['meta'] == {'episodes_trained': 3}
+        assert store.list_sessions() == ['abc']
+
+    def test_invalid_session_ids_are_rejected(self, tmp_path):
+        """
+        Test that session IDs cannot escape the checkpoint directory.
+
+        WHY: Session IDs come from URLs.
+        HOW: Check path-like IDs are reported as missing and refused on save.
+        """
+        # Arrange
+        store = CheckpointStore(str(tmp_path))
+
+        # Act / Assert
+        assert not store.exists('../etc')
+        with pytest.raises(ValueError):
+            store.save('../etc', {}, {}, [])
+
+    def test_session_survives_restart_and_resumes(self, tmp_path):
+        """
+        Test that a new coordinator reloads and continues a trained session.
+
+        WHY: A backend restart must not throw away trained agents.
+        HOW: Train with one coordinator, reload with another on the same directory.
+        """
+        # Arrange
+        first = TrainingCoordinator(checkpoint_dir=str(tmp_path))
+        session_id = first.create_session('Q-Learning', 'FrozenLake-v1-NoSlip', {}, seed=0)
+        first.train(session_id, 50)
+        trained_q = np.array(first.get_session(session_id)['algorithm'].q_table)
+
+        # Act - "restart"
+        second = TrainingCoordinator(checkpoint_dir=str(tmp_path))
+        restored = second.get_session(session_id)
+
+        # Assert
+        assert second.session_exists(session_id)
+        assert restored['trained']
+        assert restored['episodes_trained'] == 50
+        assert len(restored['rewards']) == 50
+        assert np.array_equal(restored['algorithm'].q_table, trained_q)
+        assert len(second.play_policy(session_id)) > 0
+
+        # Resume for more episodes
+        second.train(session_id, 25)
+        assert second.get_session(session_id)['episodes_trained'] == 75
+        assert CheckpointStore(str(tmp_path)).load(session_id)['meta']['episodes_trained'] == 75
+
+    def test_reset_removes_checkpoints(self, tmp_path):
+        """
+        Test that resetting all sessions also deletes their checkpoints.
+
+        WHY: "Reset" must not bring sessions back after a restart.
+        HOW: Train, reset, check nothing can be restored.
+        """
+        # Arrange
+        coordinator = TrainingCoordinator(checkpoint_dir=str(tmp_path))
+        session_id = coordinator.create_session('Q-Learning', 'FrozenLake-v1', {})
+        coordinator.train(session_id, 5)
+
+        # Act
+        coordinator.reset_all_sessions()
+
+        # Assert
+        assert not coordinator.session_exists(session_id)
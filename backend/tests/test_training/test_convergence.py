@@ -0,0 +1,92 @@
+"""
+Tests for rolling training metrics and the convergence stopping rule.
+"""
+
+import numpy as np
+import pytest
+from algorithms.q_learning import QLearning
+from environments.environment_manager import EnvironmentManager
+from training.convergence import TrainingMetrics
+
+
+class TestTrainingMetrics:
+    """Tests for TrainingMetrics."""
+
+    def test_rolling_statistics_match_recomputation(self):
+        """
+        Test that the running sums equal statistics recomputed over the window.
+
+        WHY: The O(1) updates must not drift from the real window contents.
+        HOW: Record random episodes, compare each snapshot with NumPy.
+        """
+        # Arrange
+        rng = np.random.default_rng(0)
+        metrics = TrainingMetrics(window=10)
+        rewards = rng.integers(0, 2, 50).astype(float)
+        lengths = rng.integers(1, 30, 50).astype(float)
+
+        for episode in range(50):
+            # Act
+            metrics.record(rewards[episode], lengths[episode], 0.5, 1)
+            snapshot = metrics.snapshot()
+
+            # Assert
+            window = slice(max(0, episode - 9), episode + 1)
+            assert snapshot['success_rate'] == pytest.approx(np.mean(rewards[window] > 0))
+            assert snapshot['mean_length'] == pytest.approx(np.mean(lengths[window]))
+        assert snapshot['total_policy_changes'] == 50
+        assert not metrics.converged
+        with pytest.raises(ValueError):
+            TrainingMetrics(window=0)
+
+    def test_stopping_rule_needs_stable_successful_episodes(self):
+        """
+        Test when the stopping rule fires.
+
+        WHY: Runs should stop once learning has settled, but an agent that
+             sees no reward (and so changes nothing) has not converged.
+        HOW: Feed unchanged episodes without and then with successes, and a
+             policy change that resets the streak.
+        """
+        # Arrange
+        metrics = TrainingMetrics(window=5, stop_threshold=0.01, stop_window=3)
+
+        # Act / Assert: no success in the window, nothing counts
+        assert not any(metrics.record(0.0, 10, 0.0, 0) for _ in range(5))
+        assert metrics.stable_episodes == 0
+
+        metrics.record(1.0, 6, 0.001, 0)
+        metrics.record(1.0, 6, 0.001, 1)
+        assert metrics.stable_episodes == 0
+
+        results = [metrics.record(1.0, 6, 0.001, 0) for _ in range(3)]
+        assert results == [False, False, True]
+        assert metrics.converged_after == 10
+
+    def test_q_learning_reports_q_changes_and_policy_flips(self):
+        """
+        Test the per-episode values Q-Learning feeds into the metrics.
+
+        WHY: The stopping rule is only as good as the tracked ΔQ and flips.
+        HOW: Train episode by episode, bound the table diff by max |ΔQ| and
+             the changed greedy actions by the tracked flip count.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        q_learning = QLearning(env, {'exploration_rate': 0.5})
+        flips = 0
+
+        for _ in range(300):
+            before = q_learning.q_table.copy()
+
+            # Act
+            q_learning.train(1)
+
+            # Assert
+            # A cell is updated at most once per step, by at most the largest update
+            net_change = np.abs(q_learning.q_table - before).max()
+            assert q_learning.last_max_q_change * q_learning.last_episode_length >= net_change - 1e-12
+            flips += q_learning.last_policy_changes
+            changed = np.count_nonzero(q_learning.q_table.argmax(axis=1) != before.argmax(axis=1))
+            assert q_learning.last_policy_changes >= changed
+        assert flips >= np.count_nonzero(q_learning.q_table.argmax(axis=1))
@@ -0,0 +1,83 @@
+"""
+Tests for greedy-policy evaluation.
+"""
+
+import pytest
+from algorithms import AlgorithmFactory
+from environments.environment_manager import EnvironmentManager
+from training.evaluation import PolicyEvaluator, wilson_interval
+
+
+def solved(environment_name):
+    """Value-iteration solution of an environment."""
+    env = EnvironmentManager.create_environment(environment_name, seed=0, render_mode=None)
+    algorithm = AlgorithmFactory.create_algorithm('Value Iteration', env, {'discount_factor': 0.99})
+    algorithm.train(1000)
+    return algorithm, env
+
+
+class TestPolicyEvaluator:
+    """Tests for exact and Monte-Carlo policy evaluation."""
+
+    def test_exact_and_monte_carlo_agree(self):
+        """
+        Test that rollouts estimate the exactly computed success probability.
+
+        WHY: Both methods must describe the same policy; only exact is noise-free.
+        HOW: Evaluate the optimal slippery-lake policy both ways. Rollouts are
+             truncated at the step limit, so they may only fall slightly short.
+        """
+        # Arrange
+        algorithm, env = solved('FrozenLake-v1')
+        evaluator = PolicyEvaluator(algorithm, env)
+
+        # Act
+        exact = evaluator.evaluate('exact')
+        estimate = evaluator.evaluate('monte_carlo', num_rollouts=5000, seed=0)
+
+        # Assert
+        assert exact['success_probability'] == pytest.approx(0.82, abs=0.01)
+        assert exact['termination_probability'] == pytest.approx(1.0)
+        assert estimate['success_ci'][0] <= estimate['success_rate'] <= estimate['success_ci'][1]
+        assert exact['success_probability'] - 0.1 < estimate['success_rate']
+        assert estimate['success_ci'][0] <= exact['success_probability']
+
+        env.close()
+
+    def test_model_free_fallback(self):
+        """
+        Test Monte-Carlo rollouts on environment copies when there is no model.
+
+        WHY: Environments without env.unwrapped.P can still be evaluated.
+        HOW: Hide the model of the deterministic lake, evaluate, expect certain success.
+        """
+        # Arrange
+        algorithm, env = solved('FrozenLake-v1-NoSlip')
+        evaluator = PolicyEvaluator(algorithm, env)
+        evaluator.model = None
+
+        # Act
+        result = evaluator.evaluate(num_rollouts=20, seed=0)
+
+        # Assert
+        assert result['method'] == 'monte_carlo'
+        assert result['success_rate'] == 1.0
+        assert result['mean_length'] == 6
+        with pytest.raises(ValueError):
+            evaluator.evaluate('exact')
+
+        env.close()
+
+    def test_wilson_interval(self):
+        """
+        Test the confidence interval for success rates.
+
+        WHY: Intervals must stay within [0, 1] even for 0 or all successes.
+        HOW: Check the edge cases and a symmetric case.
+        """
+        # Act / Assert
+        assert wilson_interval(0, 100)[0] == pytest.approx(0.0)
+        assert wilson_interval(100, 100)[1] == pytest.approx(1.0)
+        lower, upper = wilson_interval(50, 100)
+        assert lower < 0.5 < upper
+        assert 0.5 - lower == pytest.approx(upper - 0.5)
@@ -0,0 +1,160 @@
+"""
+Tests for the replayable training event log.
+"""
+
+import threading
+import pytest
+from training.event_log import EventLog
+
+
+class TestEventLog:
+    """Tests for EventLog."""
+
+    def test_subscribers_read_independently(self):
+        """
+        Test that every subscriber sees every event exactly once.
+
+        WHY: A second tab must not steal events from the first one.
+        HOW: Append events, read them from two positions.
+        """
+        # Arrange
+        log = EventLog()
+        for episode in range(3):
+            log.append({'episode': episode})
+        log.close()
+
+        # Act
+        first, first_finished = log.read(0)
+        second, second_finished = log.read(2)
+
+        # Assert
+        assert [event_id for event_id, _ in first] == [1, 2, 3]
+        assert second == [(3, {'episode': 2})]
+        assert first_finished and second_finished
+
+    def test_resume_falls_back_to_oldest_sync_point(self):
+        """
+        Test where a (re)connecting subscriber starts reading.
+
+        WHY: Replay must resume after Last-Event-ID, but a client whose
+             position was dropped from the ring buffer needs a full snapshot
+             before it can apply deltas.
+        HOW: Overflow a small log, check start positions.
+        """
+        # Arrange
+        log = EventLog(capacity=4)
+        for event_id in range(1, 8):
+            log.append({'id': event_id}, sync_point=event_id % 3 == 0)
+
+        # Act / Assert: retained ids are 4..7, sync points 6
+        assert log.start_position(5) == 5
+        assert log.start_position(3) == 3
+        assert log.start_position(1) == 5
+        assert log.start_position(None) == 5
+        assert log.start_position(99) == 5
+
+    def test_read_waits_for_new_events(self):
+        """
+        Test that a blocked reader wakes up on append.
+
+        WHY: Subscribers must not busy-poll the log.
+        HOW: Append from another thread while reading with a long timeout.
+        """
+        # Arrange
+        log = EventLog(start_id=10)
+        threading.Timer(0.05, log.append, args=({'episode': 0},)).start()
+
+        # Act
+        events, finished = log.read(10, timeout=5)
+
+        # Assert
+        assert events == [(11, {'episode': 0})]
+        assert not finished
+
+    def test_overflowing_subscribers_get_merged_events(self):
+        """
+        Test the drop policy with and without a merge function.
+
+        WHY: A slow client must receive a bounded backlog that still ends
+             with the latest state, and the overflow must be reported.
+        HOW: Append six events, read with a buffer of 3, check what arrives
+             and the high-water mark.
+        """
+        # Arrange
+        merged_log = EventLog(merge=lambda events, aggregate: {'ids': [event['id'] for event in events]})
+        plain_log = EventLog()
+        merged = merged_log.subscribe(buffer_size=3)
+        plain = plain_log.subscribe(buffer_size=3)
+        for event_id in range(1, 7):
+            merged_log.append({'id': event_id})
+            plain_log.append({'id': event_id})
+
+        # Act
+        merged_events, _ = merged.read()
+        plain_events, _ = plain.read()
+
+        # Assert
+        assert merged_events == [(4, {'ids': [1, 2, 3, 4]}, False), (5, {'id': 5}, True), (6, {'id': 6}, True)]
+        assert [event_id for event_id, _, _ in plain_events] == [4, 5, 6]
+        assert merged.high_water == 6 and merged.dropped == 3
+        assert plain_log.get_stats()['dropped'] == 3
+        assert merged_log.get_stats()['backlog'] == 0
+        with pytest.raises(ValueError):
+            merged_log.subscribe(overflow='unbounded')
+
+    def test_block_policy_throttles_the_writer(self):
+        """
+        Test that a blocking subscriber bounds how far the writer runs ahead.
+
+        WHY: With 'block', the training thread waits instead of the client
+             losing events, and a stalled client must not stop it forever.
+        HOW: Write from a thread into a buffer of 2, read slowly, then stop
+             reading with a short block timeout.
+        """
+        # Arrange
+        log = EventLog(block_timeout=0.2)
+        subscription = log.subscribe(buffer_size=2, overflow='block')
+        writer = threading.Thread(target=lambda: [log.append({'id': event_id}) for event_id in range(1, 11)])
+
+        # Act
+        writer.start()
+        received = []
+        while len(received) < 6:
+            events, _ = subscription.read(timeout=5)
+            assert len(events) <= 2
+            received.extend(event_id for event_id, _, _ in events)
+        writer.join(timeout=5)
+
+        # Assert
+        assert received == [1, 2, 3, 4, 5, 6]
+        assert not writer.is_alive()
+        assert subscription.overflow == 'drop'
+        assert log.get_stats()['blocked_seconds'] >= 0.2
+
+    def test_block_policy_delivers_an_existing_backlog_in_order(self):
+        """
+        Test that a blocking subscriber joining late gets every event, in order.
+
+        WHY: 'block' promises no lost or merged events, also for the events
+             appended before the client subscribed.
+        HOW: Append five events to a merging log, subscribe with a buffer of 2
+             and read until the log is finished.
+        """
+        # Arrange
+        log = EventLog(merge=lambda events, aggregate: {'merged': len(events)})
+        log.append({'id': 1}, sync_point=True)
+        for event_id in range(2, 6):
+            log.append({'id': event_id})
+        log.close()
+        subscription = log.subscribe(buffer_size=2, overflow='block')
+
+        # Act
+        reads = []
+        finished = False
+        while not finished:
+            events, finished = subscription.read(timeout=0)
+            reads.append([event_id for event_id, _, _ in events])
+
+        # Assert
+        assert reads == [[1, 2], [3, 4], [5]]
+        assert subscription.dropped == 0
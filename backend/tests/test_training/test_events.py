@@ -0,0 +1,222 @@
+"""
+Tests for snapshot/delta encoding of training events.
+"""
+
+import pytest
+import numpy as np
+from environments.environment_manager import EnvironmentManager
+from algorithms.q_learning import QLearning
+from training.events import TrainingEventEncoder, EmissionPolicy, OptimalityTracker
+
+
+@pytest.fixture
+def q_learning():
+    """Q-Learning on the deterministic lake."""
+    env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+    yield QLearning(env, {'exploration_rate': 0.5})
+    env.close()
+
+
+class TestTrainingEventEncoder:
+    """Tests for TrainingEventEncoder."""
+
+    def test_without_interval_every_event_is_a_snapshot(self, q_learning):
+        """
+        Test the default (backwards compatible) behavior.
+
+        WHY: Clients that don't apply deltas must keep receiving full Q-tables.
+        HOW: Encode a few events without snapshot_interval.
+        """
+        # Arrange
+        encoder = TrainingEventEncoder(q_learning)
+
+        # Act
+        events = [encoder.encode() for _ in range(3)]
+
+        # Assert
+        assert [event['seq'] for event in events] == [1, 2, 3]
+        assert all(event['snapshot'] for event in events)
+        assert all('learning_data' in event for event in events)
+
+    def test_deltas_rebuild_the_q_table(self, q_learning):
+        """
+        Test that applying deltas to the first snapshot gives the current Q-table.
+
+        WHY: Deltas must not lose any update between snapshots.
+        HOW: Train episode by episode, apply each delta, compare with the real table.
+        """
+        # Arrange
+        encoder = TrainingEventEncoder(q_learning, snapshot_interval=1000)
+        first = encoder.encode()
+        client_table = np.array(first['learning_data']['q_table'])
+
+        # Act
+        for _ in range(50):
+            q_learning.train(1)
+            event = encoder.encode()
+            assert not event['snapshot']
+            for state, action, value in event['learning_delta']['q_updates']:
+                client_table[state, action] = value
+
+        # Assert
+        assert np.array_equal(client_table, q_learning.q_table)
+
+    def test_resync_forces_snapshot(self, q_learning):
+        """
+        Test that a resync request makes the next event a snapshot.
+
+        WHY: Clients that missed an event need a full table to recover.
+        HOW: Encode, request resync, check the next event.
+        """
+        # Arrange
+        encoder = TrainingEventEncoder(q_learning, snapshot_interval=1000)
+        encoder.encode()
+        assert not encoder.encode()['snapshot']
+
+        # Act
+        encoder.request_resync()
+        event = encoder.encode()
+
+        # Assert
+        assert event['snapshot']
+        assert event['seq'] == 3
+
+    def test_merged_events_carry_latest_state_and_aggregates(self, q_learning):
+        """
+        Test merging a run of snapshot and delta events for a slow subscriber.
+
+        WHY: A client that receives one merged event instead of many must end
+             up with the same Q-table and, when coalescing, the same totals.
+        HOW: Encode a snapshot and deltas with windows, merge from the start
+             and from after the snapshot, compare with the real table.
+        """
+        # Arrange
+        encoder = TrainingEventEncoder(q_learning, snapshot_interval=4)
+        policy = EmissionPolicy()
+        events = []
+        for episode in range(6):
+            q_learning.train(1)
+            policy.record(episode, float(episode % 2))
+            events.append(dict(encoder.encode(), window=policy.flush(episode)))
+        before = np.array(events[0]['learning_data']['q_table'])
+
+        # Act
+        merged = TrainingEventEncoder.merge(events, aggregate=True)
+        dropped = TrainingEventEncoder.merge(events[1:3])
+
+        # Assert
+        assert merged['snapshot'] and merged['seq'] == 6 and merged['merged'] == 6
+        assert np.array_equal(merged['learning_data']['q_table'], q_learning.q_table)
+        assert np.array_equal(events[0]['learning_data']['q_table'], before)
+        assert merged['window']['episodes'] == 6
+        assert merged['window']['first_episode'] == 0
+        assert merged['window']['success_rate'] == 0.5
+        assert not dropped['snapshot'] and dropped['merged'] == 2
+        assert dropped['window'] == events[2]['window']
+        cells = {(state, action) for event in events[1:3] for state, action, _ in event['learning_delta']['q_updates']}
+        assert {(state, action) for state, action, _ in dropped['learning_delta']['q_updates']} == cells
+
+
+class TestEmissionPolicy:
+    """Tests for EmissionPolicy decimation and window aggregation."""
+
+    def test_every_mode_aggregates_skipped_episodes(self):
+        """
+        Test that every-k mode emits every k-th episode with a window summary.
+
+        WHY: Long runs must not send one event per episode.
+        HOW: Record 10 episodes with k=5, check emitted episodes and aggregates.
+        """
+        # Arrange
+        policy = EmissionPolicy(mode='every', every=5)
+        emitted = []
+
+        # Act
+        for episode in range(10):
+            reward = 1.0 if episode % 2 == 0 else 0.0
+            policy.record(episode, reward, length=episode + 1)
+            if policy.should_emit(episode, 10):
+                emitted.append(policy.flush(episode))
+
+        # Assert
+        assert [window['last_episode'] for window in emitted] == [4, 9]
+        first = emitted[0]
+        assert first['episodes'] == 5
+        assert first['first_episode'] == 0
+        assert first['success_rate'] == pytest.approx(3 / 5)
+        assert first['min_reward'] == 0.0 and first['max_reward'] == 1.0
+        assert first['mean_length'] == pytest.approx(3.0)
+
+    def test_rate_mode_limits_events_per_second(self):
+        """
+        Test that rate mode emits at most max_rate events per second.
+
+        WHY: The stream bandwidth must be predictable regardless of training speed.
+        HOW: Use a fake clock advancing 10ms per episode with max_rate=10.
+        """
+        # Arrange
+        now = [0.0]
+        policy = EmissionPolicy(mode='rate', max_rate=10, clock=lambda: now[0])
+        emitted = []
+
+        # Act - 100 episodes over one simulated second
+        for episode in range(100):
+            now[0] += 0.01
+            policy.record(episode, 0.0)
+            if policy.should_emit(episode, 1000):
+                emitted.append(policy.flush(episode))
+
+        # Assert
+        assert 9 <= len(emitted) <= 11
+        assert sum(window['episodes'] for window in emitted) <= 100
+
+    def test_last_episode_is_always_emitted(self):
+        """
+        Test that the final episode is never decimated.
+
+        WHY: The client must see the final state of the run.
+        HOW: Use a large stride and check the last episode is emitted.
+        """
+        # Arrange
+        policy = EmissionPolicy(mode='every', every=1000)
+
+        # Act / Assert
+        policy.record(6, 0.0)
+        assert policy.should_emit(6, 7)
+
+    def test_invalid_settings_raise(self):
+        """
+        Test that invalid modes and missing rates are rejected.
+
+        WHY: Bad query parameters should become 400 errors, not silent defaults.
+        HOW: Construct invalid policies.
+        """
+        with pytest.raises(ValueError):
+            EmissionPolicy(mode='sometimes')
+        with pytest.raises(ValueError):
+            EmissionPolicy(mode='rate')
+
+
+class TestOptimalityTracker:
+    """Tests for distance-to-optimal metrics."""
+
+    def test_training_moves_q_table_towards_optimum(self, q_learning):
+        """
+        Test that regret and Q-distance shrink as Q-Learning converges.
+
+        WHY: Streams report these metrics to show learning progress.
+        HOW: Measure before and after training on the deterministic lake.
+        """
+        # Arrange
+        tracker = OptimalityTracker(q_learning, q_learning.env)
+        before = tracker.measure()
+
+        # Act
+        q_learning.train(2000)
+        after = tracker.measure()
+
+        # Assert
+        assert before['regret'] > 0
+        assert after['regret'] == pytest.approx(0.0, abs=1e-9)
+        assert after['q_distance'] < before['q_distance']
+        assert after['optimal_actions'] > before['optimal_actions']
@@ -0,0 +1,141 @@
+"""
+Tests for the process-pool training executor.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from training.executor import TrainingExecutor, QueueFullError, run_training_job
+from training.trainer import TrainingCoordinator
+
+
+def fail_job(spec):
+    """Job function that raises in the worker."""
+    raise RuntimeError('worker crashed')
+
+
+def wait_for(executor, job_id, timeout=60.0):
+    """Poll a job until it reaches a final status."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = executor.get_status(job_id)
+        if status['status'] in ('completed', 'failed', 'cancelled'):
+            return status
+        time.sleep(0.05)
+    raise TimeoutError(f"Job {job_id} did not finish")
+
+
+class TestTrainingExecutor:
+    """Tests for TrainingExecutor and TrainingCoordinator.submit_training_job."""
+
+    def test_job_trains_session_in_worker_process(self):
+        """
+        Test that a background job trains and updates its session.
+
+        WHY: Jobs run in another process, so their result must be copied back.
+        HOW: Train twice in a worker, check rewards, episode count and Q-table.
+        """
+        # Arrange
+        trainer = TrainingCoordinator(executor=TrainingExecutor(max_workers=1))
+        session_id = trainer.create_session(
+            'Q-Learning', 'FrozenLake-v1-NoSlip', {'num_episodes': 200}, seed=0, render='lazy'
+        )
+
+        try:
+            # Act
+            first = wait_for(trainer.executor, trainer.submit_training_job(session_id, 200))
+            second = wait_for(trainer.executor, trainer.submit_training_job(session_id, 100))
+
+            # Assert
+            session = trainer.get_session(session_id)
+            assert first['status'] == second['status'] == 'completed'
+            assert session['episodes_trained'] == 300
+            assert len(session['rewards']) == 300
+            assert session['running'] is False
+            assert session['algorithm'].q_table.any()
+            assert trainer.executor.get_job(second['job_id'])['learning_data']['q_table']
+        finally:
+            trainer.executor.shutdown()
+
+    def test_queue_limit_raises(self):
+        """
+        Test that submissions beyond max_queued are rejected.
+
+        WHY: The queue must stay bounded under load; callers answer 503.
+        HOW: Block the only worker, fill the queue, submit one more.
+        """
+        # Arrange
+        release = threading.Event()
+        executor = TrainingExecutor(max_workers=1, max_queued=1, job_function=lambda spec: {'ok': release.wait()})
+        executor._pool = ThreadPoolExecutor(max_workers=1)
+        running = executor.submit({'num_episodes': 1})
+        while executor.get_status(running)['status'] != 'running':
+            time.sleep(0.01)
+        queued = executor.submit({'num_episodes': 1})
+
+        # Act / Assert
+        with pytest.raises(QueueFullError):
+            executor.submit({'num_episodes': 1})
+        assert executor.cancel(queued)
+        assert executor.get_status(queued)['status'] == 'cancelled'
+
+        release.set()
+        assert wait_for(executor, running)['status'] == 'completed'
+        executor.shutdown()
+
+    def test_failed_job_releases_its_session(self):
+        """
+        Test that a job whose worker raises still finishes its session.
+
+        WHY: A session stuck in running=True rejects all further training
+             and is never evicted.
+        HOW: Submit a job whose function raises, check the failed status and
+             that the session can train again.
+        """
+        # Arrange
+        trainer = TrainingCoordinator(executor=TrainingExecutor(max_workers=1, job_function=fail_job))
+        trainer.executor._pool = ThreadPoolExecutor(max_workers=1)
+        session_id = trainer.create_session('Q-Learning', 'FrozenLake-v1-NoSlip', {}, seed=0, render='lazy')
+
+        # Act
+        status = wait_for(trainer.executor, trainer.submit_training_job(session_id, 10))
+
+        # Assert
+        assert status['status'] == 'failed'
+        assert status['error'] == 'worker crashed'
+        assert trainer.get_session(session_id)['running'] is False
+        assert trainer.train(session_id, 5) == 5
+        trainer.executor.shutdown()
+
+    def test_job_of_a_reset_session_is_not_checkpointed(self, tmp_path):
+        """
+        Test that a job finishing after its session was reset still completes.
+
+        WHY: The result cannot be checkpointed any more; trying to must neither
+             fail the job nor write the reset session back to disk.
+        HOW: Hold the job in its worker, reset all sessions, then let it finish.
+        """
+        # Arrange
+        release = threading.Event()
+
+        def held_job(spec):
+            release.wait()
+            return run_training_job(spec)
+
+        trainer = TrainingCoordinator(checkpoint_dir=str(tmp_path),
+                                      executor=TrainingExecutor(max_workers=1, job_function=held_job))
+        trainer.executor._pool = ThreadPoolExecutor(max_workers=1)
+        session_id = trainer.create_session('Q-Learning', 'FrozenLake-v1-NoSlip', {}, seed=0, render='lazy')
+        job_id = trainer.submit_training_job(session_id, 10)
+
+        # Act
+        trainer.reset_all_sessions()
+        release.set()
+        status = wait_for(trainer.executor, job_id)
+
+        # Assert
+        assert status['status'] == 'completed'
+        assert trainer.checkpoints.list_sessions() == []
+        trainer.executor.shutdown()
@@ -0,0 +1,70 @@
+"""
+Tests for generator-based policy playback and rollout batches.
+"""
+
+import pytest
+from algorithms import ValueIteration
+from environments.environment_manager import EnvironmentManager
+from training.playback import iter_rollouts
+
+
+class TestPlayback:
+    """Tests for BaseAlgorithm.iter_policy and iter_rollouts."""
+
+    @staticmethod
+    def planned_agent(environment_name):
+        """Value iteration agent solved for an environment (an optimal policy)."""
+        env = EnvironmentManager.create_environment(environment_name, seed=0, render_mode=None)
+        agent = ValueIteration(env, {'discount_factor': 0.99})
+        agent.train(1000)
+        return agent
+
+    def test_iter_policy_yields_each_step_before_the_next(self, mocker):
+        """
+        Test that playback renders one frame per step, as the episode runs.
+
+        WHY: Streaming clients should see each frame as soon as it exists.
+        HOW: Consume the first step only, then the rest, counting renders.
+        """
+        # Arrange
+        agent = self.planned_agent('FrozenLake-v1-NoSlip')
+        render = mocker.spy(agent, 'render_frame')
+
+        # Act
+        steps = agent.iter_policy()
+        first = next(steps)
+        renders_after_first = render.call_count
+        rest = list(steps)
+
+        # Assert
+        assert renders_after_first == 1
+        assert first['frame'] is not None
+        assert len(rest) == 5
+        assert rest[-1]['terminated'] and rest[-1]['reward'] == 1.0
+
+    def test_rollout_batch_renders_only_sampled_episodes(self, mocker):
+        """
+        Test batch statistics and that only the sampled episodes are rendered.
+
+        WHY: Large batches must not pay for rendering every episode.
+        HOW: Run 200 rollouts of an optimal slippery policy, render 2 of them.
+        """
+        # Arrange
+        agent = self.planned_agent('FrozenLake-v1')
+        render = mocker.spy(agent, 'render_frame')
+
+        # Act
+        items = list(iter_rollouts(agent, 200, render_episodes=2, seed=0))
+
+        # Assert
+        episodes = [item for item in items if item['kind'] == 'episode']
+        steps = [item for item in items if item['kind'] == 'step']
+        stats = episodes[-1]['stats'].summary()
+        assert len(episodes) == 200
+        assert sum(episode['rendered'] for episode in episodes) == 2
+        assert len(steps) == render.call_count == sum(e['length'] for e in episodes if e['rendered'])
+        assert stats['episodes'] == 200
+        assert stats['success_ci'][0] <= stats['success_rate'] <= stats['success_ci'][1]
+        assert 0.5 < stats['success_rate'] < 1.0
+        with pytest.raises(ValueError):
+            iter_rollouts(agent, 5, render_episodes=6)
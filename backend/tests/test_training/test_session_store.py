@@ -0,0 +1,120 @@
+"""
+Tests for the bounded session store.
+"""
+
+import threading
+
+import pytest
+from training.session_store import SessionStore, estimate_session_memory
+from training.trainer import TrainingCoordinator
+
+
+class TestSessionStore:
+    """Tests for LRU, TTL and memory-based eviction."""
+
+    def test_lru_session_is_evicted_at_capacity(self):
+        """
+        Test that the least recently used session is evicted first.
+
+        WHY: Repeated "train" clicks must not grow memory without limit.
+        HOW: Fill a store of size 2, touch the oldest, add a third.
+        """
+        # Arrange
+        evicted = []
+        store = SessionStore(max_sessions=2, on_evict=lambda sid, session: evicted.append(sid))
+        store.add('a', {})
+        store.add('b', {})
+
+        # Act
+        store.get('a')      # 'b' is now least recently used
+        store.add('c', {})
+
+        # Assert
+        assert evicted == ['b']
+        assert 'a' in store and 'c' in store
+        assert store.evictions == 1
+
+    def test_idle_sessions_expire(self):
+        """
+        Test that sessions unused for longer than the TTL are evicted.
+
+        WHY: Abandoned browser tabs should free their sessions.
+        HOW: Advance a fake clock past the TTL.
+        """
+        # Arrange
+        now = [0.0]
+        store = SessionStore(idle_ttl=60, clock=lambda: now[0])
+        store.add('a', {})
+
+        # Act
+        now[0] = 61.0
+
+        # Assert
+        assert store.get('a') is None
+
+    def test_running_sessions_are_never_evicted(self):
+        """
+        Test that a session marked as running survives eviction pressure.
+
+        WHY: Evicting a session mid-training would close its env under the trainer.
+        HOW: Mark the oldest session as running and exceed capacity.
+        """
+        # Arrange
+        store = SessionStore(max_sessions=1)
+        store.add('busy', {'running': True})
+
+        # Act
+        store.add('new', {})
+
+        # Assert
+        assert 'busy' in store
+
+    def test_evicted_sessions_are_closed_outside_the_lock(self):
+        """
+        Test that on_evict runs after the store's lock is released.
+
+        WHY: Closing an environment or flushing a recorder does I/O; under
+             the lock it would block every other request using the store.
+        HOW: From on_evict, look up a session in another thread.
+        """
+        # Arrange
+        lookups = []
+
+        def on_evict(session_id, session):
+            thread = threading.Thread(target=lambda: lookups.append(store.get('b')))
+            thread.start()
+            thread.join(timeout=5)
+            lookups.append(thread.is_alive())
+
+        store = SessionStore(max_sessions=1, on_evict=on_evict)
+        store.add('a', {})
+
+        # Act
+        store.add('b', {'name': 'b'})
+
+        # Assert
+        assert lookups == [{'name': 'b'}, False]
+
+    def test_coordinator_reports_memory_and_closes_evicted_envs(self, mocker):
+        """
+        Test coordinator integration: memory estimates and env cleanup.
+
+        WHY: Evicted sessions must release their Gymnasium environments.
+        HOW: Create two sessions with max_sessions=1, check the first env was closed.
+        """
+        # Arrange
+        coordinator = TrainingCoordinator(max_sessions=1)
+        first_id = coordinator.create_session('Q-Learning', 'FrozenLake-v1', {})
+        first_env = coordinator.get_session(first_id)['environment']
+        close_spy = mocker.spy(first_env, 'close')
+
+        # Act
+        second_id = coordinator.create_session('Q-Learning', 'FrozenLake-v1', {})
+        info = coordinator.get_sessions_info()
+
+        # Assert
+        assert close_spy.call_count == 1
+        assert not coordinator.session_exists(first_id)
+        assert [entry['session_id'] for entry in info] == [second_id]
+        assert info[0]['memory_bytes'] == estimate_session_memory(coordinator.get_session(second_id))
+        assert info[0]['memory_bytes'] > 0
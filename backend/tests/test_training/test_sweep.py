@@ -0,0 +1,170 @@
+"""
+Tests for hyperparameter sweeps.
+"""
+
+import pytest
+import numpy as np
+from algorithms import QLearning
+from concurrent.futures import ThreadPoolExecutor
+from training.executor import TrainingExecutor, run_training_job
+from training.sweep import Sweep, expand_sweep, score_rewards
+
+
+def fail_slow_runs(spec):
+    """Job function that raises for the learning rate 0.01."""
+    if spec['parameters']['learning_rate'] == 0.01:
+        raise RuntimeError('worker crashed')
+    return run_training_job(spec)
+
+
+class TestSweep:
+    """Tests for sweep expansion, scoring and execution."""
+
+    def test_grid_and_random_expansion_follow_schema(self):
+        """
+        Test that search spaces expand into validated configurations.
+
+        WHY: Sweeps must only train parameter values the schema allows.
+        HOW: Expand a grid and a random space, then an out-of-range grid.
+        """
+        # Arrange
+        schema = QLearning.get_parameter_schema('FrozenLake-v1')
+
+        # Act
+        grid = expand_sweep(schema, {'learning_rate': [0.1, 0.5], 'q_init_strategy': ['fixed', 'random']},
+                            base_parameters={'discount_factor': 0.9})
+        random = expand_sweep(schema, {'exploration_rate': {'min': 0.2}}, mode='random',
+                              num_samples=10, sample_seed=0)
+
+        # Assert
+        assert len(grid) == 4
+        assert {'learning_rate': 0.5, 'q_init_strategy': 'random', 'discount_factor': 0.9} in grid
+        assert all(0.2 <= config['exploration_rate'] <= 1.0 for config in random)
+        with pytest.raises(ValueError):
+            expand_sweep(schema, {'discount_factor': [0.5, 1.5]})
+
+    def test_unknown_base_parameters_are_rejected(self):
+        """
+        Test that fixed parameters outside the schema fail the expansion.
+
+        WHY: Dropping them silently would run a different sweep than requested.
+        HOW: Expand a grid with a misspelled base parameter.
+        """
+        # Arrange
+        schema = QLearning.get_parameter_schema('FrozenLake-v1')
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Unknown parameter 'learning_rat'"):
+            expand_sweep(schema, {'discount_factor': [0.9]}, base_parameters={'learning_rat': 0.5})
+
+    def test_unknown_environment_is_rejected(self):
+        """
+        Test that a sweep on an unsupported environment is not built.
+
+        WHY: Otherwise the API answers 202 and every run fails in its worker.
+        HOW: Build a sweep for 'Bogus-v0' and check nothing was submitted.
+        """
+        # Arrange
+        executor = TrainingExecutor(max_workers=1)
+
+        try:
+            # Act / Assert
+            with pytest.raises(ValueError, match="Environment 'Bogus-v0' not supported"):
+                Sweep.from_request(executor, {
+                    'algorithm': 'Q-Learning',
+                    'environment': 'Bogus-v0',
+                    'space': {'learning_rate': [0.1]}
+                })
+            assert executor.list_jobs() == []
+        finally:
+            executor.shutdown()
+
+    def test_score_rewards(self):
+        """
+        Test success rate, AUC and episodes-to-threshold of a reward curve.
+
+        WHY: These metrics decide the ranking.
+        HOW: Score a curve that starts succeeding halfway through.
+        """
+        # Arrange
+        rewards = np.array([0.0] * 10 + [1.0] * 10)
+
+        # Act
+        metrics = score_rewards(rewards, threshold=0.5, window=4)
+
+        # Assert
+        assert metrics['final_success_rate'] == 1.0
+        assert metrics['auc'] == 0.5
+        assert metrics['episodes_to_threshold'] == 12
+
+    def test_sweep_runs_and_ranks_configurations(self):
+        """
+        Test a small sweep end to end on the worker pool.
+
+        WHY: Every configuration and seed must be trained and ranked once.
+        HOW: Sweep two learning rates over two seeds, read the final ranking.
+        """
+        # Arrange
+        executor = TrainingExecutor(max_workers=1)
+        sweep = Sweep.from_request(executor, {
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'space': {'learning_rate': [0.01, 0.5]},
+            'seeds': 2,
+            'num_episodes': 200,
+            'window': 50
+        })
+
+        try:
+            # Act
+            sweep.start()
+            position, finished = 0, False
+            while not finished:
+                events, finished = sweep.events.read(position, timeout=60)
+                position = events[-1][0] if events else position
+
+            # Assert
+            ranking = events[-1][1]['ranking']
+            assert events[-1][1]['status'] == 'complete'
+            assert [row['rank'] for row in ranking] == [1, 2]
+            assert all(row['seeds'] == 2 for row in ranking)
+            assert ranking[0]['final_success_rate'] >= ranking[1]['final_success_rate']
+        finally:
+            executor.shutdown()
+
+    def test_sweep_completes_when_a_run_fails(self):
+        """
+        Test that a run whose worker raises does not stall the sweep.
+
+        WHY: Later runs are submitted as runs finish; a failed run that
+             never reports back leaves the sweep and its stream open forever.
+        HOW: Make one configuration's jobs raise, read the stream to the end
+             and check the failed runs and the ranking of the other one.
+        """
+        # Arrange
+        executor = TrainingExecutor(max_workers=1, job_function=fail_slow_runs)
+        executor._pool = ThreadPoolExecutor(max_workers=1)
+        sweep = Sweep.from_request(executor, {
+            'algorithm': 'Q-Learning',
+            'environment': 'FrozenLake-v1-NoSlip',
+            'space': {'learning_rate': [0.01, 0.5]},
+            'seeds': 2,
+            'num_episodes': 50
+        })
+
+        try:
+            # Act
+            sweep.start()
+            position, finished = 0, False
+            while not finished:
+                events, finished = sweep.events.read(position, timeout=60)
+                position = events[-1][0] if events else position
+
+            # Assert
+            status = sweep.get_status()
+            assert events[-1][1]['status'] == status['status'] == 'complete'
+            assert status['runs'] == {'failed': 2, 'completed': 2}
+            assert all(run['error'] == 'worker crashed' for run in sweep.runs if run['status'] == 'failed')
+            assert [row['parameters']['learning_rate'] for row in status['ranking']] == [0.5]
+        finally:
+            executor.shutdown()
@@ -0,0 +1,119 @@
+"""
+Tests for the columnar trajectory recorder.
+"""
+
+import numpy as np
+import pytest
+from algorithms.q_learning import QLearning
+from environments.environment_manager import EnvironmentManager
+from training.trainer import TrainingCoordinator
+from training.trajectories import TrajectoryRecorder, TrajectoryStore
+
+
+class TestTrajectoryRecorder:
+    """Tests for TrajectoryRecorder and trajectory-recording sessions."""
+
+    def test_round_trip_across_chunks_and_reopen(self, tmp_path):
+        """
+        Test that transitions come back unchanged across chunk boundaries.
+
+        WHY: Episodes are written in slices that may span several chunk
+             files, and a reopened recording must continue where it stopped.
+        HOW: Record episodes into 7-transition chunks, flush, reopen, record
+             more, and compare every column with the input.
+        """
+        # Arrange
+        recorder = TrajectoryRecorder(str(tmp_path), chunk_size=7)
+        lengths = [3, 9, 1, 16]
+        episodes = [
+            (list(range(n)), [i % 4 for i in range(n)], [float(i == n - 1) for i in range(n)],
+             list(range(1, n + 1)), [i == n - 1 for i in range(n)])
+            for n in lengths
+        ]
+
+        # Act
+        for episode in episodes[:2]:
+            recorder.record_episode(*episode)
+        recorder.flush()
+        recorder = TrajectoryRecorder(str(tmp_path))
+        for episode in episodes[2:]:
+            recorder.record_episode(*episode)
+        columns = recorder.read(0, 100)
+
+        # Assert
+        assert len(recorder._chunks) == 5 and recorder.chunk_size == 7
+        assert recorder.get_stats()['transitions'] == sum(lengths) == len(columns['state'])
+        assert recorder.nbytes() == 10 * sum(lengths) + 8 * len(lengths)
+        assert columns['state'].dtype == np.uint16 and columns['action'].dtype == np.uint8
+        assert columns['reward'].dtype == np.float32
+        assert columns['episode'].tolist() == [e for e, n in enumerate(lengths) for _ in range(n)]
+        assert columns['step'].tolist() == [i for n in lengths for i in range(n)]
+        assert columns['next_state'].tolist() == [i + 1 for n in lengths for i in range(n)]
+        assert columns['terminated'].sum() == columns['reward'].sum() == len(lengths)
+        part = recorder.read(5, 13)
+        assert part['state'].tolist() == columns['state'][5:13].tolist()
+        assert recorder.episode_range(1) == range(3, 12)
+        assert recorder.episode_range(4) is None
+
+    def test_q_learning_records_every_transition(self, tmp_path):
+        """
+        Test the recording of a Q-Learning run.
+
+        WHY: The recording is only useful if it matches what training did.
+        HOW: Train with a recorder, compare episode lengths and returns with
+             the values reported to the callback.
+        """
+        # Arrange
+        env = EnvironmentManager.create_environment('FrozenLake-v1-NoSlip', seed=0)
+        q_learning = QLearning(env, {'exploration_rate': 0.5})
+        q_learning.recorder = TrajectoryRecorder(str(tmp_path))
+        rewards, lengths = [], []
+
+        def callback(episode, reward, learning_data, frame):
+            rewards.append(reward)
+            lengths.append(q_learning.last_episode_length)
+
+        # Act
+        q_learning.train(200, callback, lazy=True)
+        columns = q_learning.recorder.read(0, q_learning.recorder.length)
+
+        # Assert
+        assert np.bincount(columns['episode']).tolist() == lengths
+        assert np.bincount(columns['episode'], weights=columns['reward']).tolist() == rewards
+        follows = columns['step'][1:] > 0
+        assert np.array_equal(columns['state'][1:][follows], columns['next_state'][:-1][follows])
+
+    def test_recording_outlives_eviction_and_continues_after_restore(self, tmp_path):
+        """
+        Test recording sessions in the training coordinator.
+
+        WHY: Recordings are on disk; they should stay readable after the
+             session is evicted and grow again when it is restored.
+        HOW: Record a run, evict the session, read the recording, restore
+             the session from its checkpoint and train more.
+        """
+        # Arrange
+        coordinator = TrainingCoordinator(
+            checkpoint_dir=str(tmp_path / 'checkpoints'),
+            trajectory_dir=str(tmp_path / 'trajectories')
+        )
+        session_id = coordinator.create_session('Q-Learning', 'FrozenLake-v1-NoSlip', {}, seed=0, record=True)
+        coordinator.train(session_id, 20)
+        length = coordinator.get_trajectories(session_id).length
+
+        # Act
+        coordinator.sessions.remove(session_id)
+        evicted = coordinator.get_trajectories(session_id)
+        coordinator.train(session_id, 10)
+        restored = coordinator.get_trajectories(session_id)
+
+        # Assert
+        assert evicted.episodes == 20 and evicted.length == length
+        assert restored.episodes == 30 and restored.length > length
+        assert coordinator.get_sessions_info()[0]['trajectories']['episodes'] == 30
+        with pytest.raises(ValueError):
+            coordinator.create_session('Value Iteration', 'FrozenLake-v1', {}, record=True)
+        with pytest.raises(ValueError):
+            TrajectoryStore(str(tmp_path)).open('..')
+        coordinator.reset_all_sessions()
+        assert coordinator.get_trajectories(session_id) is None
@@ -0,0 +1,147 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class CheckpointStore:
+    """
+    Persists trained sessions to a local directory.
+
+    Each session gets its own subdirectory with one .npy file per algorithm
+    array (e.g. q_table.npy), the per-episode reward history (rewards.npy) and
+    a meta.json with algorithm, environment, parameters, seed and episode
+    count. Arrays are loaded memory-mapped (copy-on-write), so cold-loading a
+    session costs one mmap per array instead of a retrain, and continuing to
+    train never modifies the file until the next save.
+    """
+
+    META_FILE = 'meta.json'
+    REWARDS_FILE = 'rewards.npy'
+
+    def __init__(self, directory: str):
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Root directory for checkpoints
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _session_dir(self, session_id: str) -> str:
+        """
+        Return the checkpoint directory of a session.
+
+        Raises:
+            ValueError: If the session ID could escape the checkpoint directory
+        """
+        if not session_id or os.path.basename(session_id) != session_id or session_id in ('.', '..'):
+            raise ValueError(f"Invalid session ID '{session_id}'")
+        return os.path.join(self.directory, session_id)
+
+    def exists(self, session_id: str) -> bool:
+        """
+        Check whether a checkpoint exists for a session.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            True if a complete checkpoint exists
+        """
+        try:
+            return os.path.isfile(os.path.join(self._session_dir(session_id), self.META_FILE))
+        except ValueError:
+            return False
+
+    def save(
+        self,
+        session_id: str,
+        meta: Dict[str, Any],
+        arrays: Dict[str, np.ndarray],
+        rewards: List[float]
+    ) -> None:
+        """
+        Write a checkpoint, replacing any previous one atomically.
+
+        Args:
+            session_id: Session UUID
+            meta: JSON-serializable metadata (algorithm, environment, parameters, ...)
+            arrays: Named algorithm arrays (from BaseAlgorithm.get_checkpoint)
+            rewards: Per-episode reward history
+        """
+        target = self._session_dir(session_id)
+        staging = tempfile.mkdtemp(prefix=f'.{session_id}-', dir=self.directory)
+
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f'{name}.npy'), np.ascontiguousarray(array))
+            np.save(os.path.join(staging, self.REWARDS_FILE), np.asarray(rewards, dtype=np.float32))
+            with open(os.path.join(staging, self.META_FILE), 'w') as f:
+                json.dump(dict(meta, arrays=sorted(arrays)), f)
+
+            # Swap the new checkpoint in; readers see either the old or the new one
+            if os.path.isdir(target):
+                retired = tempfile.mkdtemp(prefix=f'.{session_id}-old-', dir=self.directory)
+                os.replace(target, os.path.join(retired, 'checkpoint'))
+                os.replace(staging, target)
+                shutil.rmtree(retired, ignore_errors=True)
+            else:
+                os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a checkpoint with memory-mapped arrays.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Dict with meta (dict), arrays (name -> copy-on-write memmap) and
+            rewards (list), or None if there is no checkpoint
+        """
+        if not self.exists(session_id):
+            return None
+
+        session_dir = self._session_dir(session_id)
+        with open(os.path.join(session_dir, self.META_FILE)) as f:
+            meta = json.load(f)
+
+        arrays = {
+            name: np.load(os.path.join(session_dir, f'{name}.npy'), mmap_mode='c')
+            for name in meta.pop('arrays')
+        }
+        rewards = np.load(os.path.join(session_dir, self.REWARDS_FILE)).tolist()
+
+        return {'meta': meta, 'arrays': arrays, 'rewards': rewards}
+
+    def delete(self, session_id: str) -> None:
+        """
+        Remove a session's checkpoint, if any.
+
+        Args:
+            session_id: Session UUID
+        """
+        if self.exists(session_id):
+            shutil.rmtree(self._session_dir(session_id), ignore_errors=True)
+
+    def list_sessions(self) -> List[str]:
+        """
+        List session IDs with a checkpoint.
+
+        Returns:
+            List of session UUIDs
+        """
+        return [name for name in os.listdir(self.directory) if not name.startswith('.') and self.exists(name)]
+
+    def clear(self) -> None:
+        """Remove all checkpoints."""
+        for session_id in self.list_sessions():
+            self.delete(session_id)
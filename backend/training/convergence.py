@@ -0,0 +1,138 @@
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class TrainingMetrics:
+    """
+    Rolling training statistics with an optional convergence stopping rule.
+
+    Fed once per episode from the training loop; every update and every
+    snapshot is O(1) regardless of the number of episodes or states. Tracks
+    over the last window episodes the success rate (reward > 0), mean reward
+    and mean episode length, and per episode the largest absolute Q-value
+    update and the number of greedy-action changes reported by the algorithm
+    (BaseAlgorithm.last_max_q_change / last_policy_changes).
+
+    Stopping rule: with a stop_threshold, training has converged once
+    stop_window consecutive episodes changed no greedy action and no Q-value
+    by stop_threshold or more. An episode only counts as stable while the
+    rolling window contains a successful episode: an agent that has not
+    found the goal (or lost it) changes no Q-value simply because it has
+    seen no reward, which is not convergence.
+    """
+
+    def __init__(
+        self,
+        window: int = 100,
+        stop_threshold: Optional[float] = None,
+        stop_window: int = 100
+    ):
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of recent episodes the rolling statistics cover
+            stop_threshold: Largest Q-value change per episode that counts as
+                            stable (None disables the stopping rule)
+            stop_window: Consecutive stable episodes required to converge
+
+        Raises:
+            ValueError: If a setting is out of range
+        """
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window}")
+        if stop_threshold is not None and stop_threshold <= 0:
+            raise ValueError(f"stop_threshold must be positive, got {stop_threshold}")
+        if stop_window < 1:
+            raise ValueError(f"stop_window must be a positive integer, got {stop_window}")
+
+        self.window = window
+        self.stop_threshold = stop_threshold
+        self.stop_window = stop_window
+
+        # Recent episodes with running sums (updated on append and eviction)
+        self._rewards: 'deque[float]' = deque(maxlen=window)
+        self._lengths: 'deque[float]' = deque(maxlen=window)
+        self._reward_sum = 0.0
+        self._length_sum = 0.0
+        self._successes = 0
+
+        self.episodes = 0
+        self.max_q_change: Optional[float] = None
+        self.policy_changes: Optional[int] = None
+        self.total_policy_changes = 0
+        self.stable_episodes = 0
+        self.converged_after: Optional[int] = None
+
+    def record(
+        self,
+        reward: float,
+        length: Optional[float] = None,
+        max_q_change: Optional[float] = None,
+        policy_changes: Optional[int] = None
+    ) -> bool:
+        """
+        Add an episode.
+
+        Args:
+            reward: Total episode reward
+            length: Number of steps in the episode, if known
+            max_q_change: Largest absolute Q-value update in the episode, if tracked
+            policy_changes: Number of greedy-action changes in the episode, if tracked
+
+        Returns:
+            True if the stopping rule is met (from this episode on)
+        """
+        length = length or 0.0
+        if len(self._rewards) == self.window:
+            evicted = self._rewards[0]
+            self._reward_sum -= evicted
+            self._length_sum -= self._lengths[0]
+            self._successes -= evicted > 0
+        self._rewards.append(reward)
+        self._lengths.append(length)
+        self._reward_sum += reward
+        self._length_sum += length
+        self._successes += reward > 0
+
+        self.episodes += 1
+        self.max_q_change = max_q_change
+        self.policy_changes = policy_changes
+        self.total_policy_changes += policy_changes or 0
+
+        if self.stop_threshold is None or max_q_change is None:
+            return False
+        stable = self._successes > 0 and max_q_change < self.stop_threshold and not policy_changes
+        self.stable_episodes = self.stable_episodes + 1 if stable else 0
+        if self.converged_after is None and self.stable_episodes >= self.stop_window:
+            self.converged_after = self.episodes
+        return self.converged_after is not None
+
+    @property
+    def converged(self) -> bool:
+        """True once the stopping rule has been met."""
+        return self.converged_after is not None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current statistics.
+
+        Returns:
+            Dictionary with episodes, window, success_rate, mean_reward and
+            mean_length (over the last window episodes), max_q_change and
+            policy_changes (last episode), total_policy_changes,
+            stable_episodes and converged
+        """
+        count = max(len(self._rewards), 1)
+        return {
+            'episodes': self.episodes,
+            'window': len(self._rewards),
+            'success_rate': self._successes / count,
+            'mean_reward': self._reward_sum / count,
+            'mean_length': self._length_sum / count,
+            'max_q_change': self.max_q_change,
+            'policy_changes': self.policy_changes,
+            'total_policy_changes': self.total_policy_changes,
+            'stable_episodes': self.stable_episodes,
+            'converged': self.converged
+        }
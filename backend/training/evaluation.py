@@ -0,0 +1,281 @@
+import math
+from typing import Any, Dict, Optional
+
+import gymnasium as gym
+import numpy as np
+
+from algorithms import BaseAlgorithm
+from environments.environment_manager import EnvironmentManager
+
+
+# Environments stepped side by side by the model-free Monte-Carlo fallback
+ROLLOUT_BATCH_SIZE = 256
+
+# Two-sided 95% normal quantile for confidence intervals
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> list:
+    """
+    Wilson score confidence interval for a success probability.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        z: Normal quantile (default: 95% interval)
+
+    Returns:
+        [lower, upper] bounds
+    """
+    if trials == 0:
+        return [0.0, 1.0]
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    center = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return [max(0.0, center - margin), min(1.0, center + margin)]
+
+
+class PolicyEvaluator:
+    """
+    Evaluates the greedy policy of a tabular algorithm.
+
+    A single playback says little about a stochastic policy, so the evaluator
+    computes its quality over the whole state distribution:
+
+        exact:       solves the linear systems of the environment's compiled
+                     model for the success probability (episode ends with a
+                     positive reward) and the discounted expected return
+        monte_carlo: runs many rollouts at once, on the compiled model
+                     (TabularModel.step_batch) or, for environments without
+                     a model, on a vector of environment copies, and reports
+                     means with 95% confidence intervals
+
+    'auto' uses the exact method whenever the environment has a model.
+    The exact method ignores the episode step limit; Monte-Carlo rollouts are
+    truncated at it, like real episodes.
+    """
+
+    METHODS = ('auto', 'exact', 'monte_carlo')
+
+    def __init__(self, algorithm: BaseAlgorithm, env):
+        """
+        Initialize the evaluator.
+
+        Args:
+            algorithm: Algorithm with a q_table (S, A) or (N, S, A)
+            env: The algorithm's environment
+
+        Raises:
+            ValueError: If the algorithm has no Q-table
+        """
+        if not hasattr(algorithm, 'q_table'):
+            raise ValueError('Policy evaluation requires an algorithm with a Q-table')
+
+        self.algorithm = algorithm
+        self.env = env
+        try:
+            self.model = EnvironmentManager.compile_environment(env)
+        except ValueError:
+            self.model = None
+
+    def greedy_policy(self) -> np.ndarray:
+        """
+        Return the greedy action per state (mean Q-values for batched algorithms).
+
+        Returns:
+            Action per state, shape (S,)
+        """
+        q_table = self.algorithm.q_table
+        if q_table.ndim == 3:
+            q_table = q_table.mean(axis=0)
+        return q_table.argmax(axis=1)
+
+    def evaluate(self, method: str = 'auto', num_rollouts: int = 1000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Evaluate the current greedy policy.
+
+        Args:
+            method: One of METHODS
+            num_rollouts: Number of Monte-Carlo rollouts
+            seed: Seed for Monte-Carlo rollouts
+
+        Returns:
+            Evaluation results (see exact() and monte_carlo())
+
+        Raises:
+            ValueError: If the method is unknown, or 'exact' is requested for
+                        an environment without a model
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown evaluation method '{method}'. Available methods: {list(self.METHODS)}")
+        if method == 'exact' or (method == 'auto' and self.model is not None):
+            return self.exact()
+        return self.monte_carlo(num_rollouts, seed)
+
+    def exact(self) -> Dict[str, Any]:
+        """
+        Compute success probability and expected return from the model.
+
+        Success and termination probabilities solve (I - P_pi) x = b on the
+        states from which the episode can terminate (elsewhere they are 0,
+        which keeps the system non-singular without discounting). The
+        expected return is discounted with the algorithm's discount factor.
+
+        Returns:
+            Dictionary with method, success_probability, termination_probability,
+            expected_return, discount_factor and state_success_probability (per state)
+
+        Raises:
+            ValueError: If the environment has no tabular model
+        """
+        model = self.model
+        if model is None:
+            raise ValueError('Exact evaluation requires an environment with a tabular model (env.unwrapped.P)')
+
+        policy = self.greedy_policy()
+        states = np.arange(model.num_states)
+        probs = model.transition_probs[states, policy]
+        next_states = model.next_states[states, policy]
+        terminals = model.terminals[states, policy]
+        continue_probs = model.continue_probs[states, policy]
+
+        end_probs = (probs * terminals).sum(axis=1)
+        success_probs = (probs * terminals * (model.rewards[states, policy] > 0)).sum(axis=1)
+
+        # States from which termination is reachable, by backward propagation
+        can_end = end_probs > 0
+        while True:
+            expanded = can_end | ((continue_probs > 0) & can_end[next_states]).any(axis=1)
+            if np.array_equal(expanded, can_end):
+                break
+            can_end = expanded
+
+        reachable = np.flatnonzero(can_end)
+        index = np.full(model.num_states, -1)
+        index[reachable] = np.arange(len(reachable))
+        transition_matrix = np.zeros((len(reachable), len(reachable)))
+        rows = np.repeat(np.arange(len(reachable)), model.max_outcomes)
+        columns = index[next_states[reachable]].ravel()
+        weights = continue_probs[reachable].ravel()
+        valid = (columns >= 0) & (weights > 0)
+        np.add.at(transition_matrix, (rows[valid], columns[valid]), weights[valid])
+
+        system = np.eye(len(reachable)) - transition_matrix
+        state_success = np.zeros(model.num_states)
+        state_end = np.zeros(model.num_states)
+        if len(reachable):
+            solution = np.linalg.solve(system, np.stack([success_probs[reachable], end_probs[reachable]], axis=1))
+            state_success[reachable], state_end[reachable] = solution[:, 0], solution[:, 1]
+
+        # Batched algorithms may use one discount factor per agent
+        discount_factor = float(np.mean(self.algorithm.parameters.get('discount_factor', 0.95)))
+        values = model.evaluate_policy(policy, discount_factor)
+        start = model.initial_distribution
+
+        return {
+            'method': 'exact',
+            'success_probability': float(np.clip(start @ state_success, 0.0, 1.0)),
+            'termination_probability': float(np.clip(start @ state_end, 0.0, 1.0)),
+            'expected_return': float(start @ values),
+            'discount_factor': discount_factor,
+            'state_success_probability': np.clip(state_success, 0.0, 1.0).tolist()
+        }
+
+    def monte_carlo(self, num_rollouts: int = 1000, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Estimate the policy's performance from many simultaneous rollouts.
+
+        Args:
+            num_rollouts: Number of episodes
+            seed: Random seed (None for fresh entropy)
+
+        Returns:
+            Dictionary with method, rollouts, success_rate, success_ci,
+            mean_return, return_ci, mean_length and truncated_rate
+
+        Raises:
+            ValueError: If num_rollouts is not positive
+        """
+        if num_rollouts < 1:
+            raise ValueError(f"num_rollouts must be a positive integer, got {num_rollouts}")
+
+        policy = self.greedy_policy()
+        if self.model is not None:
+            returns, lengths, successes, truncated = self._rollouts_on_model(policy, num_rollouts, seed)
+        else:
+            returns, lengths, successes, truncated = self._rollouts_on_env(policy, num_rollouts, seed)
+
+        margin = Z_95 * returns.std(ddof=1) / math.sqrt(num_rollouts) if num_rollouts > 1 else 0.0
+        return {
+            'method': 'monte_carlo',
+            'rollouts': num_rollouts,
+            'success_rate': float(successes.mean()),
+            'success_ci': wilson_interval(int(successes.sum()), num_rollouts),
+            'mean_return': float(returns.mean()),
+            'return_ci': [float(returns.mean() - margin), float(returns.mean() + margin)],
+            'mean_length': float(lengths.mean()),
+            'truncated_rate': float(truncated.mean())
+        }
+
+    def _max_steps(self) -> int:
+        """Step limit of the environment's episodes."""
+        return EnvironmentManager.max_episode_steps(self.env)
+
+    def _rollouts_on_model(self, policy: np.ndarray, num_rollouts: int, seed: Optional[int]):
+        """All rollouts in lockstep on the compiled model."""
+        rng = np.random.default_rng(seed)
+        states = self.model.reset_batch(rng, num_rollouts)
+        returns = np.zeros(num_rollouts)
+        lengths = np.zeros(num_rollouts, dtype=np.int64)
+        successes = np.zeros(num_rollouts, dtype=bool)
+        active = np.ones(num_rollouts, dtype=bool)
+
+        for _ in range(self._max_steps()):
+            running = np.flatnonzero(active)
+            if len(running) == 0:
+                break
+            next_states, rewards, terminated = self.model.step_batch(states[running], policy[states[running]], rng)
+            states[running] = next_states
+            returns[running] += rewards
+            lengths[running] += 1
+            successes[running] = terminated & (rewards > 0)
+            active[running] = ~terminated
+
+        return returns, lengths, successes, active
+
+    def _rollouts_on_env(self, policy: np.ndarray, num_rollouts: int, seed: Optional[int]):
+        """Rollouts on batches of environment copies (model-free fallback)."""
+        returns = np.zeros(num_rollouts)
+        lengths = np.zeros(num_rollouts, dtype=np.int64)
+        successes = np.zeros(num_rollouts, dtype=bool)
+        truncated = np.zeros(num_rollouts, dtype=bool)
+        max_steps = self._max_steps()
+
+        batch_size = min(ROLLOUT_BATCH_SIZE, num_rollouts)
+        envs = gym.vector.SyncVectorEnv([lambda: gym.make(self.env.spec) for _ in range(batch_size)])
+        try:
+            for start in range(0, num_rollouts, batch_size):
+                batch = slice(start, min(start + batch_size, num_rollouts))
+                size = batch.stop - batch.start
+                batch_seed = None if seed is None else seed + start
+                states, _ = envs.reset(seed=batch_seed)
+                active = np.zeros(batch_size, dtype=bool)
+                active[:size] = True
+
+                for _ in range(max_steps):
+                    if not active.any():
+                        break
+                    states, rewards, terminated, truncations, _ = envs.step(policy[states])
+                    # Environments finished earlier keep stepping (and auto-resetting); ignore them
+                    returns[batch] += np.where(active, rewards, 0.0)[:size]
+                    lengths[batch] += active[:size]
+                    ended = active & (terminated | truncations)
+                    successes[batch] |= (ended & terminated & (rewards > 0))[:size]
+                    truncated[batch] |= (ended & ~terminated)[:size]
+                    active &= ~ended
+                truncated[batch] |= active[:size]
+        finally:
+            envs.close()
+
+        return returns, lengths, successes, truncated
@@ -0,0 +1,421 @@
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+# What a subscriber whose backlog exceeds its buffer gets: the writer waits,
+# intermediate events are dropped, or they are merged into one aggregate
+OVERFLOW_POLICIES = ('block', 'drop', 'coalesce')
+
+# Seconds a writer waits for a 'block' subscriber before treating it as 'drop'
+BLOCK_TIMEOUT = 30.0
+
+
+class Subscription:
+    """
+    One subscriber's position in an EventLog, with a bounded backlog.
+
+    The backlog is the number of appended events the subscriber has not read
+    yet. When a read finds more than buffer_size of them, the overflow policy
+    decides what the subscriber gets:
+
+        block:    the writer waits before appending while the backlog is full,
+                  so the subscriber never overflows (a slow client throttles
+                  the run; one that stops reading for the log's block_timeout
+                  is switched to 'drop'). A backlog that was already there
+                  when it subscribed is delivered buffer_size events per read
+        drop:     the oldest unread events are replaced by one event that
+                  carries the latest state (see EventLog merge), followed by
+                  the newest buffer_size - 1 events
+        coalesce: like drop, but the replacement event also aggregates the
+                  merged events' statistics
+
+    Without a merge function on the log, drop and coalesce deliver only the
+    newest buffer_size events. Subscriptions are created with
+    EventLog.subscribe and read by a single consumer.
+    """
+
+    def __init__(self, event_log: 'EventLog', position: int, buffer_size: int, overflow: str):
+        """
+        Initialize the subscription (use EventLog.subscribe).
+
+        Args:
+            event_log: Log to read
+            position: ID of the last event the subscriber has seen
+            buffer_size: Maximum number of events delivered per read
+            overflow: One of OVERFLOW_POLICIES
+        """
+        self.event_log = event_log
+        self.position = position
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        # Largest backlog seen by a read, and events not delivered individually
+        self.high_water = 0
+        self.dropped = 0
+
+    def read(self, timeout: Optional[float] = None) -> Tuple[List[Tuple[int, Dict[str, Any], bool]], bool]:
+        """
+        Return the unread events (applying the overflow policy) and advance past them.
+
+        Args:
+            timeout: Seconds to wait when no event is available (None waits
+                     forever, 0 returns immediately)
+
+        Returns:
+            Tuple (events, finished): list of (event_id, data, shared) triples,
+            where shared is False for a merged event that exists only for this
+            subscriber (its ID is the last event it covers), and True once the
+            log is closed and all its events have been returned
+        """
+        event_log = self.event_log
+        with event_log._condition:
+            if self.position >= event_log.last_id and not event_log.closed:
+                event_log._condition.wait(timeout)
+            events, skipped = event_log._unread(self.position)
+            backlog = event_log.last_id - self.position
+            self.high_water = max(self.high_water, backlog)
+            event_log.high_water = max(event_log.high_water, backlog)
+
+            overflow = len(events) - self.buffer_size
+            if overflow > 0 and self.overflow == 'block':
+                # Backlog from before the subscription: delivered in order, over several reads
+                head, events = [], events[:self.buffer_size]
+            elif overflow > 0:
+                head_size = overflow + 1 if event_log.merge is not None else overflow
+                head, events = events[:head_size], events[head_size:]
+                skipped += len(head) - (event_log.merge is not None)
+            else:
+                head = []
+
+            if head or events:
+                self.position = (events or head)[-1][0]
+            self.dropped += skipped
+            event_log.dropped += skipped
+            finished = event_log.closed and self.position == event_log.last_id
+            # A writer may be waiting for this subscriber's backlog to shrink
+            event_log._space_available.notify_all()
+
+        delivered = [(event_id, data, True) for event_id, _, data in events]
+        if head and event_log.merge is not None:
+            # Merged outside the lock, so the writer is not held up
+            merged = event_log.merge([data for _, _, data in head], self.overflow == 'coalesce')
+            delivered.insert(0, (head[-1][0], merged, False))
+        return delivered, finished
+
+
+class EventLog:
+    """
+    Bounded, replayable log of a session's training events.
+
+    The training run appends each event once; any number of subscribers read
+    from the log independently, so a second tab or a reconnecting browser
+    never starts another run. Events get increasing IDs (sent as the SSE
+    'id' field) and the last capacity events are retained, so a reconnect
+    with Last-Event-ID resumes exactly where the client left off.
+
+    Events marked as sync points (full learning-data snapshots) are where a
+    subscriber without usable history starts: a client that only received
+    sparse deltas needs a snapshot before it can apply them.
+
+    Besides blocking reads, subscribers can register a listener that is
+    called on every append and on close (the ASGI adapter uses this to wake
+    coroutines instead of parking a thread per subscriber), and share values
+    derived from an event, such as its wire encoding, through memoize.
+
+    Streaming subscribers read through a Subscription (see subscribe), which
+    bounds how many unread events one client can accumulate and applies its
+    overflow policy; backlog high-water marks, dropped events and the time
+    the writer spent blocked are reported by get_stats.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        start_id: int = 0,
+        merge: Optional[Callable[[List[Dict[str, Any]], bool], Dict[str, Any]]] = None,
+        block_timeout: float = BLOCK_TIMEOUT,
+        on_idle: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize an empty, open log.
+
+        Args:
+            capacity: Maximum number of retained events
+            start_id: ID of the event before the first one (continues the IDs
+                      of a previous run on the same session)
+            merge: Combines consecutive events into one carrying the latest
+                   state, for overflowing subscribers; called with the events
+                   and whether to aggregate their statistics ('coalesce')
+            block_timeout: Seconds append waits for a 'block' subscriber
+            on_idle: Called when the last subscriber of the open log leaves
+                     (e.g. to stop a run nobody watches any more)
+        """
+        self.capacity = capacity
+        self.last_id = start_id
+        self.closed = False
+        self.subscribers = 0
+        self.merge = merge
+        self.block_timeout = block_timeout
+        self.on_idle = on_idle
+
+        # Backpressure statistics over all subscriptions
+        self.high_water = 0
+        self.dropped = 0
+        self.blocked_seconds = 0.0
+
+        self._events: 'deque[Tuple[int, bool, Dict[str, Any]]]' = deque(maxlen=capacity)
+        lock = threading.RLock()
+        self._condition = threading.Condition(lock)
+        # Signalled when a subscriber reads or leaves, for writers waiting on 'block' subscribers
+        self._space_available = threading.Condition(lock)
+        self._subscriptions: List[Subscription] = []
+        self._listeners: List[Callable[[], None]] = []
+        # Derived values per retained event ID, see memoize
+        self._derived: Dict[int, Dict[Hashable, Any]] = {}
+
+    def append(self, data: Dict[str, Any], sync_point: bool = False) -> int:
+        """
+        Add an event and wake up waiting subscribers.
+
+        Args:
+            data: JSON-serializable event data
+            sync_point: True if a subscriber may start reading at this event
+
+        Returns:
+            Event ID
+        """
+        with self._condition:
+            self._wait_for_blocking_subscribers()
+            if len(self._events) == self.capacity:
+                self._derived.pop(self._events[0][0], None)
+            self.last_id += 1
+            self._events.append((self.last_id, sync_point, data))
+            self._condition.notify_all()
+            self._notify_listeners()
+            return self.last_id
+
+    def _wait_for_blocking_subscribers(self) -> None:
+        """Wait (lock held) until no 'block' subscriber has a full backlog."""
+        started = None
+        while True:
+            full = [
+                subscription for subscription in self._subscriptions
+                if subscription.overflow == 'block'
+                and self.last_id - subscription.position >= subscription.buffer_size
+            ]
+            if not full:
+                break
+            now = time.monotonic()
+            if started is None:
+                started = now
+            remaining = started + self.block_timeout - now
+            if remaining <= 0:
+                # Stalled subscriber: stop throttling the run on its behalf
+                for subscription in full:
+                    subscription.overflow = 'drop'
+                break
+            self._space_available.wait(remaining)
+        if started is not None:
+            self.blocked_seconds += time.monotonic() - started
+
+    def close(self) -> None:
+        """Mark the run as finished; subscribers stop after the last event."""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+            self._notify_listeners()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback invoked (under the log's lock) on every append and on close.
+
+        Listeners must return quickly and must not call back into the log.
+
+        Args:
+            listener: Callable without arguments
+        """
+        with self._condition:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Unregister a callback added with add_listener.
+
+        Args:
+            listener: Previously added callable
+        """
+        with self._condition:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify_listeners(self) -> None:
+        """Call all listeners (the lock is held by the caller)."""
+        for listener in self._listeners:
+            listener()
+
+    def start_position(self, last_event_id: Optional[int] = None) -> int:
+        """
+        Return the event ID a new subscriber reads after.
+
+        Args:
+            last_event_id: Last event the client received (Last-Event-ID), if any
+
+        Returns:
+            last_event_id if the events after it are still retained, otherwise
+            the position before the oldest retained sync point
+        """
+        with self._condition:
+            oldest = self._events[0][0] if self._events else self.last_id + 1
+            if last_event_id is not None and oldest - 1 <= last_event_id <= self.last_id:
+                return last_event_id
+            for event_id, sync_point, _ in self._events:
+                if sync_point:
+                    return event_id - 1
+            return self.last_id
+
+    def subscribe(
+        self,
+        last_event_id: Optional[int] = None,
+        buffer_size: Optional[int] = None,
+        overflow: str = 'drop'
+    ) -> Subscription:
+        """
+        Register a subscriber starting at start_position(last_event_id).
+
+        Args:
+            last_event_id: Last event the client received (Last-Event-ID), if any
+            buffer_size: Maximum number of unread events delivered per read
+                         (default and upper bound: the log capacity)
+            overflow: Overflow policy, one of OVERFLOW_POLICIES
+
+        Returns:
+            Subscription; pass it to unsubscribe when the subscriber leaves
+
+        Raises:
+            ValueError: If the policy is unknown or buffer_size is not positive
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Available policies: {list(OVERFLOW_POLICIES)}")
+        if buffer_size is not None and buffer_size < 1:
+            raise ValueError(f"buffer_size must be a positive integer, got {buffer_size}")
+        buffer_size = min(buffer_size or self.capacity, self.capacity)
+
+        with self._condition:
+            subscription = Subscription(self, self.start_position(last_event_id), buffer_size, overflow)
+            self._subscriptions.append(subscription)
+            self.subscribers += 1
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscriber (a writer blocked on it continues).
+
+        Args:
+            subscription: Subscription returned by subscribe
+        """
+        with self._condition:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.remove(subscription)
+            self.subscribers -= 1
+            self._space_available.notify_all()
+            idle = self.subscribers == 0 and not self.closed
+        if idle and self.on_idle is not None:
+            self.on_idle()
+
+    def _unread(self, after_id: int) -> Tuple[List[Tuple[int, bool, Dict[str, Any]]], int]:
+        """
+        Return the retained events after a position (lock held).
+
+        A position whose following events were already evicted continues at
+        the oldest retained sync point, so the subscriber can apply what follows.
+
+        Args:
+            after_id: ID of the last event the subscriber has seen
+
+        Returns:
+            Tuple (events, skipped): (event_id, sync_point, data) triples and
+            the number of events the subscriber missed
+        """
+        oldest = self._events[0][0] if self._events else self.last_id + 1
+        if after_id >= oldest - 1:
+            # IDs are consecutive, so the first unseen event's index is known
+            return list(islice(self._events, after_id + 1 - oldest, None)), 0
+        start = next((index for index, (_, sync_point, _) in enumerate(self._events) if sync_point), 0)
+        events = list(islice(self._events, start, None))
+        first = events[0][0] if events else self.last_id + 1
+        return events, first - 1 - after_id
+
+    def read(self, after_id: int, timeout: Optional[float] = None) -> Tuple[List[Tuple[int, Dict[str, Any]]], bool]:
+        """
+        Return the events after a position, waiting for new ones if needed.
+
+        Args:
+            after_id: ID of the last event the subscriber has seen
+            timeout: Seconds to wait when no event is available (None waits
+                     forever, 0 returns immediately)
+
+        Returns:
+            Tuple (events, finished): list of (event_id, data) pairs, and True
+            once the log is closed and all its events have been returned
+        """
+        with self._condition:
+            if after_id >= self.last_id and not self.closed:
+                self._condition.wait(timeout)
+            # IDs are consecutive, so the first unseen event's index is known
+            oldest = self._events[0][0] if self._events else self.last_id + 1
+            start = max(0, after_id + 1 - oldest)
+            events = [(event_id, data) for event_id, _, data in islice(self._events, start, None)]
+            finished = self.closed and (not events or events[-1][0] == self.last_id)
+            return events, finished
+
+    def memoize(self, event_id: int, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return a value derived from an event, computing it once for all subscribers.
+
+        Used for the serialized form of an event, which is identical for every
+        subscriber asking for the same format. Values are dropped together
+        with their event.
+
+        Args:
+            event_id: ID of a retained event
+            key: Identifies the derived value (e.g. the frame format)
+            compute: Produces the value on the first request
+
+        Returns:
+            The derived value
+        """
+        derived = self._derived.get(event_id)
+        if derived is not None and key in derived:
+            return derived[key]
+        # Computed outside the lock; concurrent first requests may both compute it
+        value = compute()
+        with self._condition:
+            if self._events and event_id >= self._events[0][0]:
+                self._derived.setdefault(event_id, {})[key] = value
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return log occupancy.
+
+        Returns:
+            Dictionary with last_id, retained, capacity, subscribers, closed,
+            backlog (current largest subscriber backlog), high_water (largest
+            backlog seen), dropped (events not delivered individually) and
+            blocked_seconds (time append waited for 'block' subscribers)
+        """
+        with self._condition:
+            return {
+                'last_id': self.last_id,
+                'retained': len(self._events),
+                'capacity': self.capacity,
+                'subscribers': self.subscribers,
+                'closed': self.closed,
+                'backlog': max((self.last_id - subscription.position for subscription in self._subscriptions), default=0),
+                'high_water': self.high_water,
+                'dropped': self.dropped,
+                'blocked_seconds': self.blocked_seconds
+            }
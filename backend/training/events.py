@@ -0,0 +1,372 @@
+import math
+import time
+from typing import Dict, Any, List, Optional
+import numpy as np
+from algorithms import BaseAlgorithm
+from environments.environment_manager import EnvironmentManager
+
+
+class TrainingEventEncoder:
+    """
+    Builds the learning-data part of training stream events.
+
+    Every event gets a sequence number. Full snapshots (get_learning_data())
+    are sent every snapshot_interval events and on request; in between, only
+    the cells that changed since the previous event are sent
+    (get_learning_delta()). Clients apply deltas to their last snapshot and
+    request a resync when they notice a gap in the sequence numbers.
+    """
+
+    def __init__(self, algorithm: BaseAlgorithm, snapshot_interval: Optional[int] = None):
+        """
+        Initialize the encoder.
+
+        Args:
+            algorithm: Algorithm whose learning data is streamed
+            snapshot_interval: Send a full snapshot every N events.
+                               None sends a full snapshot with every event.
+        """
+        self.algorithm = algorithm
+        self.snapshot_interval = snapshot_interval
+        self.seq = 0
+        self._resync_requested = True
+
+    def request_resync(self) -> None:
+        """Make the next event a full snapshot."""
+        self._resync_requested = True
+
+    def encode(self) -> Dict[str, Any]:
+        """
+        Build the learning-data fields for the next event.
+
+        Returns:
+            Dictionary with seq and either learning_data (snapshot) or
+            learning_delta (changed cells since the previous event)
+        """
+        self.seq += 1
+
+        snapshot_due = (
+            self._resync_requested
+            or self.snapshot_interval is None
+            or self.seq % self.snapshot_interval == 0
+        )
+
+        # Always drain the change tracking so the next delta starts from here
+        delta = self.algorithm.get_learning_delta()
+
+        if snapshot_due or delta is None:
+            self._resync_requested = False
+            return {
+                'seq': self.seq,
+                'snapshot': True,
+                'learning_data': self.algorithm.get_learning_data()
+            }
+
+        return {
+            'seq': self.seq,
+            'snapshot': False,
+            'learning_delta': delta
+        }
+
+    @staticmethod
+    def merge(events: List[Dict[str, Any]], aggregate: bool = False) -> Dict[str, Any]:
+        """
+        Combine consecutive stream events into one that leaves the client in the same state.
+
+        Used for subscribers that fall behind (EventLog merge): the result is
+        the last event with the learning data of the whole run, i.e. the last
+        snapshot with the later Q-table updates applied, or all deltas merged
+        (the latest value of each cell wins). It carries 'merged', the number
+        of events it replaces, so clients accept the gap in the sequence numbers.
+
+        Args:
+            events: Consecutive events from the log, oldest first
+            aggregate: Also combine the events' 'window' aggregates (coalescing);
+                       otherwise the intermediate windows are dropped. A
+                       merged completion event gets the aggregate as well
+
+        Returns:
+            Merged event
+        """
+        last = events[-1]
+        training = [event for event in events if 'seq' in event]
+        if 'seq' not in last:
+            # Completion and error events already carry the full learning data
+            merged = dict(last, merged=len(events))
+            if aggregate and training:
+                merged['window'] = EmissionPolicy.merge_windows([event['window'] for event in training])
+            return merged
+
+        merged = dict(last, merged=len(events))
+        merged.pop('learning_data', None)
+        merged.pop('learning_delta', None)
+
+        base = next((index for index in range(len(training) - 1, -1, -1) if training[index]['snapshot']), None)
+        updates = {}
+        for event in training[0 if base is None else base + 1:]:
+            for state, action, value in event['learning_delta']['q_updates']:
+                updates[state, action] = value
+
+        if base is None:
+            merged['snapshot'] = False
+            merged['learning_delta'] = {'q_updates': [[state, action, value] for (state, action), value in updates.items()]}
+        else:
+            learning_data = dict(training[base]['learning_data'])
+            if updates:
+                # Copy only the rows that change; the logged snapshot is shared
+                q_table = list(learning_data['q_table'])
+                for (state, action), value in updates.items():
+                    if q_table[state] is learning_data['q_table'][state]:
+                        q_table[state] = list(q_table[state])
+                    q_table[state][action] = value
+                learning_data['q_table'] = q_table
+            merged['snapshot'] = True
+            merged['learning_data'] = learning_data
+
+        # Keep the newest optimality and evaluation results of the run
+        for field in ('optimality', 'evaluation'):
+            latest = next((event[field] for event in reversed(training) if field in event), None)
+            if latest is not None:
+                merged[field] = latest
+
+        if aggregate:
+            merged['window'] = EmissionPolicy.merge_windows([event['window'] for event in training])
+        return merged
+
+
+class EmissionPolicy:
+    """
+    Decides which training episodes produce a stream event.
+
+    Training runs at full speed; episodes that are not emitted are folded into
+    a window aggregate (mean/min/max reward, success rate, mean episode length)
+    that is attached to the next emitted event. The last episode is always
+    emitted so the final state reaches the client.
+
+    Modes:
+        every:    emit every k-th episode (k=1 emits every episode)
+        rate:     emit at most max_rate events per second (checked on the clock)
+        adaptive: emit at most max_rate events per second, using an episode
+                  stride re-estimated from training throughput after each
+                  event, so events land on regular episode boundaries
+    """
+
+    MODES = ('every', 'rate', 'adaptive')
+
+    def __init__(
+        self,
+        mode: str = 'every',
+        every: int = 1,
+        max_rate: Optional[float] = None,
+        clock=time.monotonic
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            mode: One of MODES
+            every: Episode stride for 'every' mode
+            max_rate: Maximum events per second for 'rate' and 'adaptive' modes
+            clock: Time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If mode or its settings are invalid
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown emission mode '{mode}'. Available modes: {list(self.MODES)}")
+        if every < 1:
+            raise ValueError(f"every must be a positive integer, got {every}")
+        if mode != 'every' and (max_rate is None or max_rate <= 0):
+            raise ValueError(f"Emission mode '{mode}' requires a positive max_rate")
+
+        self.mode = mode
+        self.every = every
+        self.max_rate = max_rate
+        self.clock = clock
+
+        self._last_emit_time = clock()
+        self._last_emit_episode = -1
+        self._stride = 1
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        """Start a new, empty aggregation window."""
+        self._count = 0
+        self._first_episode = None
+        self._reward_sum = 0.0
+        self._reward_min = math.inf
+        self._reward_max = -math.inf
+        self._successes = 0
+        self._length_sum = 0.0
+
+    def record(self, episode: int, reward: float, length: Optional[float] = None) -> None:
+        """
+        Add an episode to the current window.
+
+        Args:
+            episode: Episode index
+            reward: Total episode reward (reward > 0 counts as a success)
+            length: Number of steps in the episode, if known
+        """
+        if self._first_episode is None:
+            self._first_episode = episode
+        self._count += 1
+        self._reward_sum += reward
+        self._reward_min = min(self._reward_min, reward)
+        self._reward_max = max(self._reward_max, reward)
+        self._successes += reward > 0
+        self._length_sum += length or 0
+
+    def should_emit(self, episode: int, num_episodes: int) -> bool:
+        """
+        Check whether the given (already recorded) episode should be emitted.
+
+        Args:
+            episode: Episode index
+            num_episodes: Total number of episodes in the run
+
+        Returns:
+            True if an event should be sent for this episode
+        """
+        if episode >= num_episodes - 1:
+            return True
+        if self.mode == 'every':
+            return (episode + 1) % self.every == 0
+        if self.mode == 'rate':
+            return self.clock() - self._last_emit_time >= 1.0 / self.max_rate
+        return episode - self._last_emit_episode >= self._stride
+
+    def flush(self, episode: int) -> Dict[str, Any]:
+        """
+        Close the current window and return its aggregate.
+
+        Args:
+            episode: Episode index of the emitted event
+
+        Returns:
+            Dictionary with episodes, first_episode, last_episode, mean_reward,
+            min_reward, max_reward, success_rate and mean_length
+        """
+        now = self.clock()
+        if self.mode == 'adaptive':
+            # Episodes per second since the last event, converted to a stride
+            elapsed = max(now - self._last_emit_time, 1e-9)
+            throughput = (episode - self._last_emit_episode) / elapsed
+            self._stride = max(1, math.ceil(throughput / self.max_rate))
+
+        count = max(self._count, 1)
+        window = {
+            'episodes': self._count,
+            'first_episode': self._first_episode,
+            'last_episode': episode,
+            'mean_reward': self._reward_sum / count,
+            'min_reward': self._reward_min if self._count else None,
+            'max_reward': self._reward_max if self._count else None,
+            'success_rate': self._successes / count,
+            'mean_length': self._length_sum / count
+        }
+
+        self._last_emit_time = now
+        self._last_emit_episode = episode
+        self._reset_window()
+        return window
+
+    @staticmethod
+    def merge_windows(windows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine consecutive window aggregates into one.
+
+        Args:
+            windows: Aggregates returned by flush, oldest first
+
+        Returns:
+            Aggregate over all their episodes, in the format of flush
+        """
+        episodes = sum(window['episodes'] for window in windows)
+        count = max(episodes, 1)
+        minimums = [window['min_reward'] for window in windows if window['min_reward'] is not None]
+        maximums = [window['max_reward'] for window in windows if window['max_reward'] is not None]
+        return {
+            'episodes': episodes,
+            'first_episode': next((window['first_episode'] for window in windows
+                                   if window['first_episode'] is not None), None),
+            'last_episode': windows[-1]['last_episode'],
+            'mean_reward': sum(window['mean_reward'] * window['episodes'] for window in windows) / count,
+            'min_reward': min(minimums) if minimums else None,
+            'max_reward': max(maximums) if maximums else None,
+            'success_rate': sum(window['success_rate'] * window['episodes'] for window in windows) / count,
+            'mean_length': sum(window['mean_length'] * window['episodes'] for window in windows) / count
+        }
+
+
+class OptimalityTracker:
+    """
+    Measures how far a tabular learner is from the optimal solution.
+
+    Q* comes from the environment's compiled model, solved once per
+    environment and discount factor (TabularModel.optimal_q) and shared by
+    all sessions. Each measurement compares the learner's Q-table with it:
+
+        q_distance:      max |Q - Q*| over non-terminal states
+        optimal_actions: fraction of non-terminal states whose greedy action is optimal
+        regret:          expected return lost from the start distribution by
+                         following the greedy policy, V*(s0) - V^pi(s0)
+
+    The regret needs an exact policy evaluation (one linear solve), which is
+    only redone when the greedy policy has changed since the last measurement.
+    """
+
+    def __init__(self, algorithm: BaseAlgorithm, env):
+        """
+        Initialize the tracker and solve (or look up) Q*.
+
+        Args:
+            algorithm: Algorithm with a q_table (S, A) or (N, S, A) and a scalar discount factor
+            env: The algorithm's environment
+
+        Raises:
+            ValueError: If the algorithm has no Q-table or the environment no tabular model
+        """
+        discount_factor = algorithm.parameters.get('discount_factor', 0.95)
+        if not hasattr(algorithm, 'q_table') or not isinstance(discount_factor, (int, float)):
+            raise ValueError('Optimality metrics require a Q-table and a single discount factor')
+
+        self.algorithm = algorithm
+        self.discount_factor = float(discount_factor)
+        self.model = EnvironmentManager.compile_environment(env)
+        self.optimal_q = self.model.optimal_q(self.discount_factor)
+
+        optimal_values = self.optimal_q.max(axis=1)
+        self.optimal_return = float(self.model.initial_distribution @ optimal_values)
+        self.nonterminal = np.ones(self.model.num_states, dtype=bool)
+        self.nonterminal[self.model.terminal_states] = False
+
+        # Optimal actions per state (ties within tolerance count as optimal)
+        self._is_optimal = self.optimal_q >= optimal_values[:, None] - 1e-9
+
+        self._policy: Optional[np.ndarray] = None
+        self._regret = 0.0
+
+    def measure(self) -> Dict[str, float]:
+        """
+        Compare the algorithm's current Q-table with Q*.
+
+        Returns:
+            Dictionary with q_distance, optimal_actions and regret
+        """
+        q_table = self.algorithm.q_table
+        if q_table.ndim == 3:
+            q_table = q_table.mean(axis=0)
+
+        policy = q_table.argmax(axis=1)
+        if self._policy is None or not np.array_equal(policy, self._policy):
+            values = self.model.evaluate_policy(policy, self.discount_factor)
+            self._regret = max(0.0, self.optimal_return - float(self.model.initial_distribution @ values))
+            self._policy = policy
+
+        states = np.flatnonzero(self.nonterminal)
+        return {
+            'q_distance': float(np.abs(q_table - self.optimal_q)[states].max()) if len(states) else 0.0,
+            'optimal_actions': float(self._is_optimal[states, policy[states]].mean()) if len(states) else 1.0,
+            'regret': self._regret
+        }
@@ -0,0 +1,290 @@
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+def run_training_job(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Train an algorithm from scratch (or from given arrays) in a worker process.
+
+    Module-level so it can be pickled into a process pool. Builds its own
+    headless environment and algorithm, so nothing process-local (envs,
+    renderers, locks) crosses the process boundary.
+
+    Args:
+        spec: Dict with algorithm_name, environment_name, parameters, seed,
+              num_episodes and optionally arrays (initial learned state)
+
+    Returns:
+        Dict with arrays (learned state), rewards (float32 array),
+        episodes and duration (seconds)
+    """
+    from algorithms import AlgorithmFactory
+    from environments.environment_manager import EnvironmentManager
+
+    start = time.perf_counter()
+    env = EnvironmentManager.create_environment(spec['environment_name'], spec.get('seed'), render_mode=None)
+    try:
+        algorithm = AlgorithmFactory.create_algorithm(spec['algorithm_name'], env, spec['parameters'])
+        if spec.get('arrays'):
+            algorithm.load_checkpoint(spec['arrays'])
+
+        rewards = np.zeros(spec['num_episodes'], dtype=np.float32)
+
+        def record_reward(episode, reward, learning_data, frame):
+            rewards[episode] = reward
+
+        algorithm.train(spec['num_episodes'], record_reward, lazy=True)
+
+        return {
+            'arrays': {name: np.asarray(array) for name, array in algorithm.get_checkpoint().items()},
+            'rewards': rewards,
+            'episodes': spec['num_episodes'],
+            'duration': time.perf_counter() - start
+        }
+    finally:
+        env.close()
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the executor's job queue is at capacity."""
+
+
+class TrainingExecutor:
+    """
+    Runs training jobs in a pool of worker processes.
+
+    Each job trains in its own process, so concurrent runs use all cores
+    instead of sharing the Flask process's GIL. The number of jobs waiting
+    for a worker is bounded; submissions beyond that raise QueueFullError.
+    Finished jobs keep their status and result until the job history limit
+    evicts the oldest ones.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queued: int = 100,
+        max_history: int = 1000,
+        job_function: Callable[[Dict[str, Any]], Dict[str, Any]] = run_training_job
+    ):
+        """
+        Initialize the executor. Worker processes are started on first use.
+
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            max_queued: Maximum number of jobs waiting for a worker
+            max_history: Maximum number of finished jobs kept for polling
+            job_function: Picklable function run in the workers
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queued = max_queued
+        self.max_history = max_history
+        self.job_function = job_function
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use (caller holds the lock)."""
+        if self._pool is None:
+            # 'spawn' avoids forking a multi-threaded Flask process
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    def submit(
+        self,
+        spec: Dict[str, Any],
+        on_done: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> str:
+        """
+        Queue a training job.
+
+        Args:
+            spec: Job specification passed to the job function
+            on_done: Called with the job record when the job finishes (in a
+                     background thread), before its status becomes final;
+                     also for failed (error set) and cancelled jobs, whose
+                     result is None
+
+        Returns:
+            Job ID (UUID string)
+
+        Raises:
+            QueueFullError: If max_queued jobs are already waiting
+        """
+        job_id = str(uuid.uuid4())
+
+        with self._lock:
+            if self._count_status('queued') >= self.max_queued:
+                raise QueueFullError(f"Training queue is full ({self.max_queued} jobs waiting)")
+
+            job = {
+                'job_id': job_id,
+                'session_id': spec.get('session_id'),
+                'num_episodes': spec['num_episodes'],
+                'submitted_at': time.time(),
+                'finished_at': None,
+                'error': None,
+                'result': None,
+                'future': None
+            }
+            self._jobs[job_id] = job
+            job['future'] = self._get_pool().submit(self.job_function, spec)
+
+        job['future'].add_done_callback(lambda future: self._finish(job, future, on_done))
+        return job_id
+
+    def _finish(
+        self,
+        job: Dict[str, Any],
+        future: Future,
+        on_done: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> None:
+        """
+        Store a finished job's result or error and run its completion hook.
+
+        The hook runs for every outcome (completed, failed or cancelled), so
+        callers can always release what they hold for the job.
+        """
+        try:
+            if not future.cancelled():
+                job['result'] = future.result()
+        except Exception as e:
+            job['error'] = str(e)
+
+        try:
+            if on_done:
+                on_done(job)
+        except Exception as e:
+            job['error'] = job['error'] or str(e)
+        finally:
+            job['finished_at'] = time.time()
+            with self._lock:
+                self._trim_history()
+
+    @staticmethod
+    def _status(job: Dict[str, Any]) -> str:
+        """Derive a job's status from its future."""
+        future = job['future']
+        if future is None or not (future.running() or future.done()):
+            return 'queued'
+        if future.cancelled():
+            return 'cancelled'
+        if not future.done() or job['finished_at'] is None:
+            return 'running'
+        return 'failed' if job['error'] else 'completed'
+
+    def _count_status(self, status: str) -> int:
+        """Count jobs in a given status (caller holds the lock)."""
+        return sum(1 for job in self._jobs.values() if self._status(job) == status)
+
+    def _trim_history(self) -> None:
+        """Forget the oldest finished jobs beyond max_history (caller holds the lock)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job['finished_at'] is not None]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a job's record.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            Job dictionary (including 'result' once completed) or None if unknown
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a JSON-serializable job status.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            Dict with job_id, session_id, status, num_episodes, timestamps,
+            duration and error, or None if unknown
+        """
+        job = self.get_job(job_id)
+        if job is None:
+            return None
+
+        result = job['result'] or {}
+        return {
+            'job_id': job['job_id'],
+            'session_id': job['session_id'],
+            'status': self._status(job),
+            'num_episodes': job['num_episodes'],
+            'submitted_at': job['submitted_at'],
+            'finished_at': job['finished_at'],
+            'duration': result.get('duration'),
+            'error': job['error']
+        }
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job that has not started yet.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            True if the job was cancelled
+        """
+        job = self.get_job(job_id)
+        return job is not None and job['future'].cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return pool size and job counts by status.
+
+        Returns:
+            Dict with max_workers, max_queued and counts per status
+        """
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for job in self._jobs.values():
+                status = self._status(job)
+                counts[status] = counts.get(status, 0) + 1
+            return {
+                'max_workers': self.max_workers,
+                'max_queued': self.max_queued,
+                'jobs': counts
+            }
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Return the status of all known jobs, oldest first.
+
+        Returns:
+            List of job status dicts
+        """
+        with self._lock:
+            job_ids = list(self._jobs)
+        return [status for status in map(self.get_status, job_ids) if status is not None]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for running jobs to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
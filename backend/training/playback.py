@@ -0,0 +1,142 @@
+import math
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+from algorithms import BaseAlgorithm
+from .evaluation import wilson_interval
+
+
+# Upper bound on rollouts per playback batch
+MAX_ROLLOUTS = 10000
+
+
+class RolloutStats:
+    """
+    Running outcome statistics of policy rollouts.
+
+    Sums are updated per episode, so a summary costs the same after ten
+    episodes as after ten thousand.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.episodes = 0
+        self.successes = 0
+        self.truncations = 0
+        self.return_sum = 0.0
+        self.return_sq_sum = 0.0
+        self.length_sum = 0
+
+    def record(self, episode_return: float, length: int, success: bool, truncated: bool) -> None:
+        """
+        Add one finished episode.
+
+        Args:
+            episode_return: Undiscounted return of the episode
+            length: Number of steps
+            success: Episode terminated with a positive reward
+            truncated: Episode hit the step limit
+        """
+        self.episodes += 1
+        self.successes += int(success)
+        self.truncations += int(truncated)
+        self.return_sum += episode_return
+        self.return_sq_sum += episode_return * episode_return
+        self.length_sum += length
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the statistics so far.
+
+        Returns:
+            Dictionary with episodes, success_rate, success_ci (95% Wilson
+            interval), mean_return, return_std, mean_length and truncated_rate
+        """
+        episodes = self.episodes
+        if episodes == 0:
+            return {'episodes': 0}
+        mean_return = self.return_sum / episodes
+        variance = max(0.0, self.return_sq_sum / episodes - mean_return * mean_return)
+        return {
+            'episodes': episodes,
+            'success_rate': self.successes / episodes,
+            'success_ci': wilson_interval(self.successes, episodes),
+            'mean_return': mean_return,
+            'return_std': math.sqrt(variance),
+            'mean_length': self.length_sum / episodes,
+            'truncated_rate': self.truncations / episodes
+        }
+
+
+def iter_rollouts(
+    algorithm: BaseAlgorithm,
+    num_rollouts: int,
+    render_episodes: int = 1,
+    seed: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run the learned policy for many episodes, rendering only a sample of them.
+
+    Arguments are checked immediately; the episodes run as the returned
+    generator is consumed.
+
+    Episodes run on the algorithm's own environment through
+    BaseAlgorithm.iter_policy. The rendered episodes are drawn uniformly
+    from all rollouts; every other episode is stepped without rendering.
+
+    Args:
+        algorithm: Trained algorithm
+        num_rollouts: Number of episodes (1 to MAX_ROLLOUTS)
+        render_episodes: Number of episodes whose steps are rendered
+        seed: Seed for choosing the rendered episodes
+
+    Returns:
+        Generator yielding {'kind': 'step', 'episode', **step} for every step
+        of a rendered episode (the environment is in the step's state), and
+        {'kind': 'episode', 'episode', 'return', 'length', 'success',
+        'truncated', 'rendered', 'stats'} after every episode, where stats
+        is the batch's RolloutStats (updated in place)
+
+    Raises:
+        ValueError: If num_rollouts or render_episodes is out of range
+    """
+    if not 1 <= num_rollouts <= MAX_ROLLOUTS:
+        raise ValueError(f"rollouts must be between 1 and {MAX_ROLLOUTS}, got {num_rollouts}")
+    if not 0 <= render_episodes <= num_rollouts:
+        raise ValueError(f"render_episodes must be between 0 and rollouts ({num_rollouts}), got {render_episodes}")
+
+    rng = np.random.default_rng(seed)
+    rendered = set(rng.choice(num_rollouts, size=render_episodes, replace=False).tolist())
+    return _run_rollouts(algorithm, num_rollouts, rendered)
+
+
+def _run_rollouts(algorithm: BaseAlgorithm, num_rollouts: int, rendered: set) -> Iterator[Dict[str, Any]]:
+    """Generator behind iter_rollouts (arguments already validated)."""
+    stats = RolloutStats()
+
+    for episode in range(num_rollouts):
+        render = episode in rendered
+        episode_return = 0.0
+        length = 0
+        step = None
+        for step in algorithm.iter_policy(render=render):
+            episode_return += step['reward']
+            length += 1
+            if render:
+                yield dict(step, kind='step', episode=episode)
+
+        terminated = bool(step and step['terminated'])
+        success = terminated and step['reward'] > 0
+        truncated = not terminated
+        stats.record(episode_return, length, success, truncated)
+        yield {
+            'kind': 'episode',
+            'episode': episode,
+            'return': episode_return,
+            'length': length,
+            'success': success,
+            'truncated': truncated,
+            'rendered': render,
+            'stats': stats
+        }
@@ -0,0 +1,267 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Rough fixed cost of a live Gymnasium toy-text environment (wrappers,
+# transition model); FrozenLake frames come from a shared vectorized renderer
+ENV_BASE_BYTES = 256 * 1024
+
+
+def estimate_session_memory(session: Dict[str, Any]) -> int:
+    """
+    Estimate the memory held by a session, in bytes.
+
+    Counts the algorithm's NumPy arrays (Q-table, dirty masks, ...) and a
+    fixed cost per live environment.
+
+    Args:
+        session: Session dictionary
+
+    Returns:
+        Estimated size in bytes
+    """
+    total = 0
+
+    algorithm = session.get('algorithm')
+    if algorithm is not None:
+        total += sum(value.nbytes for value in vars(algorithm).values() if isinstance(value, np.ndarray))
+
+    env = session.get('environment')
+    if env is not None:
+        total += ENV_BASE_BYTES
+
+    return total
+
+
+class SessionStore:
+    """
+    Thread-safe, bounded registry of training sessions.
+
+    Sessions are kept in least-recently-used order. When a new session would
+    exceed max_sessions or max_memory_bytes, the least recently used idle
+    sessions are evicted; sessions idle for longer than idle_ttl seconds are
+    evicted on the next access. Sessions marked as running are never evicted.
+    Evicted sessions are passed to on_evict (e.g. to close their environment).
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_sessions: Maximum number of sessions (None for unlimited)
+            max_memory_bytes: Maximum estimated memory of all sessions (None for unlimited)
+            idle_ttl: Seconds a session may stay unused before eviction (None to disable)
+            on_evict: Called with (session_id, session) for every evicted or removed session
+            clock: Time source in seconds (injectable for tests)
+        """
+        self.max_sessions = max_sessions
+        self.max_memory_bytes = max_memory_bytes
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self.clock = clock
+
+        self._sessions: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.evictions = 0
+
+    def add(self, session_id: str, session: Dict[str, Any]) -> None:
+        """
+        Register a session, evicting others if limits are exceeded.
+
+        Args:
+            session_id: Session UUID
+            session: Session dictionary
+        """
+        with self._lock:
+            self._sessions[session_id] = session
+            self._last_access[session_id] = self.clock()
+            evicted = self._evict_expired() + self._enforce_limits(keep=session_id)
+        self._close_evicted(evicted)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a session and mark it as recently used.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Session dictionary or None if not found (or expired)
+        """
+        with self._lock:
+            evicted = self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                self._last_access[session_id] = self.clock()
+        self._close_evicted(evicted)
+        return session
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            evicted = self._evict_expired()
+            contained = session_id in self._sessions
+        self._close_evicted(evicted)
+        return contained
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Return a snapshot of all (session_id, session) pairs, oldest first.
+
+        Returns:
+            List of tuples (safe to iterate while other threads modify the store)
+        """
+        with self._lock:
+            return list(self._sessions.items())
+
+    def values(self) -> List[Dict[str, Any]]:
+        """
+        Return a snapshot of all sessions, oldest first.
+
+        Returns:
+            List of session dictionaries
+        """
+        with self._lock:
+            return list(self._sessions.values())
+
+    def remove(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove a session and pass it to on_evict.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Removed session or None if not found
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            self._last_access.pop(session_id, None)
+        if session is not None and self.on_evict:
+            self.on_evict(session_id, session)
+        return session
+
+    def clear(self) -> None:
+        """Remove all sessions, passing each to on_evict."""
+        for session_id, _ in self.items():
+            self.remove(session_id)
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Estimate memory per session.
+
+        Returns:
+            Dictionary mapping session_id to estimated bytes
+        """
+        return {session_id: estimate_session_memory(session) for session_id, session in self.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return store occupancy and limits.
+
+        Returns:
+            Dictionary with session count, estimated memory, limits and eviction count
+        """
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'memory_bytes': sum(self.get_memory_usage().values()),
+                'max_sessions': self.max_sessions,
+                'max_memory_bytes': self.max_memory_bytes,
+                'idle_ttl': self.idle_ttl,
+                'evictions': self.evictions
+            }
+
+    def idle_seconds(self, session_id: str) -> Optional[float]:
+        """
+        Return how long a session has been unused.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Seconds since last access, or None if not found
+        """
+        with self._lock:
+            last_access = self._last_access.get(session_id)
+            return None if last_access is None else self.clock() - last_access
+
+    def _evict(self, session_id: str) -> Tuple[str, Dict[str, Any]]:
+        """Take a single session out of the store (caller holds the lock)."""
+        self.evictions += 1
+        self._last_access.pop(session_id, None)
+        return session_id, self._sessions.pop(session_id)
+
+    def _close_evicted(self, evicted: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Pass evicted sessions to on_evict (caller must not hold the lock).
+
+        on_evict closes environments and flushes recorders, so it runs after
+        the lock is released to keep that I/O from blocking other threads.
+        """
+        if self.on_evict:
+            for session_id, session in evicted:
+                self.on_evict(session_id, session)
+
+    def _evictable(self, keep: Optional[str] = None) -> List[str]:
+        """Idle session IDs in LRU order, excluding running sessions and keep."""
+        return [
+            session_id for session_id, session in self._sessions.items()
+            if session_id != keep and not session.get('running')
+        ]
+
+    def _evict_expired(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Evict sessions idle for longer than idle_ttl (caller holds the lock).
+
+        Returns:
+            Evicted (session_id, session) pairs, for _close_evicted
+        """
+        if self.idle_ttl is None:
+            return []
+        now = self.clock()
+        return [
+            self._evict(session_id) for session_id in self._evictable()
+            if now - self._last_access[session_id] > self.idle_ttl
+        ]
+
+    def _enforce_limits(self, keep: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Evict LRU idle sessions until count and memory limits hold (caller holds the lock).
+
+        Returns:
+            Evicted (session_id, session) pairs, for _close_evicted
+        """
+        candidates = self._evictable(keep)
+        evicted = []
+
+        if self.max_sessions is not None:
+            while len(self._sessions) > self.max_sessions and candidates:
+                evicted.append(self._evict(candidates.pop(0)))
+
+        if self.max_memory_bytes is not None:
+            usage = self.get_memory_usage()
+            total = sum(usage.values())
+            while total > self.max_memory_bytes and candidates:
+                session_id = candidates.pop(0)
+                total -= usage.get(session_id, 0)
+                evicted.append(self._evict(session_id))
+
+        return evicted
@@ -0,0 +1,408 @@
+import itertools
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from algorithms import AlgorithmFactory
+from environments.environment_manager import EnvironmentManager
+from .event_log import EventLog
+from .executor import TrainingExecutor, QueueFullError
+
+
+# Upper bound on configurations x seeds per sweep
+MAX_SWEEP_RUNS = 1000
+
+# Leaderboard entries attached to every progress event
+LEADERBOARD_SIZE = 5
+
+
+def validate_parameter(name: str, value: Any, spec: Dict[str, Any]) -> Any:
+    """
+    Check a parameter value against its schema entry.
+
+    Args:
+        name: Parameter name
+        value: Proposed value
+        spec: Schema entry (type, min, max, options)
+
+    Returns:
+        Value converted to the schema type
+
+    Raises:
+        ValueError: If the value has the wrong type, is out of range or not an option
+    """
+    if spec['type'] == 'string':
+        if value not in spec.get('options', [value]):
+            raise ValueError(f"Invalid value {value!r} for '{name}'. Options: {spec['options']}")
+        return value
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Parameter '{name}' must be a number, got {value!r}")
+    if spec['type'] == 'int':
+        if value != int(value):
+            raise ValueError(f"Parameter '{name}' must be an integer, got {value!r}")
+        value = int(value)
+    else:
+        value = float(value)
+
+    if 'min' in spec and value < spec['min'] or 'max' in spec and value > spec['max']:
+        raise ValueError(f"Parameter '{name}' must be within [{spec.get('min')}, {spec.get('max')}], got {value}")
+    return value
+
+
+def expand_sweep(
+    schema: Dict[str, Dict[str, Any]],
+    space: Dict[str, Any],
+    mode: str = 'grid',
+    num_samples: Optional[int] = None,
+    base_parameters: Optional[Dict[str, Any]] = None,
+    sample_seed: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Turn a search space into a list of validated parameter configurations.
+
+    In grid mode every parameter maps to a list of values and all
+    combinations are returned. In random mode every parameter maps either to
+    a list (sampled uniformly) or to a {"min", "max"} range (sampled
+    uniformly; bounds default to the schema's), and num_samples
+    configurations are drawn.
+
+    Args:
+        schema: Parameter schema of the algorithm
+        space: Parameter name -> values (list) or range (dict)
+        mode: 'grid' or 'random'
+        num_samples: Number of configurations in random mode
+        base_parameters: Fixed parameters shared by all configurations
+        sample_seed: Seed for random mode
+
+    Returns:
+        List of complete parameter dictionaries
+
+    Raises:
+        ValueError: If the space or base parameters do not match the schema
+                    or the mode is invalid
+    """
+    for name in itertools.chain(base_parameters or {}, space):
+        if name not in schema:
+            raise ValueError(f"Unknown parameter '{name}'. Available parameters: {list(schema)}")
+
+    base = {name: validate_parameter(name, value, schema[name]) for name, value in (base_parameters or {}).items()}
+
+    if mode == 'grid':
+        axes = []
+        for name, values in space.items():
+            if not isinstance(values, list) or not values:
+                raise ValueError(f"Grid values for '{name}' must be a non-empty list")
+            axes.append([validate_parameter(name, value, schema[name]) for value in values])
+        return [dict(base, **dict(zip(space, combination))) for combination in itertools.product(*axes)]
+
+    if mode == 'random':
+        if not num_samples or num_samples < 1:
+            raise ValueError("Random search requires a positive num_samples")
+        rng = np.random.default_rng(sample_seed)
+        configurations = []
+        for _ in range(num_samples):
+            parameters = dict(base)
+            for name, values in space.items():
+                spec = schema[name]
+                if isinstance(values, list):
+                    value = values[rng.integers(len(values))]
+                elif isinstance(values, dict) and spec['type'] in ('float', 'int'):
+                    low = values.get('min', spec.get('min'))
+                    high = values.get('max', spec.get('max'))
+                    if low is None or high is None:
+                        raise ValueError(f"Range for '{name}' needs min and max")
+                    value = rng.uniform(low, high) if spec['type'] == 'float' else int(rng.integers(low, high + 1))
+                else:
+                    raise ValueError(f"Random values for '{name}' must be a list or a min/max range")
+                parameters[name] = validate_parameter(name, value, spec)
+            configurations.append(parameters)
+        return configurations
+
+    raise ValueError(f"Unknown sweep mode '{mode}'. Available modes: ['grid', 'random']")
+
+
+def score_rewards(rewards: np.ndarray, threshold: float = 0.5, window: int = 100) -> Dict[str, Any]:
+    """
+    Summarize a training run's reward curve.
+
+    An episode with reward > 0 counts as a success.
+
+    Args:
+        rewards: Per-episode rewards
+        threshold: Rolling success rate that counts as solved
+        window: Episodes in the rolling window
+
+    Returns:
+        Dictionary with final_success_rate (last window), auc (mean reward
+        over all episodes, i.e. the area under the reward curve per episode)
+        and episodes_to_threshold (episodes until the rolling success rate
+        first reached threshold, None if never)
+    """
+    rewards = np.asarray(rewards, dtype=np.float64)
+    successes = (rewards > 0).astype(np.float64)
+    window = max(1, min(window, len(rewards)))
+
+    rolling = np.convolve(successes, np.ones(window) / window, mode='valid')
+    reached = np.flatnonzero(rolling >= threshold)
+
+    return {
+        'final_success_rate': float(successes[-window:].mean()) if len(rewards) else 0.0,
+        'auc': float(rewards.mean()) if len(rewards) else 0.0,
+        'episodes_to_threshold': int(reached[0] + window) if len(reached) else None
+    }
+
+
+class Sweep:
+    """
+    A hyperparameter sweep fanned out over the training executor.
+
+    Every (configuration, seed) pair is one training job. At most one job
+    per worker is in flight at a time, so a large sweep neither exceeds the
+    executor's queue limit nor starves other users; each finished job
+    submits the next one. Results are appended to an EventLog as they
+    arrive, so progress can be streamed (and replayed) like training.
+    """
+
+    def __init__(
+        self,
+        executor: TrainingExecutor,
+        algorithm_name: str,
+        environment_name: str,
+        configurations: List[Dict[str, Any]],
+        seeds: List[int],
+        num_episodes: int,
+        threshold: float = 0.5,
+        window: int = 100
+    ):
+        """
+        Initialize the sweep (call start() to run it).
+
+        Args:
+            executor: Executor that runs the training jobs
+            algorithm_name: Algorithm to train
+            environment_name: Environment to train on
+            configurations: Parameter dictionaries (from expand_sweep)
+            seeds: Environment seeds; every configuration runs once per seed
+            num_episodes: Training episodes per run
+            threshold: Success rate for episodes_to_threshold
+            window: Rolling window for success rates
+        """
+        self.sweep_id = str(uuid.uuid4())
+        self.executor = executor
+        self.algorithm_name = algorithm_name
+        self.environment_name = environment_name
+        self.configurations = configurations
+        self.seeds = seeds
+        self.num_episodes = num_episodes
+        self.threshold = threshold
+        self.window = window
+
+        self.runs = [
+            {'config_index': index, 'seed': seed, 'status': 'pending', 'metrics': None, 'error': None}
+            for index in range(len(configurations)) for seed in seeds
+        ]
+        self.events = EventLog(capacity=len(self.runs) + 1)
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._next_run = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_request(cls, executor: TrainingExecutor, request: Dict[str, Any]) -> 'Sweep':
+        """
+        Build a sweep from a POST /api/sweep body, validated against the algorithm's schema.
+
+        Args:
+            executor: Executor that runs the training jobs
+            request: Dict with algorithm, environment, space, and optionally
+                     mode, num_samples, parameters, seeds, num_episodes,
+                     threshold, window and sample_seed
+
+        Returns:
+            Sweep (not started)
+
+        Raises:
+            ValueError: If the request is invalid or exceeds MAX_SWEEP_RUNS
+        """
+        algorithm_name = request.get('algorithm')
+        environment_name = request.get('environment')
+        if not algorithm_name:
+            raise ValueError('Algorithm is required')
+        if not environment_name:
+            raise ValueError('Environment is required')
+        if not EnvironmentManager.validate_environment_name(environment_name):
+            raise ValueError(
+                f"Environment '{environment_name}' not supported. "
+                f"Available environments: {EnvironmentManager.SUPPORTED_ENVIRONMENTS} "
+                f"and generated or custom FrozenLake maps"
+            )
+
+        schema = AlgorithmFactory.get_parameter_schema(algorithm_name, environment_name)
+        space = request.get('space')
+        if not isinstance(space, dict) or not space:
+            raise ValueError('space must map parameter names to values')
+
+        configurations = expand_sweep(
+            schema,
+            space,
+            mode=request.get('mode', 'grid'),
+            num_samples=request.get('num_samples'),
+            base_parameters=request.get('parameters'),
+            sample_seed=request.get('sample_seed')
+        )
+
+        seeds = request.get('seeds', 1)
+        if isinstance(seeds, int):
+            seeds = list(range(seeds))
+        if not seeds or not all(isinstance(seed, int) and not isinstance(seed, bool) for seed in seeds):
+            raise ValueError('seeds must be a positive count or a list of integers')
+
+        if len(configurations) * len(seeds) > MAX_SWEEP_RUNS:
+            raise ValueError(
+                f"Sweep has {len(configurations) * len(seeds)} runs; the limit is {MAX_SWEEP_RUNS}"
+            )
+
+        num_episodes = validate_parameter(
+            'num_episodes',
+            request.get('num_episodes', schema['num_episodes']['default']),
+            dict(schema['num_episodes'], min=1)
+        )
+        threshold = float(request.get('threshold', 0.5))
+        window = int(request.get('window', 100))
+        if not 0.0 <= threshold <= 1.0 or window < 1:
+            raise ValueError('threshold must be within [0, 1] and window positive')
+
+        for parameters in configurations:
+            parameters['num_episodes'] = num_episodes
+
+        return cls(executor, algorithm_name, environment_name, configurations, seeds,
+                   num_episodes, threshold, window)
+
+    def start(self) -> None:
+        """Submit the first runs, one per executor worker."""
+        for _ in range(min(self.executor.max_workers, len(self.runs))):
+            self._submit_next()
+
+    def _submit_next(self) -> None:
+        """Submit the next pending run, if any (runs rejected by a full queue fail)."""
+        while True:
+            with self._lock:
+                if self._next_run >= len(self.runs):
+                    return
+                run = self.runs[self._next_run]
+                self._next_run += 1
+
+            spec = {
+                'algorithm_name': self.algorithm_name,
+                'environment_name': self.environment_name,
+                'parameters': self.configurations[run['config_index']],
+                'seed': run['seed'],
+                'num_episodes': self.num_episodes
+            }
+            try:
+                run['status'] = 'running'
+                run['job_id'] = self.executor.submit(spec, lambda job, run=run: self._finish_run(run, job))
+                return
+            except QueueFullError as e:
+                self._record(run, {'result': None, 'error': str(e)})
+
+    def _finish_run(self, run: Dict[str, Any], job: Dict[str, Any]) -> None:
+        """Record a finished (or failed) job and keep the pipeline full."""
+        try:
+            self._record(run, job)
+        finally:
+            self._submit_next()
+
+    def _record(self, run: Dict[str, Any], job: Dict[str, Any]) -> None:
+        """Score a finished run and publish progress."""
+        if job['result'] is not None:
+            run['metrics'] = score_rewards(job['result']['rewards'], self.threshold, self.window)
+            run['status'] = 'completed'
+        else:
+            run['error'] = job.get('error') or 'Run was cancelled'
+            run['status'] = 'failed'
+
+        with self._lock:
+            finished = sum(1 for r in self.runs if r['status'] in ('completed', 'failed'))
+            done = finished == len(self.runs)
+            self.events.append({
+                'status': 'running',
+                'run': {key: run[key] for key in ('config_index', 'seed', 'status', 'metrics', 'error')},
+                'parameters': self.configurations[run['config_index']],
+                'finished': finished,
+                'total': len(self.runs),
+                'leaderboard': self.rank()[:LEADERBOARD_SIZE]
+            })
+            if done:
+                self.finished_at = time.time()
+                self.events.append({'status': 'complete', 'ranking': self.rank()}, sync_point=True)
+                self.events.close()
+
+    def rank(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate completed runs per configuration and rank them.
+
+        Configurations are sorted by mean final success rate, then mean AUC,
+        then fewest episodes to threshold (runs that never reached it count
+        as num_episodes).
+
+        Returns:
+            List of dicts with rank, config_index, parameters, seeds (completed
+            runs) and mean/std of final_success_rate, auc and episodes_to_threshold
+        """
+        table = []
+        for index, parameters in enumerate(self.configurations):
+            metrics = [run['metrics'] for run in self.runs if run['config_index'] == index and run['metrics']]
+            if not metrics:
+                continue
+            success = np.array([m['final_success_rate'] for m in metrics])
+            auc = np.array([m['auc'] for m in metrics])
+            to_threshold = np.array([
+                m['episodes_to_threshold'] if m['episodes_to_threshold'] is not None else self.num_episodes
+                for m in metrics
+            ])
+            table.append({
+                'config_index': index,
+                'parameters': {name: parameters[name] for name in parameters if name != 'num_episodes'},
+                'seeds': len(metrics),
+                'final_success_rate': round(float(success.mean()), 4),
+                'final_success_rate_std': round(float(success.std()), 4),
+                'auc': round(float(auc.mean()), 4),
+                'auc_std': round(float(auc.std()), 4),
+                'episodes_to_threshold': float(to_threshold.mean()),
+                'solved_runs': sum(1 for m in metrics if m['episodes_to_threshold'] is not None)
+            })
+
+        table.sort(key=lambda row: (-row['final_success_rate'], -row['auc'], row['episodes_to_threshold']))
+        for rank, row in enumerate(table, start=1):
+            row['rank'] = rank
+        return table
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Return a JSON-serializable summary with the current ranking.
+
+        Returns:
+            Dict with sweep_id, algorithm, environment, status, run counts,
+            settings and ranking
+        """
+        counts: Dict[str, int] = {}
+        for run in self.runs:
+            counts[run['status']] = counts.get(run['status'], 0) + 1
+        return {
+            'sweep_id': self.sweep_id,
+            'algorithm': self.algorithm_name,
+            'environment': self.environment_name,
+            'status': 'complete' if self.finished_at is not None else 'running',
+            'runs': counts,
+            'total': len(self.runs),
+            'num_episodes': self.num_episodes,
+            'seeds': self.seeds,
+            'threshold': self.threshold,
+            'window': self.window,
+            'ranking': self.rank()
+        }
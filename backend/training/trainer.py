@@ -1,7 +1,19 @@
+import threading
 import uuid
-from typing import Dict, Any, Optional
-from algorithms import AlgorithmFactory
+from collections import OrderedDict
+import numpy as np
+from typing import Dict, Any, Iterator, List, Optional
+from algorithms import AlgorithmFactory, TrainingControl
 from environments.environment_manager import EnvironmentManager
+from monitoring import METRICS
+from .checkpoints import CheckpointStore
+from .convergence import TrainingMetrics
+from .executor import TrainingExecutor
+from .session_store import SessionStore, estimate_session_memory
+from .sweep import Sweep
+from .trajectories import TrajectoryRecorder, TrajectoryStore
+from .evaluation import PolicyEvaluator
+from .playback import iter_rollouts
 
 
 class TrainingCoordinator:
@@ -12,16 +24,76 @@ class TrainingCoordinator:
     in an algorithm-agnostic manner.
     """
 
-    def __init__(self):
-        """Initialize training coordinator with empty session storage."""
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+    # Supported frame rendering modes for training
+    RENDER_MODES = ('eager', 'lazy')
+
+    # Number of hyperparameter sweeps kept for polling
+    MAX_SWEEPS = 20
+
+    # Seconds reset waits for cancelled runs to stop before closing their environments
+    CANCEL_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        checkpoint_dir: Optional[str] = None,
+        executor: Optional[TrainingExecutor] = None,
+        trajectory_dir: Optional[str] = None
+    ):
+        """
+        Initialize training coordinator with empty session storage.
+
+        Args:
+            max_sessions: Maximum number of live sessions (None for unlimited)
+            max_memory_bytes: Memory budget for all sessions (None for unlimited)
+            idle_ttl: Seconds after which an unused session is evicted (None to disable)
+            checkpoint_dir: Directory for session checkpoints (None disables persistence).
+                            Trained sessions are saved there and reloaded on demand,
+                            e.g. after a restart or eviction.
+            executor: Process pool for background training jobs (default: one
+                      worker per CPU, started on first use)
+            trajectory_dir: Directory for recorded training transitions (None
+                            disables recording, see create_session)
+        """
+        self.sessions = SessionStore(
+            max_sessions=max_sessions,
+            max_memory_bytes=max_memory_bytes,
+            idle_ttl=idle_ttl,
+            on_evict=self._close_session
+        )
+        self.checkpoints = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
+        self.trajectories = TrajectoryStore(trajectory_dir) if trajectory_dir else None
+        self._restore_lock = threading.Lock()
+        self.executor = executor or TrainingExecutor()
+        self.sweeps: 'OrderedDict[str, Sweep]' = OrderedDict()
+
+    @staticmethod
+    def _close_session(session_id: str, session: Dict[str, Any]) -> None:
+        """
+        Release a session's resources when it is evicted or removed.
+
+        Args:
+            session_id: Session UUID
+            session: Session dictionary
+        """
+        env = session.get('environment')
+        if env:
+            env.close()
+        recorder = session.get('recorder')
+        if recorder is not None:
+            recorder.flush()
+        METRICS.forget_session(session_id)
 
     def create_session(
         self,
         algorithm_name: str,
         environment_name: str,
         parameters: Dict[str, Any],
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        render: str = 'eager',
+        record: bool = False
     ) -> str:
         """
         Create a new training session.
@@ -31,62 +103,441 @@ class TrainingCoordinator:
             environment_name: Name of the environment
             parameters: Algorithm parameters
             seed: Optional random seed
+            render: 'eager' creates the environment ready to render
+                    (rgb_array), 'lazy' creates it headless and sets up
+                    rendering on the first requested frame; training only
+                    renders the frames its callback asks for either way
+            record: Record every training transition (see get_trajectories);
+                    runs of background jobs are not recorded
 
         Returns:
             Session ID (UUID string)
 
         Raises:
-            ValueError: If algorithm or environment is invalid
+            ValueError: If algorithm, environment or render mode is invalid,
+                        or recording is requested but not available
         """
-        # Create environment
-        env = EnvironmentManager.create_environment(environment_name, seed)
-
-        # Create algorithm instance
-        algorithm = AlgorithmFactory.create_algorithm(algorithm_name, env, parameters)
+        session = self._build_session(algorithm_name, environment_name, parameters, seed, render)
+        if record:
+            if self.trajectories is None:
+                session['environment'].close()
+                raise ValueError("Trajectory recording is disabled")
+            if not session['algorithm'].RECORDS_TRAJECTORIES:
+                session['environment'].close()
+                raise ValueError(f"Algorithm '{algorithm_name}' does not record trajectories")
 
         # Generate session ID
         session_id = str(uuid.uuid4())
+        session['algorithm'].metrics_session = session_id
+        if record:
+            self._attach_recorder(session_id, session)
+
+        # Store session (may evict least recently used idle sessions)
+        self.sessions.add(session_id, session)
+
+        return session_id
+
+    def _build_session(
+        self,
+        algorithm_name: str,
+        environment_name: str,
+        parameters: Dict[str, Any],
+        seed: Optional[int],
+        render: str
+    ) -> Dict[str, Any]:
+        """
+        Create the environment and algorithm of a session.
 
-        # Store session
-        self.sessions[session_id] = {
+        Returns:
+            Session dictionary (not yet registered)
+
+        Raises:
+            ValueError: If algorithm, environment or render mode is invalid
+        """
+        if render not in self.RENDER_MODES:
+            raise ValueError(f"Unknown render mode '{render}'. Available modes: {list(self.RENDER_MODES)}")
+
+        # Create environment (headless unless frames are rendered every episode)
+        render_mode = 'rgb_array' if render == 'eager' else None
+        env = EnvironmentManager.checkout_environment(environment_name, seed, render_mode)
+
+        # Create algorithm instance
+        algorithm = AlgorithmFactory.create_algorithm(algorithm_name, env, parameters)
+
+        return {
             'algorithm': algorithm,
             'environment': env,
             'algorithm_name': algorithm_name,
             'environment_name': environment_name,
             'parameters': parameters,
+            'seed': seed,
+            'render': render,
+            'episodes_trained': 0,
+            'rewards': [],
+            'running': False,
             'trained': False
         }
 
-        return session_id
+    def _attach_recorder(self, session_id: str, session: Dict[str, Any]) -> None:
+        """
+        Open a session's trajectory recording and hand it to the algorithm.
+
+        Args:
+            session_id: Session UUID
+            session: Session dictionary
+        """
+        recorder = self.trajectories.open(session_id)
+        session['recorder'] = recorder
+        session['algorithm'].recorder = recorder
+
+    @staticmethod
+    def continuation_seed(seed: Optional[int], episodes_trained: int) -> Optional[int]:
+        """
+        Seed for an environment that continues a session's training.
+
+        Worker jobs and restored sessions build a new environment, and with it
+        new random streams. Seeding them with the session seed again would
+        replay the exploration of the first episodes; mixing in the number of
+        episodes already trained keeps continued runs reproducible without
+        repeating earlier draws.
+
+        Args:
+            seed: Session seed (None for unseeded sessions)
+            episodes_trained: Episodes the session has already trained
+
+        Returns:
+            The session seed for untrained sessions, a derived seed otherwise
+            (None if the session is unseeded)
+        """
+        if seed is None or episodes_trained == 0:
+            return seed
+        return int(np.random.SeedSequence([seed, episodes_trained]).generate_state(1)[0])
+
+    def _restore_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Reload a session from its checkpoint and register it.
+
+        The Q-table (and other algorithm arrays) are memory-mapped, so this
+        costs one mmap per array rather than a retrain.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Restored session or None if there is no checkpoint
+        """
+        if self.checkpoints is None:
+            return None
+
+        with self._restore_lock:
+            # Another thread may have restored it while we waited
+            session = self.sessions.get(session_id)
+            if session is not None:
+                return session
+
+            checkpoint = self.checkpoints.load(session_id)
+            if checkpoint is None:
+                return None
+
+            meta = checkpoint['meta']
+            session = self._build_session(
+                meta['algorithm_name'],
+                meta['environment_name'],
+                meta['parameters'],
+                self.continuation_seed(meta['seed'], meta['episodes_trained']),
+                meta['render']
+            )
+            session['seed'] = meta['seed']
+            session['algorithm'].load_checkpoint(checkpoint['arrays'])
+            session['algorithm'].metrics_session = session_id
+            session['episodes_trained'] = meta['episodes_trained']
+            session['rewards'] = checkpoint['rewards']
+            session['trained'] = meta['episodes_trained'] > 0
+            if meta.get('record') and self.trajectories is not None:
+                # Continues the recording on disk
+                self._attach_recorder(session_id, session)
+
+            self.sessions.add(session_id, session)
+            return session
+
+    def save_checkpoint(self, session_id: str) -> bool:
+        """
+        Write a session's learned state to the checkpoint directory.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            True if saved, False if persistence is disabled
+
+        Raises:
+            ValueError: If session ID is invalid
+        """
+        if self.checkpoints is None:
+            return False
+
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' not found")
+
+        meta = {
+            'algorithm_name': session['algorithm_name'],
+            'environment_name': session['environment_name'],
+            'parameters': session['parameters'],
+            'seed': session['seed'],
+            'render': session['render'],
+            'episodes_trained': session['episodes_trained'],
+            'record': session.get('recorder') is not None
+        }
+        self.checkpoints.save(session_id, meta, session['algorithm'].get_checkpoint(), session['rewards'])
+        return True
 
     def train(
         self,
         session_id: str,
         num_episodes: int,
-        callback: Optional[callable] = None
-    ) -> None:
+        callback: Optional[callable] = None,
+        control: Optional[TrainingControl] = None,
+        metrics: Optional[TrainingMetrics] = None
+    ) -> int:
         """
         Train the algorithm for a session.
 
+        Training a session that was already trained (or restored from a
+        checkpoint) continues from its current learned state. The run's
+        control is kept in the session while it trains, so pause_training,
+        resume_training and cancel_training can reach it; a cancelled run
+        keeps the episodes it completed. With metrics, every episode updates
+        them before the callback runs, and the run stops (control reason
+        'converged') once their stopping rule is met.
+
         Args:
             session_id: Session UUID
             num_episodes: Number of episodes to train
-            callback: Optional callback function for episode updates
+            callback: Optional callback(episode, reward, learning_data, frame),
+                      called with None for learning_data and frame (training is
+                      always lazy; render_frame() and get_learning_data() give
+                      them on demand)
+            control: Pause/cancellation token (default: a new one)
+            metrics: Optional rolling statistics and stopping rule
+
+        Returns:
+            Number of episodes actually trained
 
         Raises:
             ValueError: If session ID is invalid
         """
-        if session_id not in self.sessions:
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' not found")
+
+        algorithm = session['algorithm']
+        rewards = session['rewards']
+        episodes_before = len(rewards)
+        control = control or TrainingControl()
+        session['control'] = control
+        if metrics is not None:
+            session['metrics'] = metrics
+
+        def record_episode(episode, reward, learning_data, frame):
+            """Keep the reward history and metrics, then forward to the caller's callback."""
+            rewards.append(float(reward))
+            if metrics is not None and metrics.record(
+                reward,
+                algorithm.last_episode_length,
+                algorithm.last_max_q_change,
+                algorithm.last_policy_changes
+            ):
+                control.cancel('converged')
+            if callback:
+                callback(episode, reward, learning_data, frame)
+
+        # Running sessions are never evicted
+        session['running'] = True
+        try:
+            try:
+                # Always lazy: callers decimate episodes, so they render and build
+                # learning data only for the events they actually emit
+                algorithm.train(num_episodes, record_episode, lazy=True, control=control)
+            finally:
+                session['running'] = False
+
+            recorder = session.get('recorder')
+            if recorder is not None:
+                recorder.flush()
+
+            # Mark as trained; continuing training on the same session resumes from here
+            episodes = len(rewards) - episodes_before
+            session['episodes_trained'] += episodes
+            session['trained'] = session['trained'] or episodes > 0
+            self.save_checkpoint(session_id)
+            return episodes
+        finally:
+            # Only now may reset_all_sessions close the environment and clear checkpoints
+            control.finish()
+
+    def _running_control(self, session_id: str) -> TrainingControl:
+        """
+        Return the control of a session's in-thread training run.
+
+        Raises:
+            ValueError: If session ID is invalid or the session is not training
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' not found")
+        control = session.get('control')
+        if not session['running'] or control is None or control.state == 'stopped':
+            raise ValueError(f"Session '{session_id}' is not training")
+        return control
+
+    def pause_training(self, session_id: str) -> str:
+        """
+        Pause a session's training run before its next episode.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Run state (see TrainingControl.state)
+
+        Raises:
+            ValueError: If session ID is invalid or the session is not training
+        """
+        control = self._running_control(session_id)
+        control.pause()
+        return control.state
+
+    def resume_training(self, session_id: str) -> str:
+        """
+        Resume a paused training run.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Run state (see TrainingControl.state)
+
+        Raises:
+            ValueError: If session ID is invalid or the session is not training
+        """
+        control = self._running_control(session_id)
+        control.resume()
+        return control.state
+
+    def cancel_training(self, session_id: str, reason: str = 'cancelled') -> str:
+        """
+        Stop a session's training run before its next episode.
+
+        Args:
+            session_id: Session UUID
+            reason: Reported with the run's final event
+
+        Returns:
+            Run state (see TrainingControl.state)
+
+        Raises:
+            ValueError: If session ID is invalid or the session is not training
+        """
+        control = self._running_control(session_id)
+        control.cancel(reason)
+        return control.state
+
+    def submit_training_job(self, session_id: str, num_episodes: int) -> str:
+        """
+        Train a session in a worker process instead of the calling thread.
+
+        The worker starts from the session's current learned state. When the
+        job finishes, the result is applied back to the session (Q-table,
+        reward history, episode count) and checkpointed, unless the session was
+        reset in the meantime. The session counts as running until then.
+
+        Args:
+            session_id: Session UUID
+            num_episodes: Number of episodes to train
+
+        Returns:
+            Job ID (UUID string)
+
+        Raises:
+            ValueError: If session ID is invalid or the session is already training
+            QueueFullError: If the job queue is full
+        """
+        session = self.get_session(session_id)
+        if session is None:
             raise ValueError(f"Session '{session_id}' not found")
+        if session['running']:
+            raise ValueError(f"Session '{session_id}' is already training")
 
-        session = self.sessions[session_id]
         algorithm = session['algorithm']
+        spec = {
+            'session_id': session_id,
+            'algorithm_name': session['algorithm_name'],
+            'environment_name': session['environment_name'],
+            'parameters': session['parameters'],
+            'seed': self.continuation_seed(session['seed'], session['episodes_trained']),
+            'num_episodes': num_episodes,
+            'arrays': {name: np.array(array) for name, array in algorithm.get_checkpoint().items()}
+        }
 
-        # Train with callback
-        algorithm.train(num_episodes, callback)
+        def apply_result(job):
+            """Copy the worker's learned state back into the session."""
+            try:
+                result = job['result']
+                if result is None:
+                    return
+                algorithm.load_checkpoint(result['arrays'])
+                session['rewards'].extend(result['rewards'].tolist())
+                session['episodes_trained'] += result['episodes']
+                session['trained'] = True
+                job['learning_data'] = algorithm.get_learning_data()
+            finally:
+                session['running'] = False
+            # A session reset or evicted while the job ran is not checkpointed
+            # (that would resurrect it from disk)
+            if self.sessions.get(session_id) is session:
+                self.save_checkpoint(session_id)
+
+        session['running'] = True
+        try:
+            return self.executor.submit(spec, apply_result)
+        except Exception:
+            session['running'] = False
+            raise
+
+    def start_sweep(self, request: Dict[str, Any]) -> Sweep:
+        """
+        Validate and start a hyperparameter sweep on the training executor.
 
-        # Mark as trained
-        session['trained'] = True
+        The most recent MAX_SWEEPS sweeps are kept for polling and streaming.
+
+        Args:
+            request: Sweep request (see Sweep.from_request)
+
+        Returns:
+            Started sweep
+
+        Raises:
+            ValueError: If the request is invalid
+        """
+        sweep = Sweep.from_request(self.executor, request)
+        self.sweeps[sweep.sweep_id] = sweep
+        while len(self.sweeps) > self.MAX_SWEEPS:
+            self.sweeps.popitem(last=False)
+        sweep.start()
+        return sweep
+
+    def get_sweep(self, sweep_id: str) -> Optional[Sweep]:
+        """
+        Look up a sweep.
+
+        Args:
+            sweep_id: Sweep UUID
+
+        Returns:
+            Sweep or None if not found
+        """
+        return self.sweeps.get(sweep_id)
 
     def play_policy(
         self,
@@ -106,20 +557,116 @@ class TrainingCoordinator:
         Raises:
             ValueError: If session ID is invalid or not trained
         """
-        if session_id not in self.sessions:
-            raise ValueError(f"Session '{session_id}' not found")
+        return self._trained_algorithm(session_id).play_policy(callback)
+
+    def iter_policy(self, session_id: str, render: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the learned policy one step at a time.
+
+        Args:
+            session_id: Session UUID
+            render: Render a frame after every step
+
+        Returns:
+            Generator of steps (see BaseAlgorithm.iter_policy)
+
+        Raises:
+            ValueError: If session ID is invalid or not trained
+        """
+        return self._trained_algorithm(session_id).iter_policy(render)
 
-        session = self.sessions[session_id]
+    def iter_rollouts(
+        self,
+        session_id: str,
+        num_rollouts: int,
+        render_episodes: int = 1,
+        seed: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the learned policy for a batch of episodes.
+
+        Args:
+            session_id: Session UUID
+            num_rollouts: Number of episodes
+            render_episodes: Number of randomly chosen episodes to render
+            seed: Seed for choosing the rendered episodes
+
+        Returns:
+            Generator of steps and episode outcomes (see playback.iter_rollouts)
+
+        Raises:
+            ValueError: If session ID is invalid, not trained, or the counts are out of range
+        """
+        return iter_rollouts(self._trained_algorithm(session_id), num_rollouts, render_episodes, seed)
+
+    def _trained_algorithm(self, session_id: str):
+        """
+        Return a session's algorithm for playback.
+
+        Raises:
+            ValueError: If session ID is invalid or not trained
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' not found")
 
         if not session['trained']:
             raise ValueError(f"Session '{session_id}' has not been trained yet")
 
-        algorithm = session['algorithm']
-        return algorithm.play_policy(callback)
+        return session['algorithm']
+
+    def evaluate_policy(
+        self,
+        session_id: str,
+        method: str = 'auto',
+        num_rollouts: int = 1000,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate a session's greedy policy over the whole start distribution.
+
+        Args:
+            session_id: Session UUID
+            method: 'auto', 'exact' or 'monte_carlo' (see PolicyEvaluator)
+            num_rollouts: Number of Monte-Carlo rollouts
+            seed: Seed for Monte-Carlo rollouts
+
+        Returns:
+            Evaluation results
+
+        Raises:
+            ValueError: If session ID is invalid or the evaluation settings are invalid
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session '{session_id}' not found")
+
+        evaluator = PolicyEvaluator(session['algorithm'], session['environment'])
+        return evaluator.evaluate(method, num_rollouts, seed)
+
+    def get_trajectories(self, session_id: str) -> Optional[TrajectoryRecorder]:
+        """
+        Return a session's trajectory recording.
+
+        Recordings outlive their sessions: one whose session was evicted is
+        opened from disk.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            TrajectoryRecorder, or None if the session records nothing
+        """
+        session = self.sessions.get(session_id)
+        if session is not None:
+            return session.get('recorder')
+        if self.trajectories is None or not self.trajectories.exists(session_id):
+            return None
+        return self.trajectories.open(session_id)
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get session data.
+        Get session data, reloading it from its checkpoint if needed.
 
         Args:
             session_id: Session UUID
@@ -127,17 +674,62 @@ class TrainingCoordinator:
         Returns:
             Session dictionary or None if not found
         """
-        return self.sessions.get(session_id)
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self._restore_session(session_id)
+        return session
+
+    def get_sessions_info(self) -> List[Dict[str, Any]]:
+        """
+        Describe all live sessions, least recently used first.
+
+        Returns:
+            List of dicts with session_id, algorithm, environment, trained,
+            episodes_trained, running, state (of the last in-thread run, None
+            before the first one), metrics (TrainingMetrics snapshot of the
+            last streamed run, or None), trajectories (recording stats, None
+            if not recording), idle_seconds, memory_bytes and event_log
+            (stream log stats, None before the first stream)
+        """
+        return [
+            {
+                'session_id': session_id,
+                'algorithm': session['algorithm_name'],
+                'environment': session['environment_name'],
+                'trained': session['trained'],
+                'episodes_trained': session['episodes_trained'],
+                'running': session['running'],
+                'state': session['control'].state if session.get('control') else None,
+                'metrics': session['metrics'].snapshot() if session.get('metrics') else None,
+                'trajectories': session['recorder'].get_stats() if session.get('recorder') else None,
+                'idle_seconds': self.sessions.idle_seconds(session_id),
+                'memory_bytes': estimate_session_memory(session),
+                'event_log': session['event_log'].get_stats() if session.get('event_log') else None
+            }
+            for session_id, session in self.sessions.items()
+        ]
 
     def reset_all_sessions(self) -> None:
-        """Clear all sessions from memory."""
-        # Close all environments
-        for session in self.sessions.values():
-            env = session.get('environment')
-            if env:
-                env.close()
+        """
+        Clear all sessions from memory and disk, closing their environments.
 
+        Running in-thread training runs are cancelled first and given
+        CANCEL_TIMEOUT seconds to stop, so no environment is closed under a
+        training thread.
+        """
+        controls = [
+            session['control'] for _, session in self.sessions.items()
+            if session['running'] and session.get('control') is not None
+        ]
+        for control in controls:
+            control.cancel('reset')
+        for control in controls:
+            control.wait_finished(self.CANCEL_TIMEOUT)
         self.sessions.clear()
+        if self.checkpoints is not None:
+            self.checkpoints.clear()
+        if self.trajectories is not None:
+            self.trajectories.clear()
 
     def session_exists(self, session_id: str) -> bool:
         """
@@ -147,6 +739,8 @@ class TrainingCoordinator:
             session_id: Session UUID
 
         Returns:
-            True if session exists, False otherwise
+            True if session exists (live or checkpointed), False otherwise
         """
-        return session_id in self.sessions
+        if session_id in self.sessions:
+            return True
+        return self.checkpoints is not None and self.checkpoints.exists(session_id)
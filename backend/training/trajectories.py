@@ -0,0 +1,286 @@
+import json
+import os
+import shutil
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# Transitions per chunk file; storage grows one chunk at a time
+CHUNK_SIZE = 1 << 18
+
+# Stored columns and their types (episode and step are derived, see read)
+COLUMNS = (
+    ('state', np.uint16),
+    ('action', np.uint8),
+    ('reward', np.float32),
+    ('next_state', np.uint16),
+    ('terminated', np.bool_)
+)
+
+
+class TrajectoryRecorder:
+    """
+    Append-only, columnar record of a session's training transitions.
+
+    Every transition (state, action, reward, next_state, terminated) goes
+    into one typed column per field, 10 bytes per transition in total, so a
+    million transitions take about 10 MB instead of millions of Python
+    tuples. Columns are stored in chunk files of CHUNK_SIZE transitions
+    ('state.00000.npy', ...) that are created on demand and written through
+    memory maps, so recording costs no RAM beyond the page cache and growing
+    never copies earlier data. Episodes are stored as the offsets of their
+    first transitions; the episode and step of a transition are derived
+    from them when reading.
+
+    Training writes whole episodes (record_episode); readers only see
+    transitions up to the last completed episode. flush() makes the files a
+    consistent snapshot (meta.json, episodes.npy) that a new recorder on the
+    same directory continues from.
+    """
+
+    META_FILE = 'meta.json'
+    EPISODES_FILE = 'episodes.npy'
+
+    def __init__(self, directory: str, chunk_size: int = CHUNK_SIZE):
+        """
+        Open a recording, continuing the one in the directory if there is one.
+
+        Args:
+            directory: Directory of this recording (created if needed)
+            chunk_size: Transitions per chunk file (ignored when continuing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self.length = 0
+        self.episodes = 0
+        self.chunk_size = chunk_size
+        self._episode_starts = np.zeros(1024, dtype=np.int64)
+        self._chunks: List[Dict[str, np.memmap]] = []
+
+        meta_path = os.path.join(directory, self.META_FILE)
+        if os.path.isfile(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            self.length = meta['length']
+            self.chunk_size = meta['chunk_size']
+            starts = np.load(os.path.join(directory, self.EPISODES_FILE))
+            self.episodes = len(starts)
+            self._episode_starts = np.zeros(max(1024, 2 * self.episodes), dtype=np.int64)
+            self._episode_starts[:self.episodes] = starts
+            for index in range(-(-self.length // self.chunk_size)):
+                self._chunks.append(self._open_chunk(index, 'r+'))
+
+    def _chunk_path(self, column: str, index: int) -> str:
+        """Return the file of one column chunk."""
+        return os.path.join(self.directory, f'{column}.{index:05d}.npy')
+
+    def _open_chunk(self, index: int, mode: str) -> Dict[str, np.memmap]:
+        """
+        Memory-map all columns of a chunk.
+
+        Args:
+            index: Chunk index
+            mode: 'w+' creates the files, 'r+' opens existing ones
+
+        Returns:
+            Dictionary mapping column names to memmaps of chunk_size rows
+        """
+        return {
+            column: np.lib.format.open_memmap(
+                self._chunk_path(column, index), mode=mode, dtype=dtype, shape=(self.chunk_size,)
+            ) if mode == 'w+' else np.load(self._chunk_path(column, index), mmap_mode=mode)
+            for column, dtype in COLUMNS
+        }
+
+    def record_episode(
+        self,
+        states: Sequence[int],
+        actions: Sequence[int],
+        rewards: Sequence[float],
+        next_states: Sequence[int],
+        terminated: Sequence[bool]
+    ) -> None:
+        """
+        Append the transitions of one episode.
+
+        Args:
+            states: State before each step
+            actions: Action taken in each step
+            rewards: Reward of each step
+            next_states: State after each step
+            terminated: Whether each step ended the episode in a terminal state
+        """
+        values = dict(zip(
+            (column for column, _ in COLUMNS),
+            (states, actions, rewards, next_states, terminated)
+        ))
+        count = len(states)
+        written = 0
+        while written < count:
+            position = self.length + written
+            index, offset = divmod(position, self.chunk_size)
+            if index == len(self._chunks):
+                self._chunks.append(self._open_chunk(index, 'w+'))
+            take = min(self.chunk_size - offset, count - written)
+            for column, array in self._chunks[index].items():
+                array[offset:offset + take] = values[column][written:written + take]
+            written += take
+
+        if self.episodes == len(self._episode_starts):
+            self._episode_starts = np.concatenate([self._episode_starts, np.zeros_like(self._episode_starts)])
+        self._episode_starts[self.episodes] = self.length
+        # Published last, so readers never see a partially written episode
+        self.episodes += 1
+        self.length += count
+
+    def read(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Return a range of transitions.
+
+        Args:
+            start: Index of the first transition
+            stop: Index after the last transition (clipped to the recorded length)
+
+        Returns:
+            Dictionary of arrays: episode, step and the stored columns
+        """
+        length = self.length
+        start, stop = max(0, min(start, length)), max(0, min(stop, length))
+        parts: Dict[str, List[np.ndarray]] = {column: [] for column, _ in COLUMNS}
+        position = start
+        while position < stop:
+            index, offset = divmod(position, self.chunk_size)
+            take = min(self.chunk_size - offset, stop - position)
+            for column, array in self._chunks[index].items():
+                parts[column].append(array[offset:offset + take])
+            position += take
+
+        indices = np.arange(start, stop)
+        starts = self._episode_starts[:self.episodes]
+        episodes = np.searchsorted(starts, indices, side='right') - 1
+        result = {
+            'episode': episodes,
+            'step': indices - starts[episodes] if len(indices) else indices
+        }
+        for column, dtype in COLUMNS:
+            result[column] = np.concatenate(parts[column]) if parts[column] else np.zeros(0, dtype=dtype)
+        return result
+
+    def episode_range(self, episode: int) -> Optional[range]:
+        """
+        Return the transition indices of a recorded episode.
+
+        Args:
+            episode: Index among the recorded episodes
+
+        Returns:
+            Range of transition indices, or None if the episode is not recorded
+        """
+        if not 0 <= episode < self.episodes:
+            return None
+        end = self._episode_starts[episode + 1] if episode + 1 < self.episodes else self.length
+        return range(int(self._episode_starts[episode]), int(end))
+
+    def flush(self) -> None:
+        """Write all recorded data and the episode index to disk."""
+        for chunk in self._chunks[-1:]:
+            for array in chunk.values():
+                array.flush()
+        np.save(os.path.join(self.directory, self.EPISODES_FILE), self._episode_starts[:self.episodes])
+        meta_path = os.path.join(self.directory, self.META_FILE)
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump({'length': self.length, 'chunk_size': self.chunk_size, 'columns': [c for c, _ in COLUMNS]}, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def nbytes(self) -> int:
+        """Return the bytes used by the recorded transitions and episode offsets."""
+        per_transition = sum(np.dtype(dtype).itemsize for _, dtype in COLUMNS)
+        return self.length * per_transition + self.episodes * self._episode_starts.itemsize
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the recording size.
+
+        Returns:
+            Dictionary with transitions, episodes, chunks and bytes
+        """
+        return {
+            'transitions': self.length,
+            'episodes': self.episodes,
+            'chunks': len(self._chunks),
+            'bytes': self.nbytes()
+        }
+
+
+class TrajectoryStore:
+    """
+    Directory of per-session trajectory recordings.
+
+    Recordings stay on disk after their session is evicted (and are continued
+    when a checkpointed session is restored) until they are deleted.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Root directory for recordings
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _session_dir(self, session_id: str) -> str:
+        """
+        Return the recording directory of a session.
+
+        Raises:
+            ValueError: If the session ID could escape the store directory
+        """
+        if not session_id or os.path.basename(session_id) != session_id or session_id in ('.', '..'):
+            raise ValueError(f"Invalid session ID '{session_id}'")
+        return os.path.join(self.directory, session_id)
+
+    def exists(self, session_id: str) -> bool:
+        """
+        Check whether a flushed recording exists for a session.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            True if the session has a recording on disk
+        """
+        try:
+            return os.path.isfile(os.path.join(self._session_dir(session_id), TrajectoryRecorder.META_FILE))
+        except ValueError:
+            return False
+
+    def open(self, session_id: str) -> TrajectoryRecorder:
+        """
+        Open (or start) a session's recording.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            TrajectoryRecorder continuing any existing recording
+        """
+        return TrajectoryRecorder(self._session_dir(session_id))
+
+    def delete(self, session_id: str) -> None:
+        """
+        Remove a session's recording, if any.
+
+        Args:
+            session_id: Session UUID
+        """
+        shutil.rmtree(self._session_dir(session_id), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all recordings."""
+        for name in os.listdir(self.directory):
+            if not name.startswith('.'):
+                self.delete(name)
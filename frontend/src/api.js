@@ -45,11 +45,41 @@ export const startTraining = async (config) => {
   return response.data;
 };
 
+/**
+ * Rebuild learning data from a snapshot or a sparse delta event.
+ * Returns null when the delta cannot be applied (no snapshot yet or a sequence gap).
+ * Events the server merged for a slow connection carry the number of events they replace.
+ */
+const applyLearningUpdate = (current, lastSeq, data) => {
+  if (data.snapshot) {
+    return data.learning_data;
+  }
+  if (!current || data.seq !== lastSeq + (data.merged || 1)) {
+    return null;
+  }
+  const qTable = current.q_table.map(row => row.slice());
+  data.learning_delta.q_updates.forEach(([state, action, value]) => {
+    qTable[state][action] = value;
+  });
+  return { ...current, q_table: qTable };
+};
+
+// Full Q-table snapshot every N training events, only changed cells in between
+const SNAPSHOT_INTERVAL = 100;
+
 /**
  * Subscribe to training updates via SSE
+ *
+ * Delta events are applied to the last snapshot here, so onUpdate always
+ * receives complete learning_data.
  */
 export const subscribeToTraining = (sessionId, onUpdate, onComplete, onError) => {
-  const eventSource = new EventSource(`${API_BASE_URL}/train/stream/${sessionId}`);
+  const eventSource = new EventSource(
+    `${API_BASE_URL}/train/stream/${sessionId}?snapshot_interval=${SNAPSHOT_INTERVAL}`
+  );
+  let learningData = null;
+  let lastSeq = 0;
+  let resyncPending = false;
 
   eventSource.onmessage = (event) => {
     try {
@@ -57,9 +87,23 @@ export const subscribeToTraining = (sessionId, onUpdate, onComplete, onError) =>
 
       if (data.status === 'training') {
         // Training update
-        onUpdate(data);
-      } else if (data.status === 'complete') {
-        // Training complete
+        const updated = applyLearningUpdate(learningData, lastSeq, data);
+        lastSeq = data.seq;
+
+        if (updated === null) {
+          // Missed an event: keep the last complete Q-table and ask for a snapshot
+          if (!resyncPending) {
+            resyncPending = true;
+            axios.post(`${API_BASE_URL}/train/${sessionId}/resync`).catch(() => {});
+          }
+        } else {
+          learningData = updated;
+          resyncPending = resyncPending && !data.snapshot;
+        }
+
+        onUpdate({ ...data, learning_data: learningData });
+      } else if (data.status === 'complete' || data.status === 'cancelled') {
+        // Training complete (or stopped early, with what was learned so far)
         onComplete(data);
         eventSource.close();
       } else if (data.status === 'error') {
@@ -114,6 +158,14 @@ export const subscribeToPlayback = (sessionId, onFrames, onError) => {
   return eventSource;
 };
 
+/**
+ * Pause, resume or cancel a running training session
+ */
+export const controlTraining = async (sessionId, action) => {
+  const response = await axios.post(`${API_BASE_URL}/train/${sessionId}/${action}`);
+  return response.data;
+};
+
 /**
  * Reset all training sessions
  */